@@ -23,9 +23,12 @@ RESULTS_DIR = ROOT_DIR / 'results'
 DEFAULT_OIL_TYPES_FILE = DATA_DIR / 'oil_types.json'
 DEFAULT_SAMPLE_DATA_FILE = DATA_DIR / 'sample_spills.csv'
 
-# Create directories if they don't exist
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(RESULTS_DIR, exist_ok=True)
+
+def ensure_results_dir():
+    """Create the results directory if needed and return its path."""
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    return RESULTS_DIR
+
 
 # Dispersal Model Settings
 # -----------------------
@@ -98,6 +101,15 @@ CLEANUP_METHODS = [
     'none'               # No cleanup performed
 ]
 
+# Set views of the lists above for O(1) membership checks
+LOCATION_TYPES_SET = frozenset(LOCATION_TYPES)
+CLEANUP_METHODS_SET = frozenset(CLEANUP_METHODS)
+
+# Location types with tourism, fishery and shipping losses
+TOURISM_LOCATIONS = frozenset({'coastal', 'reef', 'estuary'})
+FISHERY_LOCATIONS = frozenset({'coastal', 'estuary', 'river', 'reef'})
+SHIPPING_LOCATIONS = frozenset({'port', 'river'})
+
 # Impact Assessment Settings
 # -------------------------
 # Base cleanup cost per barrel (USD)
@@ -13,15 +13,17 @@ import argparse
 import json
 from pathlib import Path
 
-from models.dispersal_model import OilDispersalModel
-from models.impact_estimator import ImpactEstimator
-from utils.geo_utils import validate_coordinates
-from utils.visualization import create_map, display_map
-from utils.data_handler import load_oil_types
+# The model and utility modules pull in numpy, numba, shapely and folium.
+# They are imported inside the functions below, after argument parsing,
+# so that `--help` and argument errors return without loading them.
 
 
-def parse_arguments():
-    """Parse command line arguments."""
+def parse_arguments(oil_types=None):
+    """
+    Parse command line arguments.
+    
+    If oil_types is given, --oil-type is restricted to its keys.
+    """
     parser = argparse.ArgumentParser(
         description="Estimate environmental impact of an oil spill."
     )
@@ -51,7 +53,9 @@ def parse_arguments():
         "--oil-type", 
         type=str, 
         required=True,
-        help="Type of oil spilled (e.g., 'crude', 'diesel', 'heavy_fuel')"
+        # A keys view keeps file order for --help and hashes membership checks
+        choices=oil_types.keys() if oil_types else None,
+        help="Type of oil spilled (e.g., 'crude_light', 'diesel', 'bunker_c')"
     )
     
     parser.add_argument(
@@ -61,6 +65,12 @@ def parse_arguments():
         help="Filename for the output map (default: spill_map.html)"
     )
     
+    parser.add_argument(
+        "--no-map",
+        action="store_true",
+        help="Only print the numeric results; skip the spill polygon and map"
+    )
+    
     parser.add_argument(
         "--show-map", 
         action="store_true",
@@ -72,6 +82,8 @@ def parse_arguments():
 
 def validate_inputs(args, oil_types):
     """Validate user inputs."""
+    from utils.geo_utils import validate_coordinates
+    
     errors = []
     
     # Validate volume
@@ -82,23 +94,32 @@ def validate_inputs(args, oil_types):
     if not validate_coordinates(args.lat, args.lon):
         errors.append(f"Invalid coordinates: {args.lat}, {args.lon}")
     
-    # Validate oil type
-    if args.oil_type not in oil_types:
-        errors.append(f"Unknown oil type: '{args.oil_type}'. Available types: {list(oil_types.keys())}")
+    # The oil type is checked by argparse (choices=) in parse_arguments
     
     return errors
 
 
 def main():
     """Main application entry point."""
-    # Parse command line arguments
-    args = parse_arguments()
+    # Parse once without the oil types: --help and argument errors exit
+    # here, before loading the oil types imports numpy
+    parse_arguments()
+    
+    from utils.data_handler import load_oil_types
     
-    # Load oil types data
+    # Load oil types data so argparse can validate --oil-type
     try:
         oil_types = load_oil_types()
+        load_error = None
     except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Error loading oil types data: {e}")
+        oil_types = None
+        load_error = e
+    
+    # Parse command line arguments, with --oil-type checked against the oil types
+    args = parse_arguments(oil_types)
+    
+    if load_error is not None:
+        print(f"Error loading oil types data: {load_error}")
         return 1
     
     # Validate inputs
@@ -109,6 +130,9 @@ def main():
             print(f"- {error}")
         return 1
     
+    from models.dispersal_model import OilDispersalModel
+    from models.impact_estimator import ImpactEstimator
+    
     # Initialize models
     oil_properties = oil_types[args.oil_type]
     dispersal_model = OilDispersalModel(
@@ -124,8 +148,10 @@ def main():
     try:
         print(f"\nSimulating oil spill of {args.volume} barrels of {args.oil_type} oil at ({args.lat}, {args.lon})...\n")
         
-        # Simulate dispersal
-        affected_area = dispersal_model.calculate_affected_area(lat=args.lat, lon=args.lon)
+        # Simulate dispersal; the spill polygon is only needed for the map
+        affected_area = dispersal_model.calculate_affected_area(
+            lat=args.lat, lon=args.lon, simulate=not args.no_map
+        )
         
         # Calculate environmental impacts
         surface_area = impact_estimator.calculate_surface_area()
@@ -138,6 +164,11 @@ def main():
         print(f"Estimated CO2 equivalent emissions: {co2_emissions:.2f} metric tons")
         print(f"Estimated cleanup time: {cleanup_time:.1f} days")
         
+        if args.no_map:
+            return 0
+        
+        from utils.visualization import create_map, display_map
+        
         # Create map visualization
         map_path = create_map(
             latitude=args.lat,
@@ -5,7 +5,12 @@ This package contains the core models used for simulating oil spill
 dispersal and estimating environmental impacts.
 """
 
-from .dispersal_model import OilDispersalModel
+from .dispersal_model import AffectedArea, OilDispersalModel, VolumeFractions
 from .impact_estimator import ImpactEstimator
+from .oil_types import OilProperties
+from .impact_batch import compute_impacts
 
-__all__ = ['OilDispersalModel', 'ImpactEstimator']
\ No newline at end of file
+__all__ = [
+    'AffectedArea', 'OilDispersalModel', 'VolumeFractions',
+    'ImpactEstimator', 'OilProperties', 'compute_impacts'
+]
\ No newline at end of file
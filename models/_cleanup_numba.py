@@ -0,0 +1,176 @@
+"""
+Cleanup Time Kernel
+-------------------
+Deterministic core of the cleanup time estimate: the product of the
+volume, oil, weather, area and sensitivity factors, JIT-compiled with
+Numba when it is installed and run as ordinary Python otherwise. Also
+holds the CO2 emission terms, so both estimates can run in one call.
+"""
+
+import numpy as np
+
+from ._fay_kernel import njit, prange
+
+
+# Share of the oil's CO2 emission factor released by the evaporated,
+# dissolved and surface fractions: evaporated hydrocarbons eventually
+# oxidize to CO2, some dissolved carbon stays in the water, and surface
+# oil depends on cleanup and natural degradation (simplified)
+_CO2_WEIGHTS = np.array([1.0, 0.5, 0.8])
+
+# Emissions from cleanup operations, based on the energy used per barrel
+# of surface oil (metric tons CO2 per barrel)
+_CLEANUP_CO2_PER_BARREL = 0.1
+
+# Clamp bounds of the cleanup factors, in the order viscosity, persistence,
+# difficulty, wave, wind, temperature, area and sensitivity; the difficulty
+# factor is not clamped
+_CLEANUP_FACTOR_LO = np.array([0.5, 1.0, -np.inf, 0.8, 0.8, 0.8, 1.0, 0.8])
+_CLEANUP_FACTOR_HI = np.array([3.0, 2.0, np.inf, 2.0, 1.5, 1.5, 3.0, 2.0])
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _cleanup_time_core(volume_barrels, viscosity, persistence, difficulty,
+                       wave_height, wind_speed, water_temp, area, sensitivity):
+    """
+    Cleanup time in days before natural variation and the 1-day floor.
+
+    Args:
+        volume_barrels (float): Volume of oil spilled in barrels
+        viscosity (float): Oil viscosity in cP
+        persistence (float): Oil persistence factor
+        difficulty (float): Oil cleanup difficulty rating (1-5)
+        wave_height (float): Wave height in meters
+        wind_speed (float): Wind speed in km/h
+        water_temp (float): Water temperature in °C
+        area (float): Affected surface area in square kilometers
+        sensitivity (float): Environmental sensitivity factor
+
+    Returns:
+        float: Estimated cleanup time in days
+    """
+    # Base time per volume (days per 1000 barrels)
+    base_time_per_volume = 1.5
+
+    # Calculate basic cleanup time based on volume
+    basic_time = base_time_per_volume * (volume_barrels / 1000)
+
+    # Adjust for oil properties
+    # Higher viscosity means longer cleanup
+    viscosity_factor = min(3.0, max(0.5, (viscosity / 100.0) * 1.5))
+
+    # Higher persistence means longer cleanup
+    persistence_factor = min(2.0, max(1.0, persistence * 2.0))
+
+    # Specific cleanup difficulty rating
+    difficulty_factor = difficulty / 3.0
+
+    # Weather factors
+    # High waves make cleanup more difficult
+    wave_factor = min(2.0, max(0.8, 0.8 + wave_height * 0.4))
+
+    # High winds make cleanup more difficult
+    wind_factor = min(1.5, max(0.8, 0.8 + (wind_speed / 20.0) * 0.5))
+
+    # Cold temperatures increase cleanup time
+    temp_factor = min(1.5, max(0.8, 1.5 - (water_temp / 30.0) * 0.5))
+
+    # Area factor - larger areas take longer to clean but with diminishing returns
+    area_factor = min(3.0, max(1.0, 0.5 + (area / 100.0) * 0.5))
+
+    # Environmental sensitivity factor
+    sensitivity_factor = min(2.0, max(0.8, sensitivity))
+
+    # Final cleanup time calculation with all factors
+    return (
+        basic_time *
+        viscosity_factor *
+        persistence_factor *
+        difficulty_factor *
+        wave_factor *
+        wind_factor *
+        temp_factor *
+        area_factor *
+        sensitivity_factor
+    )
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _combined_impact_kernel(volume_barrels, evaporated, dissolved, surface, emission_factor,
+                            viscosity, persistence, difficulty, wave_height, wind_speed,
+                            water_temp, area, sensitivity):
+    """
+    CO2 emissions and cleanup time of one spill in a single call.
+
+    Args:
+        evaporated, dissolved, surface (float): Fractions of oil in each state
+        emission_factor (float): Oil CO2 emission factor (tons CO2 per barrel)
+        Other arguments as for ``_cleanup_time_core``
+
+    Returns:
+        tuple: (co2_emissions_tons, cleanup_time_days), the cleanup time
+               before natural variation and the 1-day floor
+    """
+    # Direct emissions from the oil in each state plus cleanup operations
+    direct_emissions = volume_barrels * emission_factor * (
+        evaporated * _CO2_WEIGHTS[0] +
+        dissolved * _CO2_WEIGHTS[1] +
+        surface * _CO2_WEIGHTS[2]
+    )
+    cleanup_emissions = volume_barrels * surface * _CLEANUP_CO2_PER_BARREL
+
+    cleanup_time = _cleanup_time_core(
+        volume_barrels, viscosity, persistence, difficulty,
+        wave_height, wind_speed, water_temp, area, sensitivity
+    )
+
+    return direct_emissions + cleanup_emissions, cleanup_time
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _cleanup_time_batch(volumes_barrels, viscosities, persistences, difficulties,
+                        wave_heights, wind_speeds, water_temps, areas, sensitivities):
+    """
+    Evaluate ``_cleanup_time_core`` over 1-D arrays in parallel.
+
+    Returns:
+        numpy.ndarray: Cleanup times in days
+    """
+    n = volumes_barrels.shape[0]
+    out = np.empty(n)
+
+    for i in prange(n):
+        out[i] = _cleanup_time_core(
+            volumes_barrels[i], viscosities[i], persistences[i], difficulties[i],
+            wave_heights[i], wind_speeds[i], water_temps[i], areas[i], sensitivities[i]
+        )
+
+    return out
+
+
+def _cleanup_time_clip(volumes_barrels, viscosities, persistences, difficulties,
+                       wave_heights, wind_speeds, water_temps, areas, sensitivities):
+    """
+    Evaluate ``_cleanup_time_core`` over equally shaped arrays with NumPy.
+
+    Used when Numba is not installed: all factors are stacked into one
+    array and clamped with a single ``np.clip`` call instead of a Python
+    loop over the spills.
+
+    Returns:
+        numpy.ndarray: Cleanup times in days
+    """
+    factors = np.stack([
+        (viscosities / 100.0) * 1.5,
+        persistences * 2.0,
+        difficulties / 3.0,
+        0.8 + wave_heights * 0.4,
+        0.8 + (wind_speeds / 20.0) * 0.5,
+        1.5 - (water_temps / 30.0) * 0.5,
+        0.5 + (areas / 100.0) * 0.5,
+        sensitivities,
+    ])
+    bounds = (slice(None),) + (None,) * (factors.ndim - 1)
+    np.clip(factors, _CLEANUP_FACTOR_LO[bounds], _CLEANUP_FACTOR_HI[bounds], out=factors)
+
+    return 1.5 * (volumes_barrels / 1000) * factors.prod(axis=0)
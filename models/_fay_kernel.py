@@ -0,0 +1,240 @@
+"""
+Fay Spreading Kernel
+--------------------
+Numeric core of the oil dispersal model: evaporation, dissolution and
+Fay spreading as plain scalar functions, JIT-compiled with Numba when it
+is installed and run as ordinary Python otherwise.
+"""
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Evaporation curve 1 - exp(-k * t) with k = 0.05 per hour, tabulated on
+# whole hours over the first week; simulation times usually fall on a
+# small grid (6, 12, 24, 48, 72 h) so the table lookup replaces exp()
+_EVAP_T_MAX = 168
+_EVAP_T_GRID = np.arange(_EVAP_T_MAX + 1, dtype=np.float64)
+_EVAP_CURVE = 1.0 - np.exp(-0.05 * _EVAP_T_GRID)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _evaporation_curve(time_hours):
+    """
+    Evaluate 1 - exp(-0.05 * t), linearly interpolating the table within it.
+    """
+    if 0.0 <= time_hours < _EVAP_T_MAX:
+        i = int(time_hours)
+        frac = time_hours - i
+        return _EVAP_CURVE[i] + frac * (_EVAP_CURVE[i + 1] - _EVAP_CURVE[i])
+    return 1.0 - math.exp(-0.05 * time_hours)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _fay_coefficients(density, viscosity, surface_tension, evap_rate, solubility,
+                      water_temp, wind_speed, wave_height):
+    """
+    Compute the time-invariant terms of the dispersal model.
+
+    Args:
+        density (float): Oil density in g/cm³
+        viscosity (float): Oil viscosity in cP
+        surface_tension (float): Oil surface tension in mN/m
+        evap_rate (float): Oil evaporation rate
+        solubility (float): Oil solubility
+        water_temp (float): Water temperature in °C
+        wind_speed (float): Wind speed in km/h
+        wave_height (float): Wave height in meters
+
+    Returns:
+        tuple: (max_evap, diss_coeff, fay_coeff)
+    """
+    # Maximum evaporation is based on the oil's composition
+    max_evap = min(0.9, evap_rate * 2.5)
+
+    # Dissolution coefficient: solubility scaled by temperature and wave action
+    diss_coeff = (
+        solubility *
+        (1.0 + (water_temp - 15.0) * 0.02) *
+        (1.0 + (wave_height - 0.5) * 0.5)
+    )
+
+    # Time-invariant part of Fay's equation
+    # A = k * V^(3/4) * t^(1/4) * (g * Δρ/ρ)^(1/8) / (ν^(1/4) * σ^(1/2))
+    k = 1.45  # Empirical constant
+    g = 9.81  # Gravitational acceleration (m/s²)
+    relative_density_diff = (1.03 - density) / 1.03  # Seawater density ≈ 1.03 g/cm³
+
+    # Wind and wave effects - this is a simplification of complex processes
+    wind_factor = 1.0 + (wind_speed / 20.0) * 0.5
+    wave_factor = 1.0 + (wave_height / 1.0) * 0.3
+
+    fay_coeff = (
+        k *
+        (g * abs(relative_density_diff)) ** 0.125 /
+        ((viscosity * 0.001) ** 0.25 * (surface_tension * 0.001) ** 0.5) *
+        wind_factor *
+        wave_factor
+    )
+
+    return max_evap, diss_coeff, fay_coeff
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _evaporated_fraction(max_evap, time_hours):
+    """
+    Fraction of oil evaporated after time_hours.
+
+    E(t) = Emax * (1 - exp(-k * t)) with k = 0.05 per hour.
+    """
+    evaporated = max_evap * _evaporation_curve(time_hours)
+
+    # 1 - exp(-k * t) is non-negative, so only the upper bound can bind
+    return max_evap if evaporated > max_evap else evaporated
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _dissolved_fraction(diss_coeff, time_hours):
+    """
+    Fraction of oil dissolved after time_hours.
+
+    Dissolution is time-dependent but saturates after 48 hours.
+    """
+    dissolved = diss_coeff * min(1.0, time_hours / 48.0)
+
+    # Dissolution rarely exceeds 20%
+    return min(max(0.0, dissolved), 0.2)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _fay_spread(volume_m3, time_hours, max_evap, diss_coeff, fay_coeff):
+    """
+    Evaluate the time-dependent part of the model from precomputed terms.
+
+    Args:
+        volume_m3 (float): Volume of oil spilled in cubic meters
+        time_hours (float): Time since spill in hours
+        max_evap (float): Maximum evaporable fraction
+        diss_coeff (float): Dissolution coefficient
+        fay_coeff (float): Time-invariant Fay coefficient
+
+    Returns:
+        tuple: (area_km2, thickness_mm, evaporated, dissolved)
+    """
+    evaporated = _evaporated_fraction(max_evap, time_hours)
+    dissolved = _dissolved_fraction(diss_coeff, time_hours)
+
+    remaining_volume = volume_m3 * (1.0 - evaporated - dissolved)
+    area_m2 = fay_coeff * remaining_volume ** 0.75 * (time_hours * 3600.0) ** 0.25
+
+    return area_m2 / 1_000_000, (remaining_volume / area_m2) * 1000, evaporated, dissolved
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _fay_kernel(volume_m3, density, viscosity, surface_tension, evap_rate, solubility,
+                time_hours, wind_speed, water_temp, wave_height):
+    """
+    Run the full numeric model for one spill.
+
+    Returns:
+        tuple: (area_km2, thickness_mm, evaporated, dissolved)
+    """
+    max_evap, diss_coeff, fay_coeff = _fay_coefficients(
+        density, viscosity, surface_tension, evap_rate, solubility,
+        water_temp, wind_speed, wave_height
+    )
+    return _fay_spread(volume_m3, time_hours, max_evap, diss_coeff, fay_coeff)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _fay_kernel_batch(volumes_m3, densities, viscosities, surface_tensions, evap_rates,
+                      solubilities, times, winds, temps, waves):
+    """
+    Run the full numeric model over 1-D arrays of spills in parallel.
+
+    Returns:
+        tuple: Arrays (area_km2, thickness_mm, evaporated, dissolved)
+    """
+    n = volumes_m3.shape[0]
+    dtype = volumes_m3.dtype
+    area_km2 = np.empty(n, dtype)
+    thickness = np.empty(n, dtype)
+    evaporated = np.empty(n, dtype)
+    dissolved = np.empty(n, dtype)
+
+    for i in prange(n):
+        area_km2[i], thickness[i], evaporated[i], dissolved[i] = _fay_kernel(
+            volumes_m3[i], densities[i], viscosities[i], surface_tensions[i],
+            evap_rates[i], solubilities[i], times[i], winds[i], temps[i], waves[i]
+        )
+
+    return area_km2, thickness, evaporated, dissolved
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _fay_kernel_rows(spills):
+    """
+    Run the full numeric model over the rows of a (N, 10) array.
+
+    Columns follow the argument order of ``_fay_kernel``. Runs serially
+    without holding the GIL, so threads can process chunks concurrently.
+
+    Returns:
+        numpy.ndarray: (N, 4) array of (area_km2, thickness_mm, evaporated, dissolved)
+    """
+    n = spills.shape[0]
+    out = np.empty((n, 4))
+
+    for i in range(n):
+        s = spills[i]
+        out[i, 0], out[i, 1], out[i, 2], out[i, 3] = _fay_kernel(
+            s[0], s[1], s[2], s[3], s[4], s[5], s[6], s[7], s[8], s[9]
+        )
+
+    return out
+
+
+def run_batch(spills, max_workers=None):
+    """
+    Run the full numeric model for many spills on a thread pool.
+
+    The spills are split into one contiguous chunk per worker and each
+    chunk runs in the GIL-free compiled kernel, so throughput scales with
+    cores when Numba is installed. Without Numba the kernel runs as
+    Python and the threads serialize on the GIL.
+
+    Args:
+        spills (array_like): (N, 10) spills, each in ``_fay_kernel``
+            argument order (volume_m3, density, viscosity, surface_tension,
+            evap_rate, solubility, time_hours, wind_speed, water_temp,
+            wave_height)
+        max_workers (int): Number of threads (default: CPU count)
+
+    Returns:
+        numpy.ndarray: (N, 4) array of (area_km2, thickness_mm, evaporated, dissolved)
+    """
+    spills = np.ascontiguousarray(spills, dtype=np.float64).reshape(-1, 10)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(spills)))
+
+    if workers == 1:
+        return _fay_kernel_rows(spills)
+
+    chunks = np.array_split(spills, workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return np.concatenate(list(executor.map(_fay_kernel_rows, chunks)))
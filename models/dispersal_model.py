@@ -5,11 +5,168 @@ This module simulates the dispersal of oil in a marine environment
 based on spill parameters and environmental conditions.
 """
 
+import functools
 import math
 import numpy as np
-from datetime import datetime, timedelta
-from shapely.geometry import Point
-from shapely.geometry.polygon import Polygon
+from dataclasses import dataclass
+
+from .oil_types import OilProperties
+from ._fay_kernel import (
+    NUMBA_AVAILABLE,
+    _fay_coefficients,
+    _fay_spread,
+    _evaporated_fraction,
+    _dissolved_fraction,
+    _EVAP_T_MAX,
+    _EVAP_T_GRID,
+    _EVAP_CURVE,
+    _fay_kernel_batch
+)
+
+
+# Shape-noise lookup table for the spill polygon. The noise is purely
+# cosmetic, so a fixed table read at a per-instance offset stands in for
+# drawing fresh random numbers on every simulation.
+_DEFORM_LUT_SIZE = 4096
+_DEFORM_LUT = np.random.default_rng(0xFA12).random(_DEFORM_LUT_SIZE).astype(np.float32)
+
+# Perimeter angles of the spill polygon and their trigonometry
+_N_POLY = 36  # Number of points around the perimeter
+_POLY_ANGLES = np.linspace(0, 2 * np.pi, _N_POLY, endpoint=False)
+_POLY_SIN = np.sin(_POLY_ANGLES)
+_POLY_COS = np.cos(_POLY_ANGLES)
+_POLY_IDX = np.arange(_N_POLY)
+
+# Wind stretch per perimeter angle for 16 wind directions (22.5° apart):
+# cos of the wrapped angle between each perimeter point and the wind
+_N_WIND_DIRECTIONS = 16
+_WIND_DIRECTIONS = np.linspace(0, 2 * np.pi, _N_WIND_DIRECTIONS, endpoint=False)
+_WIND_STRETCH = np.cos(np.abs(
+    ((_POLY_ANGLES[None, :] - _WIND_DIRECTIONS[:, None] + np.pi) % (2 * np.pi)) - np.pi
+))
+
+
+@functools.lru_cache(maxsize=4096)
+def _inv_cos_deg(lat_q):
+    """
+    Degrees of longitude per km at latitude lat_q / 100.
+    
+    Keyed on the latitude in hundredths of a degree, so gridded studies
+    of nearby spills share entries; within 0.01° the value barely changes.
+    """
+    return 1.0 / (111.0 * math.cos(math.radians(lat_q / 100.0)))
+
+
+class _Record:
+    """
+    Dict-style read access for the slotted result records below.
+    
+    Item access (``area['area_km2']``, ``get``, ``in``) is kept for callers
+    written against the former dicts; ``to_dict`` gives a plain dict, e.g.
+    for JSON output.
+    """
+    
+    __slots__ = ()
+    
+    def keys(self):
+        return list(self.__slots__)
+    
+    def __contains__(self, key):
+        return key in self.__slots__
+    
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self else default
+    
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+@dataclass(slots=True)
+class AffectedArea(_Record):
+    """
+    Result of OilDispersalModel.calculate_affected_area.
+    
+    A slotted record instead of a dict; read fields as attributes.
+    """
+    
+    area_km2: float
+    center: tuple
+    thickness: float
+    evaporated: float
+    dissolved: float
+    coords: object = None
+    polygon: object = None
+    bounds: tuple = None
+
+
+@dataclass(slots=True)
+class VolumeFractions(_Record):
+    """
+    Result of OilDispersalModel.get_volume_fractions.
+    
+    A slotted record instead of a dict; read fields as attributes.
+    """
+    
+    evaporated: float
+    dissolved: float
+    surface: float
+
+
+class _ModelInput:
+    """
+    Descriptor for model inputs.
+    
+    The value is stored under the underscored attribute name. Reassigning
+    it drops the cached results and, for inputs of the precomputed terms
+    (``constants=True``), refreshes the owner's constants.
+    """
+    
+    def __init__(self, constants=True):
+        self.constants = constants
+    
+    def __set_name__(self, owner, name):
+        self.attr = '_' + name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.attr)
+    
+    def __set__(self, instance, value):
+        self._store(instance, value)
+        if self.constants:
+            instance._update_constants()
+        instance._affected_area = None
+        instance._evaporated_fraction = None
+        instance._dissolved_fraction = None
+    
+    def _store(self, instance, value):
+        setattr(instance, self.attr, value)
+
+
+class _OilInput(_ModelInput):
+    """
+    Descriptor for model inputs that are oil properties.
+    
+    The value lives in the owner's OilProperties record, which is replaced
+    on reassignment, so ``model.oil`` always agrees with the model inputs.
+    """
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance.oil, self.name)
+    
+    def _store(self, instance, value):
+        instance.oil = instance.oil._replace(**{self.name: float(value)})
 
 
 class OilDispersalModel:
@@ -21,6 +178,31 @@ class OilDispersalModel:
     and time since the spill occurred.
     """
     
+    # Fixed attribute layout: instances are created per spill in batch
+    # studies, so they carry no __dict__. The descriptor-backed inputs
+    # below store their values in the underscored slots, the oil
+    # properties in the oil record.
+    __slots__ = (
+        '_volume_m3', 'oil_properties', 'oil', '_time_hours',
+        '_wind_speed', '_water_temp', '_wave_height',
+        '_max_evap', '_diss_coeff', '_fay_coeff', '_deform_offset',
+        '_affected_area', '_spill_coords', '_polygon', '_slick_thickness',
+        '_evaporated_fraction', '_dissolved_fraction'
+    )
+    
+    # Inputs of the time-dependent part; reassigning one drops the cached result
+    volume_m3 = _ModelInput(constants=False)
+    time_hours = _ModelInput(constants=False)
+    
+    # Inputs of the precomputed constants; reassigning one refreshes them
+    density = _OilInput()  # g/cm³
+    viscosity = _OilInput()  # cP
+    surface_tension = _OilInput()  # mN/m
+    evaporation_rate = _OilInput()
+    wind_speed = _ModelInput()
+    water_temp = _ModelInput()
+    wave_height = _ModelInput()
+    
     def __init__(self, volume, oil_properties, time_hours=24, 
                  wind_speed=10.0, water_temp=15.0, wave_height=0.5):
         """
@@ -35,25 +217,66 @@ class OilDispersalModel:
             wave_height (float): Wave height in meters (default: 0.5m)
         """
         # Convert barrels to cubic meters (1 barrel = 0.159 cubic meters)
-        self.volume_m3 = volume * 0.159
+        self._volume_m3 = volume * 0.159
         self.oil_properties = oil_properties
-        self.time_hours = time_hours
-        self.wind_speed = wind_speed
-        self.water_temp = water_temp
-        self.wave_height = wave_height
+        self.oil = OilProperties.from_dict(oil_properties)
+        self._time_hours = time_hours
         
-        # Additional calculated properties
-        self.density = oil_properties.get('density', 0.9)  # g/cm³
-        self.viscosity = oil_properties.get('viscosity', 50.0)  # cP
-        self.surface_tension = oil_properties.get('surface_tension', 25.0)  # mN/m
-        self.evaporation_rate = oil_properties.get('evaporation_rate', 0.3)
+        # Environmental conditions
+        self._wind_speed = wind_speed
+        self._water_temp = water_temp
+        self._wave_height = wave_height
+        
+        # Precompute everything that does not depend on time or position
+        self._update_constants()
+        
+        # Per-instance starting point in the shape-noise lookup table
+        self._deform_offset = id(self) & (_DEFORM_LUT_SIZE - 1)
         
         # Store the computed affected area and shape for later use
         self._affected_area = None
-        self._spill_polygon = None
+        self._spill_coords = None
+        self._polygon = None
         self._slick_thickness = None
         self._evaporated_fraction = None
         self._dissolved_fraction = None
+    
+    @classmethod
+    def from_index(cls, volume, oil_table, idx, **kwargs):
+        """
+        Create a model for one row of an oil property table.
+        
+        Args:
+            volume (float): Volume of oil spilled in barrels
+            oil_table (numpy.ndarray): Structured array from ``build_oil_table``
+            idx (int): Row index of the oil type in ``oil_table``
+            **kwargs: Remaining keyword arguments of ``OilDispersalModel``
+            
+        Returns:
+            OilDispersalModel: Model using the properties in that row
+        """
+        row = oil_table[idx]
+        oil_properties = {field: float(row[field]) for field in oil_table.dtype.names}
+        return cls(volume, oil_properties, **kwargs)
+    
+    def _update_constants(self):
+        """
+        Precompute the time- and position-invariant terms of the model.
+        
+        Called on construction and whenever one of the inputs the terms
+        depend on is reassigned.
+        """
+        oil = self.oil
+        self._max_evap, self._diss_coeff, self._fay_coeff = _fay_coefficients(
+            oil.density,
+            oil.viscosity,
+            oil.surface_tension,
+            oil.evaporation_rate,
+            oil.solubility,
+            self._water_temp,
+            self._wind_speed,
+            self._wave_height
+        )
         
     def calculate_affected_area(self, lat=0.0, lon=0.0, simulate=True):
         """
@@ -62,12 +285,17 @@ class OilDispersalModel:
         Args:
             lat (float): Latitude of the spill origin
             lon (float): Longitude of the spill origin
-            simulate (bool): Whether to run the full simulation
+            simulate (bool): Whether to run the full simulation. If False,
+                the cached result is returned when available; otherwise only
+                the numeric results are computed and coords and polygon
+                are None.
             
         Returns:
-            dict: Information about the affected area including:
+            AffectedArea: Information about the affected area including:
                 - area_km2: Total area in square kilometers
+                - coords: (N, 2) array of (lon, lat) perimeter points
                 - polygon: Shapely polygon of the affected area
+                - bounds: (min_lon, min_lat, max_lon, max_lat) of coords
                 - center: Center coordinates (lat, lon)
                 - thickness: Average slick thickness in mm
                 - evaporated: Fraction of oil evaporated
@@ -75,68 +303,46 @@ class OilDispersalModel:
         """
         if simulate:
             self._run_simulation(lat, lon)
+        elif self._affected_area is None:
+            # Numeric results only; the polygon is built by the simulation
+            self._compute_affected_area(lat, lon)
         
-        # If we already calculated the affected area, return it
-        if self._affected_area is not None:
-            return self._affected_area
-            
-        # Calculate the initial slick area using the Fay algorithm
-        # This is a simplified version of the Fay spreading equations
-        time_seconds = self.time_hours * 3600
-        
-        # Calculate volume after evaporation and dissolution
-        evaporated_fraction = self._calculate_evaporation()
-        dissolved_fraction = self._calculate_dissolution()
-        
-        remaining_volume = self.volume_m3 * (1 - evaporated_fraction - dissolved_fraction)
-        
-        # Fay's equation for final area (simplified)
-        # A = k * V^(3/4) * t^(1/4) * (g * Δρ/ρ)^(1/8) / (ν^(1/4) * σ^(1/2))
-        # where:
-        # - k is a constant (approximately 0.5-2.0)
-        # - V is volume
-        # - t is time
-        # - g is gravitational acceleration
-        # - Δρ/ρ is relative density difference
-        # - ν is kinematic viscosity
-        # - σ is surface tension
-        
-        k = 1.45  # Empirical constant
-        g = 9.81  # Gravitational acceleration (m/s²)
-        relative_density_diff = (1.03 - self.density) / 1.03  # Seawater density ≈ 1.03 g/cm³
-        
-        # Wind and wave effects - this is a simplification of complex processes
-        wind_factor = 1.0 + (self.wind_speed / 20.0) * 0.5
-        wave_factor = 1.0 + (self.wave_height / 1.0) * 0.3
-        
-        # Calculate area in m²
-        area_m2 = (
-            k * 
-            (remaining_volume ** 0.75) * 
-            (time_seconds ** 0.25) * 
-            ((g * abs(relative_density_diff)) ** 0.125) / 
-            ((self.viscosity * 0.001) ** 0.25 * (self.surface_tension * 0.001) ** 0.5) *
-            wind_factor * 
-            wave_factor
-        )
+        return self._affected_area
+    
+    def _compute_affected_area(self, lat, lon):
+        """
+        Compute the numeric affected-area results and cache them.
         
-        # Convert to km²
-        area_km2 = area_m2 / 1_000_000
+        Evaporation and dissolution are evaluated once here and shared with
+        the Fay spreading calculation. The cached result has no polygon
+        until _simulate_spreading has run.
         
-        # Calculate average slick thickness (mm)
-        avg_thickness_mm = (remaining_volume / area_m2) * 1000
+        Args:
+            lat (float): Latitude of the spill origin
+            lon (float): Longitude of the spill origin
+        """
+        # Evaporation, dissolution and the Fay spreading equations
+        # run in the compiled kernel from the precomputed constants
+        area_km2, avg_thickness_mm, evaporated, dissolved = _fay_spread(
+            self.volume_m3,
+            self.time_hours,
+            self._max_evap,
+            self._diss_coeff,
+            self._fay_coeff
+        )
+        self._evaporated_fraction = evaporated
+        self._dissolved_fraction = dissolved
         
         # Store the affected area information
-        self._affected_area = {
-            'area_km2': area_km2,
-            'center': (lat, lon),
-            'thickness': avg_thickness_mm,
-            'evaporated': evaporated_fraction,
-            'dissolved': dissolved_fraction,
-            'polygon': self._spill_polygon
-        }
-        
-        return self._affected_area
+        self._spill_coords = None
+        self._polygon = None
+        self._affected_area = AffectedArea(
+            area_km2=area_km2,
+            center=(lat, lon),
+            thickness=avg_thickness_mm,
+            evaporated=self._evaporated_fraction,
+            dissolved=self._dissolved_fraction
+        )
     
     def _run_simulation(self, lat, lon):
         """
@@ -146,12 +352,18 @@ class OilDispersalModel:
             lat (float): Latitude of the spill origin
             lon (float): Longitude of the spill origin
         """
-        # Calculate the evaporated and dissolved fractions
-        self._evaporated_fraction = self._calculate_evaporation()
-        self._dissolved_fraction = self._calculate_dissolution()
+        # Calculate the fractions and the slick area once
+        self._compute_affected_area(lat, lon)
         
-        # Calculate the spreading using a simplified model
+        # Build the spill shape from the cached area
         self._simulate_spreading(lat, lon)
+        self._affected_area.coords = self._spill_coords
+        self._affected_area.polygon = self.spill_polygon
+        
+        # Bounding box of the outline, computed once for the map views
+        min_lon, min_lat = self._spill_coords.min(axis=0).tolist()
+        max_lon, max_lat = self._spill_coords.max(axis=0).tolist()
+        self._affected_area.bounds = (min_lon, min_lat, max_lon, max_lat)
     
     def _calculate_evaporation(self):
         """
@@ -160,37 +372,8 @@ class OilDispersalModel:
         Returns:
             float: Fraction of oil evaporated (0.0 to 1.0)
         """
-        # Simplified evaporation model using oil properties and environmental factors
-        # E(t) = Emax * (1 - exp(-k * t))
-        # where:
-        # - Emax is the maximum fraction that can evaporate (based on oil type)
-        # - k is an evaporation rate constant affected by temperature and wind
-        
-        # Base rate from oil properties
-        base_evap_rate = self.oil_properties.get('evaporation_rate', 0.3)
-        
-        # Temperature effect: evaporation increases with temperature
-        # Simple linear relationship with reference at 15°C
-        temp_factor = 1.0 + (self.water_temp - 15.0) * 0.03
-        
-        # Wind effect: evaporation increases with wind speed
-        # Simple linear relationship with reference at 10 km/h
-        wind_factor = 1.0 + (self.wind_speed - 10.0) * 0.02
-        
-        # Compute effective evaporation rate
-        effective_rate = base_evap_rate * temp_factor * wind_factor
-        
-        # Maximum evaporation is based on the oil's composition
-        max_evaporation = min(0.9, self.oil_properties.get('evaporation_rate', 0.3) * 2.5)
-        
-        # Time-dependent evaporation using exponential decay model
-        evaporation_constant = 0.05  # per hour
-        evaporated_fraction = max_evaporation * (1 - math.exp(-evaporation_constant * self.time_hours))
-        
-        # Limit to physical bounds
-        evaporated_fraction = min(max(0.0, evaporated_fraction), max_evaporation)
-        
-        return evaporated_fraction
+        # E(t) = Emax * (1 - exp(-k * t)), with Emax based on the oil type
+        return _evaporated_fraction(self._max_evap, self.time_hours)
     
     def _calculate_dissolution(self):
         """
@@ -199,26 +382,9 @@ class OilDispersalModel:
         Returns:
             float: Fraction of oil dissolved (0.0 to 1.0)
         """
-        # Simplified dissolution model
-        # Dissolution is affected by oil solubility, water temperature, wave action
-        
-        base_solubility = self.oil_properties.get('solubility', 0.01)
-        
-        # Temperature effect: dissolution increases with temperature
-        temp_factor = 1.0 + (self.water_temp - 15.0) * 0.02
-        
-        # Wave effect: dissolution increases with wave action
-        wave_factor = 1.0 + (self.wave_height - 0.5) * 0.5
-        
-        # Time effect: dissolution is time-dependent but saturates
-        time_factor = min(1.0, self.time_hours / 48.0)
-        
-        dissolved_fraction = base_solubility * temp_factor * wave_factor * time_factor
-        
-        # Limit to physical bounds
-        dissolved_fraction = min(max(0.0, dissolved_fraction), 0.2)  # Dissolution rarely exceeds 20%
-        
-        return dissolved_fraction
+        # Affected by oil solubility, water temperature and wave action,
+        # saturating with time
+        return _dissolved_fraction(self._diss_coeff, self.time_hours)
     
     def _simulate_spreading(self, lat, lon):
         """
@@ -233,10 +399,8 @@ class OilDispersalModel:
         
         # Calculate the primary dimensions of the spill based on our affected area
         if self._affected_area is None:
-            area_info = self.calculate_affected_area(lat, lon, simulate=False)
-            area_km2 = area_info['area_km2']
-        else:
-            area_km2 = self._affected_area['area_km2']
+            self._compute_affected_area(lat, lon)
+        area_km2 = self._affected_area.area_km2
         
         # Convert area to radius (assuming circular shape as starting point)
         # A = πr²
@@ -245,48 +409,56 @@ class OilDispersalModel:
         # Deform the circle based on wind direction (simplified)
         # We'll assume the wind is blowing towards the north-east (45°)
         # In a real model, wind direction would be an input parameter
-        wind_direction_rad = math.radians(45)
+        wind_bucket = round(45 / (360 / _N_WIND_DIRECTIONS)) % _N_WIND_DIRECTIONS
         
         # Wind deformation factor
         wind_deform = min(0.6, self.wind_speed / 60.0)
         
-        # Create points around the perimeter with some deformation
-        num_points = 36  # Number of points around the perimeter
-        polygon_points = []
+        # Degrees of longitude per km at this latitude (process-wide cache)
+        inv_cos_lat = _inv_cos_deg(round(lat * 100))
         
-        for i in range(num_points):
-            angle = 2 * math.pi * i / num_points
-            
-            # Deform the radius based on wind direction
-            # Maximum elongation in the wind direction, compression perpendicular to it
-            angle_diff = abs(((angle - wind_direction_rad + math.pi) % (2 * math.pi)) - math.pi)
-            stretch_factor = 1.0 + (wind_deform * math.cos(angle_diff))
-            
-            # Calculate the deformed radius for this angle
-            r = radius_km * stretch_factor
-            
-            # Add some randomness for a more realistic shape
-            r *= 1.0 + 0.1 * np.random.rand()
-            
-            # Convert to lat/lon coordinates (simplified)
-            # 111 km per degree of latitude, 111*cos(lat) km per degree of longitude
-            delta_lat = r / 111.0 * math.sin(angle)
-            delta_lon = r / (111.0 * math.cos(math.radians(lat))) * math.cos(angle)
-            
-            point_lat = lat + delta_lat
-            point_lon = lon + delta_lon
-            
-            polygon_points.append((point_lon, point_lat))
+        # Deform the radius of each perimeter point based on wind direction
+        # Maximum elongation in the wind direction, compression perpendicular to it
+        stretch_factor = 1.0 + wind_deform * _WIND_STRETCH[wind_bucket]
+        
+        # Calculate the deformed radius for each angle,
+        # with some randomness for a more realistic shape
+        noise = _DEFORM_LUT[(self._deform_offset + _POLY_IDX) % _DEFORM_LUT_SIZE]
+        r = radius_km * stretch_factor * (1.0 + 0.1 * noise)
+        
+        # Convert to lat/lon coordinates (simplified)
+        # 111 km per degree of latitude, 111*cos(lat) km per degree of longitude
+        delta_lat = r * (1.0 / 111.0) * _POLY_SIN
+        delta_lon = r * inv_cos_lat * _POLY_COS
         
-        # Create a shapely polygon from the points
-        self._spill_polygon = Polygon(polygon_points)
+        # Keep the perimeter as a (lon, lat) array; the shapely polygon
+        # is only built when spill_polygon is accessed
+        self._spill_coords = np.column_stack([lon + delta_lon, lat + delta_lat])
+        self._polygon = None
+    
+    @property
+    def spill_polygon(self):
+        """
+        Shapely polygon of the simulated spill, or None before a simulation.
+        
+        Built from the perimeter coordinates on first access. Shapely (and
+        GEOS) is imported here so callers that only need the numbers or the
+        raw coordinates never load it.
+        """
+        if self._polygon is None and self._spill_coords is not None:
+            from shapely.geometry.polygon import Polygon
+            self._polygon = Polygon(self._spill_coords)
+        return self._polygon
+    
+    # Former attribute name of the polygon
+    _spill_polygon = spill_polygon
     
     def get_volume_fractions(self):
         """
         Get the fractions of oil in different states.
         
         Returns:
-            dict: Fractions of oil (evaporated, dissolved, surface)
+            VolumeFractions: Fractions of oil (evaporated, dissolved, surface)
         """
         if self._evaporated_fraction is None:
             self._evaporated_fraction = self._calculate_evaporation()
@@ -296,11 +468,7 @@ class OilDispersalModel:
             
         surface_fraction = 1.0 - self._evaporated_fraction - self._dissolved_fraction
         
-        return {
-            'evaporated': self._evaporated_fraction,
-            'dissolved': self._dissolved_fraction,
-            'surface': surface_fraction
-        }
+        return VolumeFractions(self._evaporated_fraction, self._dissolved_fraction, surface_fraction)
     
     def get_slick_thickness(self):
         """
@@ -310,6 +478,154 @@ class OilDispersalModel:
             float: Average thickness in millimeters
         """
         if self._affected_area is None:
-            self.calculate_affected_area()
+            self.calculate_affected_area(simulate=False)
             
-        return self._affected_area['thickness']
\ No newline at end of file
+        return self._affected_area.thickness
+
+    @classmethod
+    def calculate_affected_area_batch(cls, volumes, densities, viscosities, surface_tensions,
+                                      evap_rates, solubilities, temps, winds, waves, times,
+                                      lats, lons):
+        """
+        Calculate the affected area for many spills at once.
+
+        Runs the same evaporation, dissolution and Fay spreading pipeline as
+        ``calculate_affected_area`` over arrays, so that fleet, grid or
+        Monte Carlo studies pay the interpreter overhead once per batch
+        instead of once per spill: in parallel through the compiled kernel
+        when Numba is installed, as NumPy array operations otherwise. All
+        arguments broadcast against each other. No spill polygons are
+        generated. Results are float32 when all inputs are float32 and
+        float64 otherwise.
+
+        Args:
+            volumes (array_like): Volumes of oil spilled in barrels
+            densities (array_like): Oil densities in g/cm³
+            viscosities (array_like): Oil viscosities in cP
+            surface_tensions (array_like): Oil surface tensions in mN/m
+            evap_rates (array_like): Oil evaporation rates
+            solubilities (array_like): Oil solubilities
+            temps (array_like): Water temperatures in °C
+            winds (array_like): Wind speeds in km/h
+            waves (array_like): Wave heights in meters
+            times (array_like): Times since spill in hours
+            lats (array_like): Latitudes of the spill origins
+            lons (array_like): Longitudes of the spill origins
+
+        Returns:
+            dict: Arrays keyed like the scalar result:
+                - area_km2: Total area in square kilometers
+                - lat, lon: Spill origin coordinates
+                - thickness: Average slick thickness in mm
+                - evaporated: Fraction of oil evaporated
+                - dissolved: Fraction of oil dissolved
+        """
+        inputs = [np.asarray(a) for a in (
+            volumes, densities, viscosities, surface_tensions, evap_rates, solubilities,
+            temps, winds, waves, times, lats, lons
+        )]
+        
+        # Stay in float32 when every input is float32 (e.g. columns of the
+        # oil table from build_oil_table), otherwise work in float64
+        dtype = np.result_type(np.float32, *inputs)
+        
+        (volumes_m3, densities, viscosities, surface_tensions, evap_rates, solubilities,
+         temps, winds, waves, times, lats, lons) = np.broadcast_arrays(
+            *(a.astype(dtype, copy=False) for a in inputs)
+        )
+        volumes_m3 = volumes_m3 * 0.159
+        
+        if NUMBA_AVAILABLE:
+            # Compiled kernel, parallel over spills
+            shape = volumes_m3.shape
+            flat = [np.array(a, order='C').ravel() for a in (
+                volumes_m3, densities, viscosities, surface_tensions, evap_rates,
+                solubilities, times, winds, temps, waves
+            )]
+            area_km2, thickness, evaporated, dissolved = (
+                a.reshape(shape) for a in _fay_kernel_batch(*flat)
+            )
+        else:
+            evaporated = cls._evap_batch(evap_rates, temps, winds, times)
+            dissolved = cls._dissolution_batch(solubilities, temps, waves, times)
+            
+            remaining_volume = volumes_m3 * (1 - evaporated - dissolved)
+            
+            # Same simplified Fay equation as the scalar path
+            k = 1.45
+            g = 9.81
+            relative_density_diff = (1.03 - densities) / 1.03
+            wind_factor = 1.0 + (winds / 20.0) * 0.5
+            wave_factor = 1.0 + (waves / 1.0) * 0.3
+            
+            area_m2 = (
+                k *
+                remaining_volume ** 0.75 *
+                (times * 3600) ** 0.25 *
+                (g * np.abs(relative_density_diff)) ** 0.125 /
+                ((viscosities * 0.001) ** 0.25 * (surface_tensions * 0.001) ** 0.5) *
+                wind_factor *
+                wave_factor
+            )
+            area_km2 = area_m2 / 1_000_000
+            thickness = (remaining_volume / area_m2) * 1000
+        
+        return {
+            'area_km2': area_km2,
+            'lat': lats,
+            'lon': lons,
+            'thickness': thickness,
+            'evaporated': evaporated,
+            'dissolved': dissolved
+        }
+    
+    @staticmethod
+    def _evap_batch(evap_rate, temp, wind, t_hours):
+        """
+        Vectorized counterpart of ``_calculate_evaporation``.
+
+        Args:
+            evap_rate (array_like): Oil evaporation rates
+            temp (array_like): Water temperatures in °C
+            wind (array_like): Wind speeds in km/h
+            t_hours (array_like): Times since spill in hours
+
+        Returns:
+            numpy.ndarray: Fractions of oil evaporated (0.0 to 1.0)
+        """
+        # Like the scalar model, the maximum evaporable fraction depends only on
+        # the oil; temperature and wind are accepted for signature parity
+        max_evap = np.minimum(0.9, np.asarray(evap_rate) * 2.5)
+        t_hours = np.asarray(t_hours)
+        
+        # Same tabulated curve as the scalar kernel, exp() outside the table
+        dtype = np.result_type(t_hours, np.float32)
+        curve = np.atleast_1d(np.interp(t_hours, _EVAP_T_GRID, _EVAP_CURVE).astype(dtype))
+        outside = np.atleast_1d((t_hours < 0) | (t_hours >= _EVAP_T_MAX))
+        if outside.any():
+            curve[outside] = 1 - np.exp(-0.05 * np.atleast_1d(t_hours)[outside])
+        curve = curve.reshape(np.shape(t_hours))
+        return np.minimum(max_evap, max_evap * curve)
+
+    @staticmethod
+    def _dissolution_batch(solubility, temp, wave, t_hours):
+        """
+        Vectorized counterpart of ``_calculate_dissolution``.
+
+        Args:
+            solubility (array_like): Oil solubilities
+            temp (array_like): Water temperatures in °C
+            wave (array_like): Wave heights in meters
+            t_hours (array_like): Times since spill in hours
+
+        Returns:
+            numpy.ndarray: Fractions of oil dissolved (0.0 to 0.2)
+        """
+        temp_factor = 1.0 + (np.asarray(temp) - 15.0) * 0.02
+        wave_factor = 1.0 + (np.asarray(wave) - 0.5) * 0.5
+        time_factor = np.minimum(1.0, np.asarray(t_hours) / 48.0)
+
+        dissolved = np.asarray(solubility) * temp_factor * wave_factor * time_factor
+
+        # Dissolution rarely exceeds 20%
+        return np.clip(dissolved, 0.0, 0.2)
\ No newline at end of file
@@ -6,9 +6,122 @@ of oil spills, including affected surface area, carbon emissions, and
 cleanup time.
 """
 
+import copy
+import functools
 import math
 import numpy as np
-from datetime import datetime, timedelta
+
+from config.settings import (
+    BASE_CLEANUP_COST_PER_BARREL,
+    FISHERY_LOCATIONS,
+    LOCATION_MULTIPLIERS,
+    LOCATION_TYPES,
+    SHIPPING_LOCATIONS,
+    TOURISM_LOCATIONS,
+    TOXICITY_MAP,
+    WILDLIFE_BASE_IMPACTS
+)
+from .dispersal_model import OilDispersalModel
+from ._cleanup_numba import (
+    _CLEANUP_CO2_PER_BARREL,
+    _CO2_WEIGHTS,
+    _cleanup_time_batch,
+    _cleanup_time_clip,
+    _cleanup_time_core,
+    _combined_impact_kernel
+)
+from ._fay_kernel import NUMBA_AVAILABLE
+
+
+# Per-location tables indexed by LOCATION_IDX, so that lookups (and batch
+# gathers with an index array) avoid hashing the location name
+LOCATION_IDX = {name: i for i, name in enumerate(LOCATION_TYPES)}
+
+# Location index for location types not in LOCATION_TYPES. It selects the
+# trailing entry appended to each per-location table below.
+UNKNOWN_LOCATION = -1
+
+# Location whose wildlife data each location uses, and that data; locations
+# without an entry (and unknown locations) fall back to open ocean
+_WILDLIFE_LOC = np.array(
+    [LOCATION_IDX[name if name in WILDLIFE_BASE_IMPACTS else 'open_ocean'] for name in LOCATION_TYPES]
+    + [LOCATION_IDX['open_ocean']]
+)
+_WL_DENS = np.array([WILDLIFE_BASE_IMPACTS[LOCATION_TYPES[loc]]['density'] for loc in _WILDLIFE_LOC])
+_WL_VULN = np.array([WILDLIFE_BASE_IMPACTS[LOCATION_TYPES[loc]]['vulnerability'] for loc in _WILDLIFE_LOC])
+
+# Economic sectors affected at each location, one bit per sector, so a
+# single lookup gives all three
+_ECON_TOURISM = 0b001
+_ECON_FISHERY = 0b010
+_ECON_SHIPPING = 0b100
+
+# Unknown locations get the open ocean multiplier and no sector losses
+_ECON_LOC_MULT = np.array(
+    [LOCATION_MULTIPLIERS.get(name, 1.0) for name in LOCATION_TYPES] + [1.0]
+)
+_ECON_FLAGS = np.array(
+    [
+        (name in TOURISM_LOCATIONS) * _ECON_TOURISM |
+        (name in FISHERY_LOCATIONS) * _ECON_FISHERY |
+        (name in SHIPPING_LOCATIONS) * _ECON_SHIPPING
+        for name in LOCATION_TYPES
+    ] + [0],
+    dtype=np.uint8
+)
+
+# Rows of the tables above as plain Python numbers, keyed by location name,
+# for the scalar estimators: indexing NumPy arrays for a single spill costs
+# more than the estimate itself
+_WILDLIFE_ROWS = {
+    name: (LOCATION_TYPES[loc], float(_WL_DENS[i]), float(_WL_VULN[i]))
+    for i, (name, loc) in enumerate(zip(LOCATION_TYPES, _WILDLIFE_LOC.tolist()))
+}
+_ECON_ROWS = {
+    name: (float(_ECON_LOC_MULT[i]), int(_ECON_FLAGS[i]))
+    for i, name in enumerate(LOCATION_TYPES)
+}
+_ECON_UNKNOWN_ROW = (float(_ECON_LOC_MULT[UNKNOWN_LOCATION]), int(_ECON_FLAGS[UNKNOWN_LOCATION]))
+
+
+class _NoiseBuffer:
+    """
+    Normal variates drawn in bulk and handed out one at a time.
+    
+    A single scalar draw from NumPy costs far more in dispatch than in
+    generation, so draws are made 8192 at a time and refilled on wraparound.
+    """
+    
+    __slots__ = ('mean', 'std', 'size', '_rng', '_buf', '_idx')
+    
+    def __init__(self, mean, std, size=8192, seed=None):
+        self.mean = mean
+        self.std = std
+        self.size = size
+        self.reseed(seed)
+    
+    def reseed(self, seed=None):
+        """Restart the stream from a new generator seeded with seed."""
+        self._rng = np.random.default_rng(seed)
+        self._buf = None
+        self._idx = self.size
+    
+    def draw(self):
+        """Return the next variate as a float."""
+        if self._idx >= self.size:
+            self._buf = self._rng.normal(self.mean, self.std, self.size)
+            self._idx = 0
+        value = self._buf[self._idx]
+        self._idx += 1
+        return float(value)
+    
+    def draw_many(self, shape):
+        """Return an array of fresh variates straight from the generator."""
+        return self._rng.normal(self.mean, self.std, size=shape)
+
+
+# Natural variation of the cleanup time estimate (5% standard deviation)
+_CLEANUP_NOISE = _NoiseBuffer(1.0, 0.05)
 
 
 class ImpactEstimator:
@@ -17,6 +130,15 @@ class ImpactEstimator:
     dispersal model outputs and oil properties.
     """
     
+    # Fixed attribute layout, as for OilDispersalModel
+    __slots__ = (
+        'dispersal_model', 'environmental_sensitivity', 'oil_properties',
+        'volume_m3', 'volume_barrels',
+        '_toxicity', '_toxicity_oil',
+        '_surface_area', '_co2_emissions', '_cleanup_time', '_affected_area',
+        '_summary', '_cached_state', '_volume_factor', '_base_cleanup_cost'
+    )
+    
     def __init__(self, dispersal_model, environmental_sensitivity=1.0):
         """
         Initialize the impact estimator.
@@ -31,14 +153,65 @@ class ImpactEstimator:
         
         # Extract relevant properties from the dispersal model
         self.oil_properties = dispersal_model.oil_properties
-        self.volume_m3 = dispersal_model.volume_m3
-        self.volume_barrels = self.volume_m3 / 0.159  # Convert m³ to barrels
+        
+        # Toxicity factor and the oil record it was computed for
+        self._toxicity = None
+        self._toxicity_oil = None
+        
+        # Spill volume and the location-independent volume terms
+        self._set_volume(dispersal_model.volume_m3)
         
         # Cache for calculated values
         self._surface_area = None
         self._co2_emissions = None
         self._cleanup_time = None
+        self._affected_area = None
+        self._summary = None
+        
+        # Model inputs the cached values above belong to
+        self._cached_state = self._state_key()
+    
+    @property
+    def oil(self):
+        """Oil properties record of the dispersal model, with defaults applied."""
+        return self.dispersal_model.oil
 
+    def _set_volume(self, volume_m3):
+        """
+        Store the spill volume and the volume terms that do not depend on
+        the location.
+        """
+        self.volume_m3 = volume_m3
+        self.volume_barrels = volume_m3 / 0.159  # Convert m³ to barrels
+        
+        # Volume factor of the wildlife impact - larger spills have worse impacts
+        self._volume_factor = min(1.0, max(0.1, 0.1 + math.log10(max(self.volume_barrels, 1e-9) / 100) * 0.3))
+        
+        # Cleanup cost before the location multiplier
+        self._base_cleanup_cost = (
+            self.volume_barrels *
+            BASE_CLEANUP_COST_PER_BARREL *
+            (self.oil.cleanup_difficulty / 3.0)
+        )
+    
+    def with_scaled_volume(self, factor):
+        """
+        Create an estimator for the same spill with the volume scaled.
+        
+        The dispersal model is copied with its constants as they are and only
+        the volume reassigned, so nothing but the volume-dependent results is
+        recomputed. This estimator and its model are left unchanged.
+        
+        Args:
+            factor (float): Factor applied to the spill volume
+            
+        Returns:
+            ImpactEstimator: Estimator for the scaled spill
+        """
+        model = copy.copy(self.dispersal_model)
+        model.volume_m3 = model.volume_m3 * factor
+        return ImpactEstimator(model, self.environmental_sensitivity)
+    
     def calculate_surface_area(self):
         """
         Calculate the water surface area affected by the oil spill.
@@ -49,11 +222,25 @@ class ImpactEstimator:
         if self._surface_area is not None:
             return self._surface_area
             
-        # Use the dispersal model to calculate the affected area
-        affected_area = self.dispersal_model.calculate_affected_area()
-        self._surface_area = affected_area['area_km2']
+        self._surface_area = self.get_affected_area().area_km2
         
         return self._surface_area
+    
+    def get_affected_area(self):
+        """
+        Get the dispersal model's affected-area result used by the estimates.
+        
+        The result is fetched once and cached; only the numeric fields are
+        computed here, so coords and polygon may be None.
+        
+        Returns:
+            AffectedArea: Affected area details from the dispersal model
+        """
+        if self._affected_area is None:
+            # Numbers only; the spill polygon is not needed here
+            self._affected_area = self.dispersal_model.calculate_affected_area(simulate=False)
+        
+        return self._affected_area
         
     def calculate_co2_emissions(self):
         """
@@ -70,34 +257,45 @@ class ImpactEstimator:
         
         # Get oil fractions in different states
         fractions = self.dispersal_model.get_volume_fractions()
-        evaporated = fractions['evaporated']
-        dissolved = fractions['dissolved']
-        surface = fractions['surface']
         
-        # Oil-specific CO2 emission factor (metric tons CO2 per barrel)
-        emission_factor = self.oil_properties.get('co2_emission_factor', 3.0)
+        total_emissions = float(self.calculate_co2_emissions_batch(
+            self.volume_barrels, fractions.evaporated, fractions.dissolved, fractions.surface,
+            self.oil.co2_emission_factor
+        ))
         
-        # Direct emissions from evaporated oil
-        # Evaporated hydrocarbons eventually oxidize to CO2 in the atmosphere
-        evaporated_emissions = self.volume_barrels * evaporated * emission_factor
+        self._co2_emissions = total_emissions
+        return total_emissions
+    
+    @staticmethod
+    def calculate_co2_emissions_batch(volumes, evaporated, dissolved, surface, emission_factor=3.0):
+        """
+        Calculate CO2 equivalent emissions for many spills at once.
         
-        # Dissolved oil has a lower emission factor since some carbon stays in water
-        dissolved_emissions = self.volume_barrels * dissolved * emission_factor * 0.5
+        All arguments broadcast against each other.
         
-        # Surface oil emissions depend on cleanup methods and natural degradation
-        # This is a simplified estimate
-        surface_emissions = self.volume_barrels * surface * emission_factor * 0.8
+        Args:
+            volumes (array_like): Volumes of oil spilled in barrels
+            evaporated (array_like): Fractions of oil evaporated
+            dissolved (array_like): Fractions of oil dissolved
+            surface (array_like): Fractions of oil remaining on the surface
+            emission_factor (array_like): Oil-specific CO2 emission factors
+                (metric tons CO2 per barrel)
+                
+        Returns:
+            numpy.ndarray: CO2 equivalent emissions in metric tons
+        """
+        volumes = np.asarray(volumes, dtype=np.float64)
+        surface = np.asarray(surface, dtype=np.float64)
+        fractions = np.stack(np.broadcast_arrays(evaporated, dissolved, surface), axis=-1)
+        
+        # Direct emissions from the oil in each state
+        direct_emissions = volumes * emission_factor * (fractions @ _CO2_WEIGHTS)
         
         # Additional emissions from cleanup operations
-        # Based on energy used for cleanup per barrel of oil
-        cleanup_emissions_factor = 0.1  # metric tons CO2 per barrel for cleanup
-        cleanup_emissions = self.volume_barrels * surface * cleanup_emissions_factor
+        cleanup_emissions = volumes * surface * _CLEANUP_CO2_PER_BARREL
         
         # Total CO2 equivalent emissions
-        total_emissions = evaporated_emissions + dissolved_emissions + surface_emissions + cleanup_emissions
-        
-        self._co2_emissions = total_emissions
-        return total_emissions
+        return direct_emissions + cleanup_emissions
         
     def estimate_cleanup_time(self):
         """
@@ -116,106 +314,228 @@ class ImpactEstimator:
         # 3. Affected area
         # 4. Environmental sensitivity
         # 5. Weathering conditions (temp, wind, waves)
-        
-        # Base time per volume (days per 1000 barrels)
-        base_time_per_volume = 1.5
-        
-        # Oil property factors
-        viscosity = self.oil_properties.get('viscosity', 50.0)
-        persistence = self.oil_properties.get('persistence_factor', 0.8)
-        cleanup_difficulty = self.oil_properties.get('cleanup_difficulty', 3.0)
-        
-        # Calculate basic cleanup time based on volume
-        volume_factor = self.volume_barrels / 1000
-        basic_time = base_time_per_volume * volume_factor
-        
-        # Adjust for oil properties
-        # Higher viscosity means longer cleanup
-        viscosity_factor = min(3.0, max(0.5, (viscosity / 100.0) * 1.5))
-        
-        # Higher persistence means longer cleanup
-        persistence_factor = min(2.0, max(1.0, persistence * 2.0))
-        
-        # Specific cleanup difficulty rating
-        difficulty_factor = cleanup_difficulty / 3.0
-        
-        # Environmental conditions from the dispersal model
-        wave_height = self.dispersal_model.wave_height
-        wind_speed = self.dispersal_model.wind_speed
-        water_temp = self.dispersal_model.water_temp
-        
-        # Weather factors
-        # High waves make cleanup more difficult
-        wave_factor = min(2.0, max(0.8, 0.8 + wave_height * 0.4))
-        
-        # High winds make cleanup more difficult
-        wind_factor = min(1.5, max(0.8, 0.8 + (wind_speed / 20.0) * 0.5))
-        
-        # Cold temperatures increase cleanup time
-        temp_factor = min(1.5, max(0.8, 1.5 - (water_temp / 30.0) * 0.5))
-        
-        # Area factor - larger areas take longer to clean but with diminishing returns
-        area = self.calculate_surface_area()
-        area_factor = min(3.0, max(1.0, 0.5 + (area / 100.0) * 0.5))
-        
-        # Environmental sensitivity factor
-        sensitivity_factor = min(2.0, max(0.8, self.environmental_sensitivity))
-        
-        # Final cleanup time calculation with all factors
-        cleanup_time = (
-            basic_time *
-            viscosity_factor *
-            persistence_factor *
-            difficulty_factor *
-            wave_factor *
-            wind_factor *
-            temp_factor *
-            area_factor *
-            sensitivity_factor
+        cleanup_time = _cleanup_time_core(
+            self.volume_barrels,
+            self.oil.viscosity,
+            self.oil.persistence_factor,
+            self.oil.cleanup_difficulty,
+            self.dispersal_model.wave_height,
+            self.dispersal_model.wind_speed,
+            self.dispersal_model.water_temp,
+            self.calculate_surface_area(),
+            self.environmental_sensitivity
         )
         
+        self._cleanup_time = self._vary_cleanup_time(cleanup_time)
+        return self._cleanup_time
+    
+    @staticmethod
+    def _vary_cleanup_time(cleanup_time):
+        """Apply natural variation and the 1-day floor to a cleanup time."""
         # Add a small random component for natural variation
-        randomness = np.random.normal(1.0, 0.05)  # 5% standard deviation
+        randomness = _CLEANUP_NOISE.draw()  # 5% standard deviation
         cleanup_time *= randomness
         
         # Ensure the result is positive and reasonable
-        cleanup_time = max(1.0, cleanup_time)
+        return max(1.0, cleanup_time)
+    
+    @staticmethod
+    def estimate_cleanup_time_batch(volumes, viscosities, persistences, difficulties,
+                                    wave_heights, wind_speeds, water_temps, areas,
+                                    sensitivities=1.0):
+        """
+        Estimate cleanup times for many spills or ensemble members at once.
+        
+        Applies the same factors, natural variation and 1-day floor as
+        estimate_cleanup_time. All arguments broadcast against each other.
+        
+        Args:
+            volumes (array_like): Volumes of oil spilled in barrels
+            viscosities (array_like): Oil viscosities in cP
+            persistences (array_like): Oil persistence factors
+            difficulties (array_like): Oil cleanup difficulty ratings
+            wave_heights (array_like): Wave heights in meters
+            wind_speeds (array_like): Wind speeds in km/h
+            water_temps (array_like): Water temperatures in °C
+            areas (array_like): Affected surface areas in square kilometers
+            sensitivities (array_like): Environmental sensitivity factors
+            
+        Returns:
+            numpy.ndarray: Estimated cleanup times in days
+        """
+        inputs = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (
+            volumes, viscosities, persistences, difficulties,
+            wave_heights, wind_speeds, water_temps, areas, sensitivities
+        )))
+        shape = inputs[0].shape
+        
+        if NUMBA_AVAILABLE:
+            # Compiled kernel, parallel over spills
+            cleanup_time = _cleanup_time_batch(
+                *(np.array(a, order='C').ravel() for a in inputs)
+            ).reshape(shape)
+        else:
+            cleanup_time = _cleanup_time_clip(*inputs)
+        
+        # Add a small random component for natural variation
+        cleanup_time *= _CLEANUP_NOISE.draw_many(shape)  # 5% standard deviation
+        
+        # Ensure the result is positive and reasonable
+        return np.maximum(1.0, cleanup_time)
         
-        self._cleanup_time = cleanup_time
-        return cleanup_time
+    def _state_key(self):
+        """
+        Key of every input the impact summary depends on.
         
+        Matches the argument order of summary_cached().
+        """
+        model = self.dispersal_model
+        return (
+            model.volume_m3 / 0.159, model.oil, model.time_hours, model.wind_speed, model.water_temp, model.wave_height,
+            self.environmental_sensitivity
+        )
+    
     def get_impact_summary(self):
         """
         Get a comprehensive summary of the environmental impact.
         
+        Summaries are shared through summary_cached(), so estimators for
+        the same spill, oil and conditions reuse one result. Estimates this
+        instance has already returned are kept and only the missing ones
+        are taken from the shared summary, so the summary always agrees
+        with the estimate methods. When a model input changes, the cached
+        estimates are dropped and recomputed for the new inputs.
+        
         Returns:
             dict: Summary of all calculated impacts
         """
-        # Calculate all impacts if not already done
-        surface_area = self.calculate_surface_area()
-        co2_emissions = self.calculate_co2_emissions()
-        cleanup_time = self.estimate_cleanup_time()
+        state = self._state_key()
+        if state != self._cached_state:
+            # The model inputs changed since the estimates were cached
+            self._set_volume(self.dispersal_model.volume_m3)
+            self._affected_area = None
+            self._surface_area = None
+            self._co2_emissions = None
+            self._cleanup_time = None
+            self._summary = None
+            self._cached_state = state
+        
+        if self._summary is None:
+            shared = summary_cached(*state)
+            if self._surface_area is None:
+                self._surface_area = shared['surface_area_km2']
+            if self._co2_emissions is None:
+                self._co2_emissions = shared['co2_emissions_tons']
+            if self._cleanup_time is None:
+                # The shared cleanup time has no variation; draw this
+                # estimator's own, as estimate_cleanup_time does
+                self._cleanup_time = self._vary_cleanup_time(shared['cleanup_time_days'])
+            self._summary = dict(
+                shared,
+                surface_area_km2=self._surface_area,
+                co2_emissions_tons=self._co2_emissions,
+                cleanup_time_days=self._cleanup_time
+            )
+        
+        # Copies, so callers cannot modify the cached summary
+        return dict(self._summary, oil_fractions=dict(self._summary['oil_fractions']))
+    
+    def _compute_impact_summary(self):
+        """
+        Compute the impact summary before the cleanup time's natural variation.
+        
+        Used by summary_cached(), whose results are shared between
+        estimators; each estimator applies its own variation to the
+        cleanup time (see _vary_cleanup_time).
         
-        # Get oil fractions
+        Returns:
+            dict: Summary of all calculated impacts, with cleanup_time_days
+                  before natural variation and the 1-day floor
+        """
+        affected_area = self.get_affected_area()
+        surface_area = self.calculate_surface_area()
         fractions = self.dispersal_model.get_volume_fractions()
         
-        # Get affected area details
-        affected_area = self.dispersal_model.calculate_affected_area()
+        # Both estimates in one compiled call
+        model = self.dispersal_model
+        co2_emissions, cleanup_time = _combined_impact_kernel(
+            self.volume_barrels,
+            fractions.evaporated,
+            fractions.dissolved,
+            fractions.surface,
+            self.oil.co2_emission_factor,
+            self.oil.viscosity,
+            self.oil.persistence_factor,
+            self.oil.cleanup_difficulty,
+            model.wave_height,
+            model.wind_speed,
+            model.water_temp,
+            surface_area,
+            self.environmental_sensitivity
+        )
         
         # Compile the summary
-        summary = {
+        return {
             'volume_barrels': self.volume_barrels,
             'volume_m3': self.volume_m3,
             'surface_area_km2': surface_area,
             'co2_emissions_tons': co2_emissions,
             'cleanup_time_days': cleanup_time,
-            'oil_fractions': fractions,
-            'slick_thickness_mm': affected_area['thickness'],
-            'oil_type': self.oil_properties.get('name', 'Unknown'),
+            'oil_fractions': fractions.to_dict(),
+            'slick_thickness_mm': affected_area.thickness,
+            'oil_type': self.oil.name,
             'environmental_sensitivity': self.environmental_sensitivity
         }
+    
+    @staticmethod
+    def location_indices(location_types):
+        """
+        Map location type names to indices for the batch estimators.
         
-        return summary
+        Args:
+            location_types (iterable): Location type names
+            
+        Returns:
+            numpy.ndarray: Indices into LOCATION_TYPES, UNKNOWN_LOCATION for
+                unrecognized names
+        """
+        return np.array(
+            [LOCATION_IDX.get(name, UNKNOWN_LOCATION) for name in location_types],
+            dtype=np.intp
+        )
+    
+    def _oil_toxicity(self):
+        """
+        Toxicity factor of the oil (0.3 to 1.0).
+        
+        Computed once per oil record, so reassigning the model's density or
+        viscosity is picked up. Uses the qualitative environmental toxicity
+        rating when given and estimates it from density and viscosity
+        otherwise.
+        """
+        oil = self.dispersal_model.oil
+        if oil is not self._toxicity_oil:
+            self._toxicity = self._compute_toxicity(oil)
+            self._toxicity_oil = oil
+        return self._toxicity
+    
+    @staticmethod
+    def _compute_toxicity(oil):
+        """Toxicity factor of an oil properties record; see _oil_toxicity."""
+        rating = oil.environmental_toxicity
+        if rating is not None:
+            # Ratings in the oil data are already lowercase; only other
+            # spellings need the lowered copy
+            toxicity = TOXICITY_MAP.get(rating)
+            if toxicity is None:
+                toxicity = TOXICITY_MAP.get(
+                    rating.lower(),
+                    0.6  # Default to moderate if not specified
+                )
+            return toxicity
+        
+        # Estimate toxicity from other properties if not explicitly given
+        return min(1.0, max(0.3, (oil.density - 0.8) * 2.0 + (oil.viscosity / 1000.0) * 0.5))
     
     def estimate_wildlife_impact(self, location_type='open_ocean'):
         """
@@ -227,58 +547,26 @@ class ImpactEstimator:
         Returns:
             dict: Wildlife impact metrics
         """
-        # Base impact metrics by location type
-        base_impacts = {
-            'open_ocean': {'density': 0.2, 'vulnerability': 0.6},
-            'coastal': {'density': 0.8, 'vulnerability': 0.8},
-            'estuary': {'density': 1.0, 'vulnerability': 1.0},
-            'reef': {'density': 1.2, 'vulnerability': 0.9},
-            'wetland': {'density': 1.0, 'vulnerability': 1.0},
-            'river': {'density': 0.7, 'vulnerability': 0.8}
-        }
-        
-        # Default to open ocean if location type not recognized
-        if location_type not in base_impacts:
-            location_type = 'open_ocean'
-            
-        # Get base impact values for this location
-        density = base_impacts[location_type]['density']
-        vulnerability = base_impacts[location_type]['vulnerability']
+        # Get base impact values for this location; locations without
+        # wildlife data (or not recognized) are treated as open ocean
+        location_type, density, vulnerability = _WILDLIFE_ROWS.get(
+            location_type, _WILDLIFE_ROWS['open_ocean']
+        )
         
         # Calculate affected area
         surface_area = self.calculate_surface_area()
         
-        # Calculate toxicity factor based on oil properties
-        if 'environmental_toxicity' in self.oil_properties:
-            toxicity_map = {
-                'low': 0.3,
-                'moderate': 0.6,
-                'high': 0.8,
-                'very high': 1.0
-            }
-            toxicity = toxicity_map.get(
-                self.oil_properties['environmental_toxicity'].lower(),
-                0.6  # Default to moderate if not specified
-            )
-        else:
-            # Estimate toxicity from other properties if not explicitly given
-            viscosity = self.oil_properties.get('viscosity', 50.0)
-            density = self.oil_properties.get('density', 0.9)
-            toxicity = min(1.0, max(0.3, (density - 0.8) * 2.0 + (viscosity / 1000.0) * 0.5))
-        
-        # Calculate volume factor - larger spills have worse impacts
-        volume_factor = min(1.0, max(0.1, 0.1 + math.log10(self.volume_barrels / 100) * 0.3))
+        # Toxicity factor based on oil properties
+        toxicity = self._oil_toxicity()
         
         # Calculate persistence impact
-        persistence = self.oil_properties.get('persistence_factor', 0.8)
+        persistence = self.oil.persistence_factor
         
         # Estimate affected wildlife indicators
-        mortality_rate = vulnerability * toxicity * volume_factor * persistence * 0.8
+        mortality_rate = vulnerability * toxicity * self._volume_factor * persistence * 0.8
         
         # Estimate affected populations based on area and density
-        birds_affected = surface_area * density * 100 * vulnerability
-        marine_mammals_affected = surface_area * density * 5 * vulnerability
-        fish_affected = surface_area * density * 1000 * vulnerability * 0.5  # Fish can avoid somewhat
+        area_density = surface_area * density
         
         # Compile wildlife impact summary
         wildlife_impact = {
@@ -287,14 +575,72 @@ class ImpactEstimator:
             'wildlife_vulnerability': vulnerability,
             'oil_toxicity': toxicity,
             'mortality_rate': mortality_rate,
-            'birds_affected': int(birds_affected),
-            'marine_mammals_affected': int(marine_mammals_affected),
-            'fish_affected': int(fish_affected),
+            'birds_affected': int(area_density * 100 * vulnerability),
+            'marine_mammals_affected': int(area_density * 5 * vulnerability),
+            'fish_affected': int(area_density * 1000 * vulnerability * 0.5),  # Fish can avoid somewhat
             'long_term_ecosystem_impact': persistence * toxicity * self.environmental_sensitivity
         }
         
         return wildlife_impact
     
+    def estimate_wildlife_impact_batch(self, location_idx):
+        """
+        Estimate the wildlife impact of this spill at many locations at once.
+        
+        Args:
+            location_idx (array_like): Indices into LOCATION_TYPES, e.g. from
+                location_indices(); locations without wildlife data (and
+                UNKNOWN_LOCATION) are treated as open ocean
+            
+        Returns:
+            dict: Wildlife impact metrics as arrays, keyed like
+                estimate_wildlife_impact() with counts as int64 and
+                location_idx holding the locations actually used; the
+                oil-only terms oil_toxicity and long_term_ecosystem_impact
+                are scalars
+        """
+        # Get base impact values for these locations
+        location_idx = np.asarray(location_idx, dtype=np.intp)
+        loc = _WILDLIFE_LOC[location_idx]
+        density = _WL_DENS[location_idx]
+        vulnerability = _WL_VULN[location_idx]
+        
+        # Calculate affected area
+        surface_area = self.calculate_surface_area()
+        
+        # Toxicity factor based on oil properties
+        toxicity = self._oil_toxicity()
+        
+        # Volume factor - larger spills have worse impacts
+        volume_factor = self._volume_factor
+        
+        # Calculate persistence impact
+        persistence = self.oil.persistence_factor
+        
+        # Estimate affected wildlife indicators
+        mortality_rate = vulnerability * toxicity * volume_factor * persistence * 0.8
+        
+        # Estimate affected populations based on area and density, truncated
+        # to whole animals in one cast for all three groups
+        area_density = surface_area * density
+        birds_affected, marine_mammals_affected, fish_affected = np.stack([
+            area_density * 100 * vulnerability,
+            area_density * 5 * vulnerability,
+            area_density * 1000 * vulnerability * 0.5  # Fish can avoid somewhat
+        ]).astype(np.int64)
+        
+        return {
+            'location_idx': loc,
+            'wildlife_density': density,
+            'wildlife_vulnerability': vulnerability,
+            'oil_toxicity': toxicity,
+            'mortality_rate': mortality_rate,
+            'birds_affected': birds_affected,
+            'marine_mammals_affected': marine_mammals_affected,
+            'fish_affected': fish_affected,
+            'long_term_ecosystem_impact': persistence * toxicity * self.environmental_sensitivity
+        }
+    
     def estimate_economic_impact(self, location_type='open_ocean'):
         """
         Estimate the economic impact of the oil spill.
@@ -305,53 +651,35 @@ class ImpactEstimator:
         Returns:
             dict: Economic impact metrics in USD
         """
-        # Calculate base cleanup cost
-        # Average cleanup cost per barrel (USD)
-        base_cleanup_cost_per_barrel = 10000
-        
-        # Location multipliers for cleanup costs
-        location_multipliers = {
-            'open_ocean': 1.0,
-            'coastal': 2.0,
-            'estuary': 2.5,
-            'reef': 3.0,
-            'wetland': 2.5,
-            'river': 2.0,
-            'port': 1.8
-        }
-        
-        # Default to open ocean if location type not recognized
-        location_mult = location_multipliers.get(location_type, 1.0)
+        # Location multiplier for cleanup costs and the affected sectors;
+        # unrecognized locations are costed like open ocean without sector losses
+        location_mult, flags = _ECON_ROWS.get(location_type, _ECON_UNKNOWN_ROW)
+        oil = self.oil
         
         # Oil specific cleanup difficulty
-        cleanup_difficulty = self.oil_properties.get('cleanup_difficulty', 3.0) / 3.0
+        cleanup_difficulty = oil.cleanup_difficulty / 3.0
         
         # Calculate cleanup cost
-        cleanup_cost = (
-            self.volume_barrels * 
-            base_cleanup_cost_per_barrel * 
-            location_mult * 
-            cleanup_difficulty
-        )
+        cleanup_cost = self._base_cleanup_cost * location_mult
         
         # Calculate environmental damage cost (more abstract)
         surface_area = self.calculate_surface_area()
         environmental_damage = surface_area * 500000 * self.environmental_sensitivity
         
         # Calculate economic losses by sector
-        tourism_impact = 0
-        fishery_impact = 0
-        shipping_impact = 0
+        tourism_impact = 0.0
+        fishery_impact = 0.0
+        shipping_impact = 0.0
         
-        if location_type in ['coastal', 'reef', 'estuary']:
+        if flags & _ECON_TOURISM:
             # Tourism impacts for coastal areas
             tourism_impact = surface_area * 100000 * location_mult
-            
-        if location_type in ['coastal', 'estuary', 'river', 'reef']:
+        
+        if flags & _ECON_FISHERY:
             # Fishery impacts
-            fishery_impact = surface_area * 50000 * self.oil_properties.get('toxicity', 0.6)
-            
-        if location_type in ['port', 'river']:
+            fishery_impact = surface_area * 50000 * oil.toxicity
+        
+        if flags & _ECON_SHIPPING:
             # Shipping/port impacts
             shipping_impact = 500000 * cleanup_difficulty * location_mult
         
@@ -359,7 +687,7 @@ class ImpactEstimator:
         total_economic_impact = cleanup_cost + environmental_damage + tourism_impact + fishery_impact + shipping_impact
         
         # Compile economic impact summary
-        economic_impact = {
+        return {
             'cleanup_cost_usd': int(cleanup_cost),
             'environmental_damage_usd': int(environmental_damage),
             'tourism_impact_usd': int(tourism_impact),
@@ -368,5 +696,95 @@ class ImpactEstimator:
             'total_economic_impact_usd': int(total_economic_impact),
             'cost_per_barrel_usd': int(total_economic_impact / self.volume_barrels)
         }
+    
+    def estimate_economic_impact_batch(self, location_idx):
+        """
+        Estimate the economic impact of this spill at many locations at once.
+        
+        Args:
+            location_idx (array_like): Indices into LOCATION_TYPES, e.g. from
+                location_indices(); UNKNOWN_LOCATION is costed like open ocean
+                without sector losses
+            
+        Returns:
+            dict: Economic impact metrics in USD as int64 arrays, keyed like
+                estimate_economic_impact()
+        """
+        loc = np.asarray(location_idx, dtype=np.intp)
+        
+        # Location multiplier for cleanup costs and the affected sectors
+        location_mult = _ECON_LOC_MULT[loc]
+        flags = _ECON_FLAGS[loc]
+        
+        # Oil specific cleanup difficulty
+        cleanup_difficulty = self.oil.cleanup_difficulty / 3.0
         
-        return economic_impact
\ No newline at end of file
+        # Calculate cleanup cost
+        cleanup_cost = self._base_cleanup_cost * location_mult
+        
+        # Calculate environmental damage cost (more abstract)
+        surface_area = self.calculate_surface_area()
+        environmental_damage = surface_area * 500000 * self.environmental_sensitivity
+        
+        # Calculate economic losses by sector, zero where a sector is unaffected
+        # Tourism impacts for coastal areas
+        tourism_impact = np.where(flags & _ECON_TOURISM, surface_area * 100000 * location_mult, 0.0)
+        
+        # Fishery impacts
+        fishery_impact = np.where(
+            flags & _ECON_FISHERY, surface_area * 50000 * self.oil.toxicity, 0.0
+        )
+        
+        # Shipping/port impacts
+        shipping_impact = np.where(flags & _ECON_SHIPPING, 500000 * cleanup_difficulty * location_mult, 0.0)
+        
+        # Total economic impact
+        total_economic_impact = cleanup_cost + environmental_damage + tourism_impact + fishery_impact + shipping_impact
+        
+        # Compile economic impact summary
+        economic_impact = {
+            'cleanup_cost_usd': cleanup_cost.astype(np.int64),
+            'environmental_damage_usd': np.full(loc.shape, int(environmental_damage), dtype=np.int64),
+            'tourism_impact_usd': tourism_impact.astype(np.int64),
+            'fishery_impact_usd': fishery_impact.astype(np.int64),
+            'shipping_impact_usd': shipping_impact.astype(np.int64),
+            'total_economic_impact_usd': total_economic_impact.astype(np.int64),
+            'cost_per_barrel_usd': (total_economic_impact / self.volume_barrels).astype(np.int64)
+        }
+        
+        return economic_impact
+
+
+@functools.lru_cache(maxsize=1024)
+def summary_cached(volume_bbl, oil, time_h, wind, temp, wave, sensitivity):
+    """
+    Impact summary for one spill scenario, cached for repeated queries.
+    
+    The cleanup time is cached before its natural variation, so the
+    shared value does not freeze one random draw for every estimator.
+    
+    Args:
+        volume_bbl (float): Volume of oil spilled in barrels
+        oil (OilProperties): Oil properties record
+        time_h (float): Time since spill in hours
+        wind (float): Wind speed in km/h
+        temp (float): Water temperature in °C
+        wave (float): Wave height in meters
+        sensitivity (float): Environmental sensitivity factor
+        
+    Returns:
+        dict: Summary as returned by ImpactEstimator.get_impact_summary(),
+              with cleanup_time_days before natural variation and the
+              1-day floor; shared between calls, so do not modify it
+    """
+    model = OilDispersalModel(
+        volume_bbl, oil._asdict(), time_hours=time_h,
+        wind_speed=wind, water_temp=temp, wave_height=wave
+    )
+
+    return ImpactEstimator(model, sensitivity)._compute_impact_summary()
+
+
+def clear_impact_cache():
+    """Empty the summary_cached() cache."""
+    summary_cached.cache_clear()
@@ -0,0 +1,55 @@
+"""
+Oil Property Records
+--------------------
+Immutable record of the oil properties the models read, built once from
+an oil type dict with the models' defaults applied.
+"""
+
+from typing import NamedTuple
+
+
+class OilProperties(NamedTuple):
+    """
+    Oil properties used by OilDispersalModel and ImpactEstimator.
+    
+    Missing properties take the defaults below; read fields as attributes
+    instead of looking them up with ``dict.get`` on every use.
+    """
+    
+    name: str = 'Unknown'
+    density: float = 0.9  # g/cm³
+    viscosity: float = 50.0  # cP
+    surface_tension: float = 25.0  # mN/m
+    evaporation_rate: float = 0.3
+    solubility: float = 0.01
+    persistence_factor: float = 0.8
+    cleanup_difficulty: float = 3.0
+    co2_emission_factor: float = 3.0  # metric tons CO2 per barrel
+    toxicity: float = 0.6
+    environmental_toxicity: str = None  # Qualitative rating, e.g. 'moderate'
+    
+    @classmethod
+    def from_dict(cls, properties):
+        """
+        Build the record from an oil type dict, as in the oil types file.
+        
+        Args:
+            properties (dict): Physical and chemical properties of the oil;
+                keys other than the record fields are ignored
+            
+        Returns:
+            OilProperties: The record, with numeric fields as floats
+        """
+        return cls._make([
+            (float(properties[name]) if is_float else properties[name])
+            if name in properties else default
+            for name, is_float, default in _FIELD_TABLE
+        ])
+
+
+# Name, float flag and default of each field in order, looked up once
+# instead of introspecting the record on every from_dict call
+_FIELD_TABLE = tuple(
+    (name, OilProperties.__annotations__[name] is float, OilProperties._field_defaults[name])
+    for name in OilProperties._fields
+)
@@ -7,16 +7,19 @@ import math
 import numpy as np
 from shapely.geometry import Polygon
 
-from models.dispersal_model import OilDispersalModel
+from models.dispersal_model import AffectedArea, OilDispersalModel
+from models._fay_kernel import _fay_kernel, run_batch
+from utils.data_handler import build_oil_table
 
 
 class TestDispersalModel(unittest.TestCase):
     """Test cases for the OilDispersalModel class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a mock oil properties dictionary for testing
-        self.oil_properties = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests."""
+        # Mock oil properties for testing; each test works on its own copy
+        cls._base_props = {
             'name': 'Test Oil',
             'density': 0.85,
             'viscosity': 10.0,
@@ -25,8 +28,13 @@ class TestDispersalModel(unittest.TestCase):
             'solubility': 0.02,
             'persistence_factor': 0.7
         }
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.oil_properties = dict(self._base_props)
         
-        # Create a dispersal model instance for testing
+        # Create a dispersal model instance for testing; tests may reassign
+        # its inputs freely, as every test gets a fresh one
         self.model = OilDispersalModel(
             volume=1000,  # 1000 barrels
             oil_properties=self.oil_properties,
@@ -50,14 +58,31 @@ class TestDispersalModel(unittest.TestCase):
         self.assertEqual(self.model.viscosity, 10.0)
         self.assertEqual(self.model.surface_tension, 25.0)
         self.assertEqual(self.model.evaporation_rate, 0.3)
+        
+        # The oil record carries the given properties and the defaults
+        self.assertEqual(self.model.oil.name, 'Test Oil')
+        self.assertEqual(self.model.oil.solubility, 0.02)
+        self.assertEqual(self.model.oil.cleanup_difficulty, 3.0)
+        self.assertIsNone(self.model.oil.environmental_toxicity)
+    
+    def test_reassigned_oil_inputs(self):
+        """Test that reassigned oil inputs update the oil record."""
+        model = OilDispersalModel(volume=1000, oil_properties=self.oil_properties)
+        area = model.calculate_affected_area(simulate=False).area_km2
+        
+        model.viscosity = 500
+        self.assertEqual(model.oil.viscosity, 500.0)
+        self.assertEqual(model.viscosity, 500.0)
+        self.assertEqual(model.oil.density, 0.85)
+        self.assertNotEqual(model.calculate_affected_area(simulate=False).area_km2, area)
     
     def test_calculate_affected_area(self):
         """Test that affected area calculation returns expected structure."""
         lat, lon = 45.0, -75.0
         area_info = self.model.calculate_affected_area(lat, lon)
         
-        # Check that we get a dictionary with expected keys
-        self.assertIsInstance(area_info, dict)
+        # Check that we get a result record with expected keys
+        self.assertIsInstance(area_info, AffectedArea)
         self.assertIn('area_km2', area_info)
         self.assertIn('center', area_info)
         self.assertIn('thickness', area_info)
@@ -73,6 +98,12 @@ class TestDispersalModel(unittest.TestCase):
         self.assertIsInstance(area_info['dissolved'], float)
         self.assertIsInstance(area_info['polygon'], Polygon)
         
+        # Fields are attributes; item access mirrors them
+        self.assertEqual(area_info.area_km2, area_info['area_km2'])
+        self.assertEqual(area_info.get('color', 'none'), 'none')
+        with self.assertRaises(KeyError):
+            area_info['color']
+        
         # Check that the area is positive
         self.assertGreater(area_info['area_km2'], 0)
         
@@ -155,6 +186,21 @@ class TestDispersalModel(unittest.TestCase):
         distance_degrees = math.sqrt((centroid.x - lon)**2 + (centroid.y - lat)**2)
         self.assertLess(distance_degrees, 0.1)  # Should be within 0.1 degrees
     
+    def test_spill_coords(self):
+        """Test that the polygon is built lazily from the perimeter coordinates."""
+        self.assertIsNone(self.model.spill_polygon)
+        
+        area_info = self.model.calculate_affected_area(45.0, -75.0)
+        coords = area_info['coords']
+        
+        # One (lon, lat) row per perimeter point, matching the polygon outline
+        self.assertEqual(coords.shape, (36, 2))
+        self.assertIs(area_info['polygon'], self.model.spill_polygon)
+        np.testing.assert_allclose(np.asarray(area_info['polygon'].exterior.coords)[:-1], coords)
+        
+        # The bounding box is stored with the outline
+        np.testing.assert_allclose(area_info['bounds'], area_info['polygon'].bounds)
+    
     def test_get_volume_fractions(self):
         """Test that volume fractions sum to 1."""
         fractions = self.model.get_volume_fractions()
@@ -175,6 +221,17 @@ class TestDispersalModel(unittest.TestCase):
         # Check that fractions sum to 1 (within floating point precision)
         total = fractions['evaporated'] + fractions['dissolved'] + fractions['surface']
         self.assertAlmostEqual(total, 1.0, places=10)
+        
+        # Fields are attributes; to_dict gives the former dict
+        self.assertEqual(fractions.to_dict(), {
+            'evaporated': fractions.evaporated,
+            'dissolved': fractions.dissolved,
+            'surface': fractions.surface
+        })
+        
+        # Reassigning an input refreshes the cached fractions
+        self.model.time_hours = 48
+        self.assertGreater(self.model.get_volume_fractions().evaporated, fractions.evaporated)
     
     def test_time_dependence(self):
         """Test that the model results change with time."""
@@ -230,6 +287,96 @@ class TestDispersalModel(unittest.TestCase):
         # Heavy oil should have thicker slick
         self.assertGreater(heavy_area['thickness'], light_area['thickness'])
 
+    def test_calculate_affected_area_batch(self):
+        """Test that the batch API matches the scalar model spill by spill."""
+        times = np.array([6.0, 24.0, 72.0])
+        props = self.oil_properties
+
+        batch = OilDispersalModel.calculate_affected_area_batch(
+            volumes=1000,
+            densities=props['density'],
+            viscosities=props['viscosity'],
+            surface_tensions=props['surface_tension'],
+            evap_rates=props['evaporation_rate'],
+            solubilities=props['solubility'],
+            temps=15.0,
+            winds=10.0,
+            waves=0.5,
+            times=times,
+            lats=45.0,
+            lons=-75.0
+        )
+
+        # Scalar inputs broadcast to the shape of the array inputs
+        for key in ('area_km2', 'lat', 'lon', 'thickness', 'evaporated', 'dissolved'):
+            self.assertEqual(batch[key].shape, times.shape)
+
+        for i, hours in enumerate(times):
+            model = OilDispersalModel(1000, props, time_hours=hours)
+            expected = model.calculate_affected_area(45.0, -75.0, simulate=False)
+
+            self.assertAlmostEqual(batch['area_km2'][i], expected['area_km2'], places=10)
+            self.assertAlmostEqual(batch['thickness'][i], expected['thickness'], places=10)
+            self.assertAlmostEqual(batch['evaporated'][i], expected['evaporated'], places=10)
+            self.assertAlmostEqual(batch['dissolved'][i], expected['dissolved'], places=10)
+
+    
+    def test_fay_kernel_matches_model(self):
+        """Test that the raw-input kernel reproduces the model's results."""
+        props = self.oil_properties
+        area_km2, thickness, evaporated, dissolved = _fay_kernel(
+            self.model.volume_m3, props['density'], props['viscosity'],
+            props['surface_tension'], props['evaporation_rate'], props['solubility'],
+            24.0, 10.0, 15.0, 0.5
+        )
+        expected = self.model.calculate_affected_area(45.0, -75.0, simulate=False)
+        
+        self.assertAlmostEqual(area_km2, expected['area_km2'], places=10)
+        self.assertAlmostEqual(thickness, expected['thickness'], places=10)
+        self.assertAlmostEqual(evaporated, expected['evaporated'], places=10)
+        self.assertAlmostEqual(dissolved, expected['dissolved'], places=10)
+
+    
+    def test_run_batch(self):
+        """Test that the threaded driver matches the scalar kernel."""
+        props = self.oil_properties
+        spills = [
+            (self.model.volume_m3 * scale, props['density'], props['viscosity'],
+             props['surface_tension'], props['evaporation_rate'], props['solubility'],
+             hours, 10.0, 15.0, 0.5)
+            for scale in (0.5, 1.0, 2.0) for hours in (6.0, 24.0, 72.0)
+        ]
+        
+        results = run_batch(spills, max_workers=4)
+        
+        self.assertEqual(results.shape, (len(spills), 4))
+        for spill, row in zip(spills, results):
+            np.testing.assert_allclose(row, _fay_kernel(*spill), rtol=1e-12)
+    
+    def test_from_index(self):
+        """Test building models and batches from the float32 oil table."""
+        table, index = build_oil_table({'test': self.oil_properties})
+        model = OilDispersalModel.from_index(
+            1000, table, index['test'],
+            time_hours=24, wind_speed=10.0, water_temp=15.0, wave_height=0.5
+        )
+        expected = self.model.calculate_affected_area(45.0, -75.0, simulate=False)
+        actual = model.calculate_affected_area(45.0, -75.0, simulate=False)
+        
+        # float32 storage only perturbs the properties in the 7th digit
+        self.assertAlmostEqual(model.density, 0.85, places=6)
+        self.assertAlmostEqual(actual['area_km2'], expected['area_km2'], delta=1e-5 * expected['area_km2'])
+        
+        # A batch over float32 columns stays in float32
+        f4 = np.float32
+        batch = OilDispersalModel.calculate_affected_area_batch(
+            f4(1000), table['density'], table['viscosity'], table['surface_tension'],
+            table['evaporation_rate'], table['solubility'],
+            f4(15.0), f4(10.0), f4(0.5), f4(24.0), f4(45.0), f4(-75.0)
+        )
+        self.assertEqual(batch['area_km2'].dtype, np.float32)
+        self.assertAlmostEqual(float(batch['area_km2'][0]), expected['area_km2'], delta=1e-4 * expected['area_km2'])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,17 +5,22 @@ Tests for the geospatial utility functions.
 import unittest
 import math
 import numpy as np
-from shapely.geometry import Point, Polygon
+import shapely
+from shapely.geometry import Polygon
 
 from utils.geo_utils import (
     validate_coordinates,
+    validate_coordinates_array,
     calculate_distance,
     calculate_area_from_polygon,
     convert_coordinates_to_pixels,
+    convert_coordinates_to_pixels_vec,
     create_grid_points,
     get_lat_lon_bounds,
     calculate_bearing,
-    get_destination_point
+    bearing_and_distance,
+    get_destination_point,
+    get_destination_points
 )
 
 
@@ -44,6 +49,11 @@ class TestGeoUtils(unittest.TestCase):
         # Edge cases
         self.assertTrue(validate_coordinates(90, 180))  # Exactly at the limits
         self.assertTrue(validate_coordinates(-90, -180))  # Exactly at the limits
+        
+        # Bulk validation: valid only if every point is
+        self.assertTrue(validate_coordinates_array(np.array([0, 90, -45.5]), np.array([0, -180, 120.5])))
+        self.assertFalse(validate_coordinates_array(np.array([0, 91]), np.array([0, 0])))
+        self.assertFalse(validate_coordinates_array(np.array([0, 0]), np.array([-181, 0])))
     
     def test_calculate_distance(self):
         """Test the distance calculation function."""
@@ -67,6 +77,16 @@ class TestGeoUtils(unittest.TestCase):
         dist1 = calculate_distance(ny_lat, ny_lon, la_lat, la_lon)
         dist2 = calculate_distance(la_lat, la_lon, ny_lat, ny_lon)
         self.assertEqual(dist1, dist2)
+        
+        # Arrays are computed in one call and match the scalar results
+        distances = calculate_distance(
+            ny_lat, ny_lon, np.array([la_lat, london_lat]), np.array([la_lon, london_lon])
+        )
+        np.testing.assert_allclose(
+            distances,
+            [ny_to_la, calculate_distance(ny_lat, ny_lon, london_lat, london_lon)],
+            rtol=1e-12
+        )
     
     def test_calculate_area_from_polygon(self):
         """Test the polygon area calculation function."""
@@ -87,10 +107,36 @@ class TestGeoUtils(unittest.TestCase):
         area = calculate_area_from_polygon(complex_polygon, 0.5)
         self.assertGreater(area, 0)
         
+        # Ring orientation does not matter, and holes are subtracted
+        clockwise_square = Polygon([(0, 0), (0, 1), (1, 1), (1, 0), (0, 0)])
+        self.assertAlmostEqual(
+            calculate_area_from_polygon(clockwise_square, 0.5),
+            calculate_area_from_polygon(square_at_equator, 0.5)
+        )
+        square_with_hole = Polygon(
+            [(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)],
+            [[(0.25, 0.25), (0.75, 0.25), (0.75, 0.75), (0.25, 0.75), (0.25, 0.25)]]
+        )
+        area_with_hole = calculate_area_from_polygon(square_with_hole, 0.5)
+        self.assertAlmostEqual(
+            area_with_hole / calculate_area_from_polygon(square_at_equator, 0.5), 0.75, delta=0.01
+        )
+        
         # Test with an empty polygon
         empty_polygon = Polygon()
         area = calculate_area_from_polygon(empty_polygon, 0.5)
         self.assertEqual(area, 0)
+        
+        # Arrays of polygons give one area each
+        if hasattr(shapely, 'polygons'):
+            offsets = np.array([0.0, 10.0, 40.0])
+            unit_square = np.array([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)], dtype=float)
+            polygons = shapely.polygons(unit_square + offsets[:, None, None])
+            areas = calculate_area_from_polygon(polygons, 0.5)
+            self.assertEqual(areas.shape, (3,))
+            self.assertAlmostEqual(areas[0], calculate_area_from_polygon(square_at_equator, 0.5))
+            self.assertGreater(areas[0], areas[1])  # Degree squares shrink away from the equator
+            self.assertGreater(areas[1], areas[2])
     
     def test_convert_coordinates_to_pixels(self):
         """Test conversion of coordinates to pixel positions."""
@@ -112,6 +158,22 @@ class TestGeoUtils(unittest.TestCase):
         # Test point outside bounds
         outside_point = convert_coordinates_to_pixels(100, 0, bounds, width, height)
         self.assertIsNone(outside_point)
+        
+        # Arrays convert in one call, NaN marking points outside bounds
+        x_px, y_px = convert_coordinates_to_pixels(
+            np.array([0, 90, -90, 100]), np.array([0, -180, 180, 0]), bounds, width, height
+        )
+        np.testing.assert_array_equal(x_px, [180, 0, 360, np.nan])
+        np.testing.assert_array_equal(y_px, [90, 0, 180, np.nan])
+        
+        # Integer indices with a validity mask, for rasterizing
+        x_idx, y_idx, valid = convert_coordinates_to_pixels_vec(
+            np.array([0, 90, -90, 100]), np.array([0, -180, 180, 0]), bounds, width, height
+        )
+        np.testing.assert_array_equal(valid, [True, True, True, False])
+        np.testing.assert_array_equal(x_idx[valid], x_px[valid])
+        np.testing.assert_array_equal(y_idx[valid], y_px[valid])
+        self.assertEqual(x_idx.dtype, np.int32)
     
     def test_create_grid_points(self):
         """Test creation of a grid of points around a center."""
@@ -141,6 +203,35 @@ class TestGeoUtils(unittest.TestCase):
         self.assertLess(min(lons), center_lon)
         self.assertGreater(max(lons), center_lon)
     
+    def test_create_sampled_grid_points(self):
+        """Test random sampling of points uniformly over the disc."""
+        center_lat, center_lon = 45.0, -75.0
+        radius_km = 10
+        num_points = 100
+        
+        points = create_grid_points(
+            center_lat, center_lon, radius_km, num_points,
+            grid=False, rng=np.random.default_rng(0)
+        )
+        
+        # Exactly the requested number of points, all within the radius
+        self.assertEqual(len(points), num_points)
+        lats, lons = np.array(points).T
+        distances = calculate_distance(center_lat, center_lon, lats, lons)
+        self.assertLessEqual(distances.max(), radius_km + 1e-9)
+        
+        # Uniform by area: about a quarter of the points in the inner half radius
+        self.assertLess(abs(np.mean(distances < radius_km / 2) - 0.25), 0.1)
+        
+        # Reproducible for a seeded generator
+        self.assertEqual(
+            create_grid_points(
+                center_lat, center_lon, radius_km, num_points,
+                grid=False, rng=np.random.default_rng(0)
+            ),
+            points
+        )
+    
     def test_get_lat_lon_bounds(self):
         """Test calculation of lat/lon bounds around a center point."""
         center_lat, center_lon = 45.0, -75.0
@@ -176,6 +267,14 @@ class TestGeoUtils(unittest.TestCase):
         # Ensure we don't exceed valid latitude range
         self.assertGreaterEqual(polar_min_lat, -90)
         self.assertLessEqual(polar_max_lat, 90)
+        
+        # At the pole the longitude radius is capped at one full turn
+        self.assertEqual(get_lat_lon_bounds(90.0, 0.0, radius_km)[::2], (-180, 180))
+        polar_grid = np.array(create_grid_points(90.0, 0.0, radius_km))
+        self.assertLessEqual(np.abs(polar_grid[:, 1]).max(), 360)
+        
+        # Repeated centers are served from the cache
+        self.assertIs(get_lat_lon_bounds(center_lat, center_lon, radius_km), bounds)
     
     def test_calculate_bearing(self):
         """Test calculation of bearing between two points."""
@@ -224,27 +323,27 @@ class TestGeoUtils(unittest.TestCase):
         distance = calculate_distance(start_lat, start_lon, dest_lat, dest_lon)
         self.assertAlmostEqual(distance, distance_km, delta=0.1)
         
-        # Test each cardinal direction
-        for bearing, expected_direction in [
-            (0, 'north'),    # North
-            (90, 'east'),    # East
-            (180, 'south'),  # South
-            (270, 'west')    # West
-        ]:
-            dest_lat, dest_lon = get_destination_point(start_lat, start_lon, bearing, distance_km)
-            
-            if expected_direction == 'north':
-                self.assertGreater(dest_lat, start_lat)
-                self.assertAlmostEqual(dest_lon, start_lon, delta=0.001)
-            elif expected_direction == 'east':
-                self.assertAlmostEqual(dest_lat, start_lat, delta=0.001)
-                self.assertGreater(dest_lon, start_lon)
-            elif expected_direction == 'south':
-                self.assertLess(dest_lat, start_lat)
-                self.assertAlmostEqual(dest_lon, start_lon, delta=0.001)
-            elif expected_direction == 'west':
-                self.assertAlmostEqual(dest_lat, start_lat, delta=0.001)
-                self.assertLess(dest_lon, start_lon)
+        # Test each cardinal direction in one vectorized call
+        dest_lats, dest_lons = get_destination_points(
+            start_lat, start_lon, np.array([0, 90, 180, 270]), distance_km
+        )
+        north, east, south, west = 0, 1, 2, 3
+        
+        self.assertGreater(dest_lats[north], start_lat)
+        self.assertAlmostEqual(dest_lons[north], start_lon, delta=0.001)
+        self.assertAlmostEqual(dest_lats[east], start_lat, delta=0.001)
+        self.assertGreater(dest_lons[east], start_lon)
+        self.assertLess(dest_lats[south], start_lat)
+        self.assertAlmostEqual(dest_lons[south], start_lon, delta=0.001)
+        self.assertAlmostEqual(dest_lats[west], start_lat, delta=0.001)
+        self.assertLess(dest_lons[west], start_lon)
+        
+        # Same destinations as the broadcasting calculation
+        np.testing.assert_allclose(
+            (dest_lats, dest_lons),
+            get_destination_point(start_lat, start_lon, np.array([0, 90, 180, 270]), distance_km),
+            atol=1e-12
+        )
         
         # Test with a real-world origin
         sydney_lat, sydney_lon = -33.8688, 151.2093
@@ -252,13 +351,21 @@ class TestGeoUtils(unittest.TestCase):
         # Go 100 km northeast from Sydney
         dest_lat, dest_lon = get_destination_point(sydney_lat, sydney_lon, 45, 100)
         
-        # Distance should be approximately 100 km
-        distance = calculate_distance(sydney_lat, sydney_lon, dest_lat, dest_lon)
+        # Distance should be approximately 100 km, and the bearing from
+        # Sydney to the destination approximately 45 degrees
+        reverse_bearing, distance = bearing_and_distance(sydney_lat, sydney_lon, dest_lat, dest_lon)
         self.assertAlmostEqual(distance, 100, delta=1)
-        
-        # Bearing from Sydney to destination should be approximately 45 degrees
-        reverse_bearing = calculate_bearing(sydney_lat, sydney_lon, dest_lat, dest_lon)
         self.assertAlmostEqual(reverse_bearing, 45, delta=1)
+        
+        # Same as the separate calculations, for scalars and arrays
+        self.assertAlmostEqual(distance, calculate_distance(sydney_lat, sydney_lon, dest_lat, dest_lon), places=9)
+        self.assertAlmostEqual(reverse_bearing, calculate_bearing(sydney_lat, sydney_lon, dest_lat, dest_lon), places=9)
+        
+        dest_lats = np.array([dest_lat, 0.0, -90.0])
+        dest_lons = np.array([dest_lon, 0.0, 10.0])
+        bearings, distances = bearing_and_distance(sydney_lat, sydney_lon, dest_lats, dest_lons)
+        np.testing.assert_allclose(distances, calculate_distance(sydney_lat, sydney_lon, dest_lats, dest_lons))
+        np.testing.assert_allclose(bearings, calculate_bearing(sydney_lat, sydney_lon, dest_lats, dest_lons))
 
 
 if __name__ == '__main__':
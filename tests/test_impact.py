@@ -3,93 +3,108 @@ Tests for the oil spill impact estimator.
 """
 
 import unittest
+from types import MappingProxyType
+
 import numpy as np
 
 from models.dispersal_model import OilDispersalModel
-from models.impact_estimator import ImpactEstimator
+from models.impact_estimator import ImpactEstimator, _CLEANUP_NOISE, clear_impact_cache, summary_cached
+from models.impact_batch import compute_impacts
+from utils.data_handler import build_oil_table
+
+
+# Mock oil properties for testing; read-only, tests that vary them copy it
+_OIL_PROPS = MappingProxyType({
+    'name': 'Test Oil',
+    'density': 0.85,
+    'viscosity': 10.0,
+    'surface_tension': 25.0,
+    'evaporation_rate': 0.3,
+    'solubility': 0.02,
+    'persistence_factor': 0.7,
+    'co2_emission_factor': 3.0,
+    'cleanup_difficulty': 3.0,
+    'environmental_toxicity': 'moderate'
+})
+
+_BASE_DISPERSAL_KWARGS = {
+    'volume': 1000,  # 1000 barrels
+    'oil_properties': _OIL_PROPS,
+    'time_hours': 24,
+    'wind_speed': 10.0,
+    'water_temp': 15.0,
+    'wave_height': 0.5
+}
+
+
+def _make_estimator(sensitivity=1.0):
+    """Build a fresh dispersal model and estimator for the base spill."""
+    return ImpactEstimator(
+        dispersal_model=OilDispersalModel(**_BASE_DISPERSAL_KWARGS),
+        environmental_sensitivity=sensitivity
+    )
 
 
 class TestImpactEstimator(unittest.TestCase):
     """Test cases for the ImpactEstimator class."""
     
+    oil_properties = _OIL_PROPS
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests."""
+        # One model shared by every test that leaves its inputs alone; tests
+        # that touch estimator caches wrap it in an estimator of their own
+        cls._base_estimator = _make_estimator()
+        cls._base_dispersal = cls._base_estimator.dispersal_model
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create a mock oil properties dictionary for testing
-        self.oil_properties = {
-            'name': 'Test Oil',
-            'density': 0.85,
-            'viscosity': 10.0,
-            'surface_tension': 25.0,
-            'evaporation_rate': 0.3,
-            'solubility': 0.02,
-            'persistence_factor': 0.7,
-            'co2_emission_factor': 3.0,
-            'cleanup_difficulty': 3.0,
-            'environmental_toxicity': 'moderate'
-        }
-        
-        # Create a dispersal model instance for testing
-        self.dispersal_model = OilDispersalModel(
-            volume=1000,  # 1000 barrels
-            oil_properties=self.oil_properties,
-            time_hours=24,
-            wind_speed=10.0,
-            water_temp=15.0,
-            wave_height=0.5
-        )
-        
-        # Create an impact estimator instance
-        self.impact_estimator = ImpactEstimator(
-            dispersal_model=self.dispersal_model,
-            environmental_sensitivity=1.0
-        )
+        # Summaries are shared between estimators; start each test afresh
+        clear_impact_cache()
     
     def test_initialization(self):
         """Test that the estimator initializes correctly with given parameters."""
-        self.assertEqual(self.impact_estimator.dispersal_model, self.dispersal_model)
-        self.assertEqual(self.impact_estimator.environmental_sensitivity, 1.0)
-        self.assertEqual(self.impact_estimator.oil_properties, self.oil_properties)
-        self.assertEqual(self.impact_estimator.volume_m3, 1000 * 0.159)
-        self.assertEqual(self.impact_estimator.volume_barrels, 1000)
+        self.assertEqual(self._base_estimator.dispersal_model, self._base_dispersal)
+        self.assertEqual(self._base_estimator.environmental_sensitivity, 1.0)
+        self.assertEqual(self._base_estimator.oil_properties, self.oil_properties)
+        self.assertEqual(self._base_estimator.volume_m3, 1000 * 0.159)
+        self.assertEqual(self._base_estimator.volume_barrels, 1000)
     
     def test_calculate_surface_area(self):
         """Test surface area calculation."""
+        model = self._base_dispersal
+        estimator = ImpactEstimator(model)
+        
         # Calculate surface area
-        surface_area = self.impact_estimator.calculate_surface_area()
+        surface_area = estimator.calculate_surface_area()
         
         # Surface area should be positive
         self.assertGreater(surface_area, 0)
         
         # Surface area should match what's in the dispersal model
-        affected_area = self.dispersal_model.calculate_affected_area()
+        affected_area = model.calculate_affected_area()
         self.assertEqual(surface_area, affected_area['area_km2'])
+        self.assertEqual(estimator.get_affected_area().area_km2, surface_area)
         
         # Test caching - should return the same value without recalculating
-        self.impact_estimator._surface_area = 123.456
-        self.assertEqual(self.impact_estimator.calculate_surface_area(), 123.456)
+        estimator._surface_area = 123.456
+        self.assertEqual(estimator.calculate_surface_area(), 123.456)
     
     def test_calculate_co2_emissions(self):
         """Test CO2 emissions calculation."""
+        estimator = ImpactEstimator(self._base_dispersal)
+        
         # Calculate CO2 emissions
-        co2_emissions = self.impact_estimator.calculate_co2_emissions()
+        co2_emissions = estimator.calculate_co2_emissions()
         
         # CO2 emissions should be positive
         self.assertGreater(co2_emissions, 0)
         
         # Check that emissions scale with volume
-        large_dispersal_model = OilDispersalModel(
-            volume=10000,  # 10x more
-            oil_properties=self.oil_properties,
-            time_hours=24,
-            wind_speed=10.0,
-            water_temp=15.0,
-            wave_height=0.5
-        )
-        
-        large_impact_estimator = ImpactEstimator(
-            dispersal_model=large_dispersal_model,
-            environmental_sensitivity=1.0
-        )
+        large_impact_estimator = estimator.with_scaled_volume(10)  # 10x more
+        self.assertAlmostEqual(large_impact_estimator.volume_barrels, 10000)
+        self.assertEqual(estimator.volume_barrels, 1000)
         
         large_co2_emissions = large_impact_estimator.calculate_co2_emissions()
         
@@ -99,14 +114,31 @@ class TestImpactEstimator(unittest.TestCase):
         self.assertGreater(ratio, 8)  # Should be close to 10x
         self.assertLess(ratio, 12)
         
+        # The batch entry point matches the scalar result spill by spill
+        fractions = [
+            e.dispersal_model.get_volume_fractions()
+            for e in (estimator, large_impact_estimator)
+        ]
+        batch = ImpactEstimator.calculate_co2_emissions_batch(
+            [1000, 10000],
+            [f['evaporated'] for f in fractions],
+            [f['dissolved'] for f in fractions],
+            [f['surface'] for f in fractions],
+            self.oil_properties['co2_emission_factor']
+        )
+        np.testing.assert_allclose(batch, [co2_emissions, large_co2_emissions], rtol=1e-12)
+        
         # Test caching - should return the same value without recalculating
-        self.impact_estimator._co2_emissions = 123.456
-        self.assertEqual(self.impact_estimator.calculate_co2_emissions(), 123.456)
+        estimator._co2_emissions = 123.456
+        self.assertEqual(estimator.calculate_co2_emissions(), 123.456)
     
     def test_estimate_cleanup_time(self):
         """Test cleanup time estimation."""
+        model = self._base_dispersal
+        estimator = ImpactEstimator(model)
+        
         # Estimate cleanup time
-        cleanup_time = self.impact_estimator.estimate_cleanup_time()
+        cleanup_time = estimator.estimate_cleanup_time()
         
         # Cleanup time should be positive
         self.assertGreater(cleanup_time, 0)
@@ -139,7 +171,7 @@ class TestImpactEstimator(unittest.TestCase):
         
         # Check that cleanup time is affected by environmental sensitivity
         sensitive_impact_estimator = ImpactEstimator(
-            dispersal_model=self.dispersal_model,
+            dispersal_model=model,
             environmental_sensitivity=2.0  # More sensitive
         )
         
@@ -148,13 +180,29 @@ class TestImpactEstimator(unittest.TestCase):
         # More sensitive areas should take longer to clean up
         self.assertGreater(sensitive_cleanup_time, cleanup_time)
         
+        # The batch entry point matches the scalar estimate for the same draws
+        props = self.oil_properties
+        _CLEANUP_NOISE.reseed(7)
+        batch = ImpactEstimator.estimate_cleanup_time_batch(
+            [1000, 1000], props['viscosity'], props['persistence_factor'],
+            props['cleanup_difficulty'], 0.5, 10.0, 15.0,
+            estimator.calculate_surface_area()
+        )
+        _CLEANUP_NOISE.reseed(7)
+        first = ImpactEstimator(model).estimate_cleanup_time()
+        self.assertAlmostEqual(batch[0], first, places=9)
+        
         # Test caching - should return the same value without recalculating
-        self.impact_estimator._cleanup_time = 123.456
-        self.assertEqual(self.impact_estimator.estimate_cleanup_time(), 123.456)
+        estimator._cleanup_time = 123.456
+        self.assertEqual(estimator.estimate_cleanup_time(), 123.456)
     
     def test_get_impact_summary(self):
         """Test that impact summary contains all expected information."""
-        summary = self.impact_estimator.get_impact_summary()
+        # Changes the model's inputs below, so it gets a model of its own
+        estimator = _make_estimator()
+        model = estimator.dispersal_model
+        
+        summary = estimator.get_impact_summary()
         
         # Check that the summary contains all expected keys
         expected_keys = [
@@ -169,29 +217,122 @@ class TestImpactEstimator(unittest.TestCase):
             'environmental_sensitivity'
         ]
         
-        for key in expected_keys:
-            self.assertIn(key, summary)
+        missing = set(expected_keys) - summary.keys()
+        self.assertFalse(missing, f"missing keys: {missing}")
         
         # Check that values are of expected types
-        self.assertIsInstance(summary['volume_barrels'], float)
-        self.assertIsInstance(summary['volume_m3'], float)
-        self.assertIsInstance(summary['surface_area_km2'], float)
-        self.assertIsInstance(summary['co2_emissions_tons'], float)
-        self.assertIsInstance(summary['cleanup_time_days'], float)
-        self.assertIsInstance(summary['oil_fractions'], dict)
-        self.assertIsInstance(summary['slick_thickness_mm'], float)
-        self.assertIsInstance(summary['oil_type'], str)
-        self.assertIsInstance(summary['environmental_sensitivity'], float)
+        expected_types = {
+            'volume_barrels': float,
+            'volume_m3': float,
+            'surface_area_km2': float,
+            'co2_emissions_tons': float,
+            'cleanup_time_days': float,
+            'oil_fractions': dict,
+            'slick_thickness_mm': float,
+            'oil_type': str,
+            'environmental_sensitivity': float
+        }
+        wrong_types = {
+            key: type(summary[key]).__name__
+            for key, expected_type in expected_types.items()
+            if not isinstance(summary[key], expected_type)
+        }
+        self.assertFalse(wrong_types, f"unexpected value types: {wrong_types}")
+
+        # Repeated calls reuse the cached summary, also across estimators;
+        # each estimator draws its own cleanup time variation
+        self.assertEqual(estimator.get_impact_summary(), summary)
+        other_estimator = ImpactEstimator(
+            OilDispersalModel(1000, self.oil_properties, time_hours=24), 1.0
+        )
+        other_summary = other_estimator.get_impact_summary()
+        self.assertEqual(summary_cached.cache_info().misses, 1)
+        self.assertEqual(
+            dict(other_summary, cleanup_time_days=None),
+            dict(summary, cleanup_time_days=None)
+        )
+        self.assertEqual(other_estimator.estimate_cleanup_time(), other_summary['cleanup_time_days'])
+        
+        # Oil property dicts with unhashable values are still cached by
+        # their normalized record
+        listed_properties = dict(self.oil_properties, components=['saturates', 'aromatics'])
+        listed_estimator = ImpactEstimator(
+            OilDispersalModel(1000, listed_properties, time_hours=24), 1.0
+        )
+        listed_estimator.get_impact_summary()
+        self.assertEqual(summary_cached.cache_info().misses, 1)
+
+        # Changing a model input invalidates it
+        model.water_temp = 25.0
+        warm_summary = estimator.get_impact_summary()
+        self.assertNotEqual(warm_summary['oil_fractions'], summary['oil_fractions'])
+
+        model.time_hours = 48
+        later_summary = estimator.get_impact_summary()
+        self.assertGreater(later_summary['oil_fractions']['evaporated'],
+                           warm_summary['oil_fractions']['evaporated'])
+        self.assertNotEqual(later_summary['surface_area_km2'], warm_summary['surface_area_km2'])
+
+    def test_summary_keeps_returned_estimates(self):
+        """Test that the summary agrees with estimates already returned."""
+        # Changes the model's inputs below, so it gets a model of its own
+        estimator = _make_estimator()
+        model = estimator.dispersal_model
+        
+        cleanup_time = estimator.estimate_cleanup_time()
+        self.assertEqual(estimator.get_impact_summary()['cleanup_time_days'], cleanup_time)
+        self.assertEqual(estimator.estimate_cleanup_time(), cleanup_time)
+        
+        # After an input change the summary and the methods agree again
+        model.time_hours = 48
+        summary = estimator.get_impact_summary()
+        self.assertEqual(estimator.estimate_cleanup_time(), summary['cleanup_time_days'])
+        self.assertEqual(estimator.calculate_surface_area(), summary['surface_area_km2'])
+        self.assertEqual(estimator.calculate_co2_emissions(), summary['co2_emissions_tons'])
+    
+    def test_summary_follows_reassigned_oil_inputs(self):
+        """Test that the summary follows oil inputs reassigned on the model."""
+        estimator = _make_estimator()
+        model = estimator.dispersal_model
+        estimator.get_impact_summary()
+        
+        model.density = 0.99
+        model.viscosity = 500.0
+        self.assertIs(estimator.oil, model.oil)
+        expected = model.calculate_affected_area(simulate=False).area_km2
+        
+        summary = estimator.get_impact_summary()
+        self.assertAlmostEqual(summary['surface_area_km2'], expected, places=9)
+        self.assertEqual(estimator.calculate_surface_area(), summary['surface_area_km2'])
+        
+        # A new estimator for the same model does not reuse the old entry
+        fresh_summary = ImpactEstimator(model).get_impact_summary()
+        self.assertAlmostEqual(fresh_summary['surface_area_km2'], expected, places=9)
+        self.assertAlmostEqual(
+            fresh_summary['co2_emissions_tons'], ImpactEstimator(model).calculate_co2_emissions(), places=9
+        )
+    
+    def test_summary_matches_estimates(self):
+        """Test that the summary's fused estimates match the separate methods."""
+        # Fresh estimators on the shared model, so nothing is cached yet
+        _CLEANUP_NOISE.reseed(3)
+        summary = ImpactEstimator(self._base_dispersal).get_impact_summary()
+        
+        _CLEANUP_NOISE.reseed(3)
+        estimator = ImpactEstimator(self._base_dispersal)
+        self.assertAlmostEqual(summary['co2_emissions_tons'], estimator.calculate_co2_emissions(), places=9)
+        self.assertAlmostEqual(summary['cleanup_time_days'], estimator.estimate_cleanup_time(), places=9)
     
     def test_estimate_wildlife_impact(self):
         """Test wildlife impact estimation."""
         # Estimate wildlife impact for different location types
-        ocean_impact = self.impact_estimator.estimate_wildlife_impact('open_ocean')
-        coastal_impact = self.impact_estimator.estimate_wildlife_impact('coastal')
-        reef_impact = self.impact_estimator.estimate_wildlife_impact('reef')
+        impacts = {
+            location: self._base_estimator.estimate_wildlife_impact(location)
+            for location in ('open_ocean', 'coastal', 'reef')
+        }
         
         # Check that we have the expected keys
-        expected_keys = [
+        expected_keys = {
             'location_type',
             'wildlife_density',
             'wildlife_vulnerability',
@@ -201,28 +342,34 @@ class TestImpactEstimator(unittest.TestCase):
             'marine_mammals_affected',
             'fish_affected',
             'long_term_ecosystem_impact'
-        ]
+        }
         
-        for key in expected_keys:
-            self.assertIn(key, ocean_impact)
+        for location, impact in impacts.items():
+            with self.subTest(location=location):
+                missing = expected_keys - impact.keys()
+                self.assertFalse(missing, f"missing keys: {missing}")
         
         # Coastal and reef areas should have higher impacts than open ocean
-        self.assertGreater(coastal_impact['wildlife_density'], ocean_impact['wildlife_density'])
-        self.assertGreater(coastal_impact['mortality_rate'], ocean_impact['mortality_rate'])
-        self.assertGreater(coastal_impact['birds_affected'], ocean_impact['birds_affected'])
-        
-        self.assertGreater(reef_impact['wildlife_density'], ocean_impact['wildlife_density'])
-        self.assertGreater(reef_impact['long_term_ecosystem_impact'], ocean_impact['long_term_ecosystem_impact'])
+        ocean_impact = impacts['open_ocean']
+        for location, keys in [
+            ('coastal', ('wildlife_density', 'mortality_rate', 'birds_affected')),
+            ('reef', ('wildlife_density', 'long_term_ecosystem_impact'))
+        ]:
+            for key in keys:
+                with self.subTest(location=location, key=key):
+                    self.assertGreater(impacts[location][key], ocean_impact[key])
     
     def test_estimate_economic_impact(self):
         """Test economic impact estimation."""
         # Estimate economic impact for different location types
-        ocean_impact = self.impact_estimator.estimate_economic_impact('open_ocean')
-        coastal_impact = self.impact_estimator.estimate_economic_impact('coastal')
-        port_impact = self.impact_estimator.estimate_economic_impact('port')
+        impacts = {
+            location: self._base_estimator.estimate_economic_impact(location)
+            for location in ('open_ocean', 'coastal', 'port')
+        }
+        ocean_impact = impacts['open_ocean']
         
         # Check that we have the expected keys
-        expected_keys = [
+        expected_keys = {
             'cleanup_cost_usd',
             'environmental_damage_usd',
             'tourism_impact_usd',
@@ -230,17 +377,19 @@ class TestImpactEstimator(unittest.TestCase):
             'shipping_impact_usd',
             'total_economic_impact_usd',
             'cost_per_barrel_usd'
-        ]
+        }
         
-        for key in expected_keys:
-            self.assertIn(key, ocean_impact)
+        for location, impact in impacts.items():
+            with self.subTest(location=location):
+                missing = expected_keys - impact.keys()
+                self.assertFalse(missing, f"missing keys: {missing}")
         
         # Coastal areas should have higher tourism and fishery impacts
-        self.assertGreater(coastal_impact['tourism_impact_usd'], ocean_impact['tourism_impact_usd'])
-        self.assertGreater(coastal_impact['fishery_impact_usd'], ocean_impact['fishery_impact_usd'])
+        self.assertGreater(impacts['coastal']['tourism_impact_usd'], ocean_impact['tourism_impact_usd'])
+        self.assertGreater(impacts['coastal']['fishery_impact_usd'], ocean_impact['fishery_impact_usd'])
         
         # Ports should have shipping impacts
-        self.assertGreater(port_impact['shipping_impact_usd'], 0)
+        self.assertGreater(impacts['port']['shipping_impact_usd'], 0)
         self.assertEqual(ocean_impact['shipping_impact_usd'], 0)
         
         # Total impact should be the sum of individual impacts
@@ -253,9 +402,78 @@ class TestImpactEstimator(unittest.TestCase):
         self.assertEqual(ocean_impact['total_economic_impact_usd'], total)
         
         # Cost per barrel should be total divided by barrels
-        cost_per_barrel = ocean_impact['total_economic_impact_usd'] / self.impact_estimator.volume_barrels
+        cost_per_barrel = ocean_impact['total_economic_impact_usd'] / self._base_estimator.volume_barrels
         self.assertEqual(ocean_impact['cost_per_barrel_usd'], int(cost_per_barrel))
 
+    
+    def test_impact_batches_match_scalar(self):
+        """Test that the batch estimators match the per-location methods."""
+        locations = ['open_ocean', 'coastal', 'reef', 'port', 'unknown']
+        location_idx = ImpactEstimator.location_indices(locations)
+        
+        wildlife = self._base_estimator.estimate_wildlife_impact_batch(location_idx)
+        economic = self._base_estimator.estimate_economic_impact_batch(location_idx)
+        
+        for i, location in enumerate(locations):
+            scalar_wildlife = self._base_estimator.estimate_wildlife_impact(location)
+            for key in ('birds_affected', 'fish_affected', 'mortality_rate', 'wildlife_density'):
+                self.assertEqual(wildlife[key][i], scalar_wildlife[key])
+            
+            scalar_economic = self._base_estimator.estimate_economic_impact(location)
+            for key, value in scalar_economic.items():
+                self.assertEqual(economic[key][i], value)
+        
+        # Ports have no wildlife data and unknown locations fall back to open ocean
+        self.assertEqual(
+            self._base_estimator.estimate_wildlife_impact('port')['location_type'], 'open_ocean'
+        )
+
+    
+    def test_compute_impacts(self):
+        """Test that the array-based batch matches per-spill estimators."""
+        heavy_oil_properties = dict(self.oil_properties, viscosity=500.0, cleanup_difficulty=5.0)
+        table, index = build_oil_table({'test': self.oil_properties, 'heavy': heavy_oil_properties})
+        
+        volumes = np.array([1000.0, 5000.0, 20000.0])
+        oil_idx = np.array([index['test'], index['heavy'], index['test']])
+        wind = np.array([10.0, 25.0, 5.0])
+        wave = np.array([0.5, 2.0, 0.2])
+        water_temp = np.array([15.0, 5.0, 25.0])
+        locations = ['open_ocean', 'coastal', 'port']
+        location_idx = ImpactEstimator.location_indices(locations)
+        
+        estimators = []
+        for i in range(len(volumes)):
+            model = OilDispersalModel.from_index(
+                volumes[i], table, oil_idx[i], time_hours=24,
+                wind_speed=wind[i], water_temp=water_temp[i], wave_height=wave[i]
+            )
+            estimators.append(ImpactEstimator(model))
+        areas = [e.get_affected_area() for e in estimators]
+        
+        _CLEANUP_NOISE.reseed(11)
+        impacts = compute_impacts(
+            volumes, table, oil_idx, wind, wave, water_temp,
+            [a.area_km2 for a in areas], [a.evaporated for a in areas],
+            [a.dissolved for a in areas], location_idx=location_idx
+        )
+        _CLEANUP_NOISE.reseed(11)
+        
+        for i, estimator in enumerate(estimators):
+            self.assertEqual(impacts['surface_area_km2'][i], estimator.calculate_surface_area())
+            self.assertAlmostEqual(
+                impacts['co2_emissions_tons'][i], estimator.calculate_co2_emissions(), places=6
+            )
+            economic = estimator.estimate_economic_impact(locations[i])
+            self.assertAlmostEqual(
+                impacts['total_economic_impact_usd'][i], economic['total_economic_impact_usd'], delta=1
+            )
+            
+            # Same noise draws, in order, as the per-spill estimates
+            self.assertAlmostEqual(
+                impacts['cleanup_time_days'][i], estimator.estimate_cleanup_time(), places=9
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,23 +1,38 @@
-
 """
 Oil Spill Impact Estimator - Utilities Package
 ----------------------------------------------
 This package contains utility functions for geospatial operations,
 data handling, and visualization.
+
+Submodules are imported on first attribute access, so that e.g. loading
+the oil types does not pull in folium and matplotlib.
 """
 
-from .geo_utils import validate_coordinates, calculate_distance, calculate_area_from_polygon
-from .visualization import create_map, display_map, generate_impact_charts
-from .data_handler import load_oil_types, load_sample_data, save_simulation_results
-
-__all__ = [
-    'validate_coordinates',
-    'calculate_distance',
-    'calculate_area_from_polygon',
-    'create_map',
-    'display_map',
-    'generate_impact_charts',
-    'load_oil_types',
-    'load_sample_data',
-    'save_simulation_results'
-]
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    'validate_coordinates': 'geo_utils',
+    'validate_coordinates_array': 'geo_utils',
+    'calculate_distance': 'geo_utils',
+    'calculate_area_from_polygon': 'geo_utils',
+    'create_map': 'visualization',
+    'display_map': 'visualization',
+    'generate_impact_charts': 'visualization',
+    'load_oil_types': 'data_handler',
+    'load_sample_data': 'data_handler',
+    'save_simulation_results': 'data_handler'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
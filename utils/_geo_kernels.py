@@ -0,0 +1,165 @@
+"""
+Geodesic Kernels
+----------------
+Scalar great-circle distance, bearing and destination math, JIT-compiled
+with Numba when it is installed and run as ordinary Python otherwise,
+plus a one-to-many distance kernel.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Radius of the Earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+
+# Explicit signatures: compiled once at import, and integer arguments are
+# converted to float instead of compiling a specialization per type mix
+@njit('float64(float64, float64, float64, float64)', cache=True, nogil=True)
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in kilometers between two points in degrees.
+    """
+    # Convert decimal degrees to radians
+    lat1_rad = math.radians(lat1)
+    lon1_rad = math.radians(lon1)
+    lat2_rad = math.radians(lat2)
+    lon2_rad = math.radians(lon2)
+
+    # Differences in coordinates
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+
+    # Haversine formula; asin(sqrt(a)) needs one sqrt and no atan2, and
+    # the clamp guards against a rounding just above 1 for antipodes
+    sin_half_dlat = math.sin(dlat * 0.5)
+    sin_half_dlon = math.sin(dlon * 0.5)
+    a = sin_half_dlat * sin_half_dlat + math.cos(lat1_rad) * math.cos(lat2_rad) * sin_half_dlon * sin_half_dlon
+    c = 2 * math.asin(min(1.0, math.sqrt(a)))
+    return EARTH_RADIUS_KM * c
+
+
+# Serial on purpose: the grids are a few hundred points, and a parallel
+# kernel compiled at import would load numba's threading layer, which
+# hangs fork-started child processes of any program importing geo_utils
+@njit('float64[::1](float64, float64, float64[::1], float64[::1])', cache=True, nogil=True)
+def _haversine_many(lat1, lon1, lats, lons):
+    """
+    Great-circle distances in kilometers from one point to many.
+    """
+    n = lats.shape[0]
+    out = np.empty(n)
+
+    for i in range(n):
+        out[i] = _haversine_km(lat1, lon1, lats[i], lons[i])
+
+    return out
+
+
+@njit('UniTuple(float64, 6)(float64, float64, float64)', cache=True, nogil=True)
+def _trig_pair(lat1_rad, lat2_rad, dlon_rad):
+    """
+    Sines and cosines of both latitudes and of the longitude difference, in radians.
+
+    Returns:
+        tuple: (sin_lat1, cos_lat1, sin_lat2, cos_lat2, sin_dlon, cos_dlon)
+    """
+    return (
+        math.sin(lat1_rad), math.cos(lat1_rad),
+        math.sin(lat2_rad), math.cos(lat2_rad),
+        math.sin(dlon_rad), math.cos(dlon_rad)
+    )
+
+
+@njit('float64(float64, float64, float64, float64, float64, float64)', cache=True, nogil=True)
+def _bearing_from_trig(sin_lat1, cos_lat1, sin_lat2, cos_lat2, sin_dlon, cos_dlon):
+    """
+    Initial bearing in degrees (0-360) from the values of ``_trig_pair``.
+    """
+    x = sin_dlon * cos_lat2
+    y = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_dlon
+    bearing_rad = math.atan2(x, y)
+
+    # Convert back to degrees and normalize
+    return (math.degrees(bearing_rad) + 360) % 360
+
+
+@njit('float64(float64, float64, float64, float64)', cache=True, nogil=True)
+def _bearing_deg(lat1, lon1, lat2, lon2):
+    """
+    Initial bearing in degrees (0-360) from point 1 to point 2 in degrees.
+    """
+    # Convert to radians
+    lat1 = math.radians(lat1)
+    lon1 = math.radians(lon1)
+    lat2 = math.radians(lat2)
+    lon2 = math.radians(lon2)
+
+    sin_lat1, cos_lat1, sin_lat2, cos_lat2, sin_dlon, cos_dlon = _trig_pair(lat1, lat2, lon2 - lon1)
+    return _bearing_from_trig(sin_lat1, cos_lat1, sin_lat2, cos_lat2, sin_dlon, cos_dlon)
+
+
+@njit('UniTuple(float64, 2)(float64, float64, float64, float64)', cache=True, nogil=True)
+def _bearing_distance(lat1, lon1, lat2, lon2):
+    """
+    Initial bearing in degrees and great-circle distance in kilometers
+    from point 1 to point 2, sharing the latitude cosines between the two.
+    """
+    # Convert to radians
+    lat1 = math.radians(lat1)
+    lat2 = math.radians(lat2)
+    dlat = lat2 - lat1
+    dlon = math.radians(lon2) - math.radians(lon1)
+
+    sin_lat1, cos_lat1, sin_lat2, cos_lat2, sin_dlon, cos_dlon = _trig_pair(lat1, lat2, dlon)
+    bearing = _bearing_from_trig(sin_lat1, cos_lat1, sin_lat2, cos_lat2, sin_dlon, cos_dlon)
+
+    # Haversine formula; the half-angle sines keep short distances accurate
+    sin_half_dlat = math.sin(dlat * 0.5)
+    sin_half_dlon = math.sin(dlon * 0.5)
+    a = sin_half_dlat * sin_half_dlat + cos_lat1 * cos_lat2 * sin_half_dlon * sin_half_dlon
+    c = 2 * math.asin(min(1.0, math.sqrt(a)))
+    return bearing, EARTH_RADIUS_KM * c
+
+
+@njit('UniTuple(float64, 2)(float64, float64, float64, float64)', cache=True, nogil=True)
+def _destination(lat, lon, bearing, distance_km):
+    """
+    Destination (lat, lon) in degrees from a start point, bearing and distance.
+    """
+    # Convert to radians
+    lat1 = math.radians(lat)
+    lon1 = math.radians(lon)
+    bearing_rad = math.radians(bearing)
+
+    # Calculate the destination point; each sine and cosine is used twice
+    angular_distance = distance_km / EARTH_RADIUS_KM
+    sin_lat1 = math.sin(lat1)
+    cos_lat1 = math.cos(lat1)
+    sin_ad = math.sin(angular_distance)
+    cos_ad = math.cos(angular_distance)
+
+    sin_lat2 = sin_lat1 * cos_ad + cos_lat1 * sin_ad * math.cos(bearing_rad)
+    lat2 = math.asin(sin_lat2)
+
+    lon2 = lon1 + math.atan2(
+        math.sin(bearing_rad) * sin_ad * cos_lat1,
+        cos_ad - sin_lat1 * sin_lat2
+    )
+
+    # Convert back to degrees and normalize longitude
+    return math.degrees(lat2), ((math.degrees(lon2) + 180) % 360) - 180
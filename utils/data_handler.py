@@ -7,11 +7,55 @@ Functions for loading, saving, and processing data for the oil spill estimator.
 import os
 import json
 import csv
-import pandas as pd
+import functools
+import math
+import sys
 import numpy as np
 from datetime import datetime
 from pathlib import Path
 
+from config.settings import ensure_results_dir
+
+# orjson parses and writes JSON several times faster when it is installed;
+# its JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=None)
+def _default_data_path(filename):
+    """
+    Find a bundled data file in its default locations.
+    
+    The first match is remembered, so the candidate locations are only
+    probed until the file has been found once.
+    
+    Args:
+        filename (str): Name of the data file, e.g. 'oil_types.json'
+        
+    Returns:
+        Path: Absolute path of the data file
+    """
+    root_dir = Path(__file__).parents[1]  # Go up two levels from this file
+    default_paths = [
+        root_dir / 'data' / filename,
+        Path('data') / filename,  # Relative to current working directory
+        Path(filename)  # Direct in current working directory
+    ]
+    
+    # Try each path until we find a valid file
+    for path in default_paths:
+        if path.exists():
+            # Absolute, so a later change of working directory is harmless
+            return path.resolve()
+    
+    # Not cached: the file may still be created later
+    raise FileNotFoundError(f"Could not find {filename} in default locations")
+
 
 def load_oil_types(filepath=None):
     """
@@ -22,31 +66,77 @@ def load_oil_types(filepath=None):
                         If None, uses the default location in the data directory.
                         
     Returns:
-        dict: Dictionary of oil types and their properties
+        dict: Dictionary of oil types and their properties.
+              Results are cached per file and modification time, so repeated
+              calls share the same dictionary; do not modify it in place.
     """
     if filepath is None:
-        # Try to find the default location
-        root_dir = Path(__file__).parents[1]  # Go up two levels from this file
-        default_paths = [
-            root_dir / 'data' / 'oil_types.json',
-            Path('data') / 'oil_types.json',  # Relative to current working directory
-            Path('oil_types.json')  # Direct in current working directory
-        ]
-        
-        # Try each path until we find a valid file
-        for path in default_paths:
-            if path.exists():
-                filepath = path
-                break
+        filepath = _default_data_path('oil_types.json')
+    
+    # Keyed on the modification time so edits to the file are picked up
+    mtime = os.path.getmtime(filepath)
+    return _load_oil_types_cached(str(filepath), mtime)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_oil_types_cached(filepath, mtime):
+    """Parse an oil types JSON file; cached by load_oil_types()."""
+    # Load the oil types (bytes, which both parsers accept)
+    with open(filepath, 'rb') as f:
+        oil_types = _json_loads(f.read())
+    
+    # Intern the names: they are looked up again for every CLI argument
+    # check and model lookup
+    return {sys.intern(name): props for name, props in oil_types.items()}
+
+
+# Numeric oil properties used by the models, one float32 column each.
+# The Fay model's empirical constants carry far less precision than float32.
+OIL_PROPERTY_DTYPE = np.dtype([
+    ('density', 'f4'),
+    ('viscosity', 'f4'),
+    ('surface_tension', 'f4'),
+    ('evaporation_rate', 'f4'),
+    ('solubility', 'f4'),
+    ('persistence_factor', 'f4'),
+    ('cleanup_difficulty', 'f4'),
+    ('co2_emission_factor', 'f4'),
+    ('toxicity', 'f4')
+])
+
+# Same fallbacks OilDispersalModel and ImpactEstimator use for missing properties
+_OIL_PROPERTY_DEFAULTS = {
+    'density': 0.9,
+    'viscosity': 50.0,
+    'surface_tension': 25.0,
+    'evaporation_rate': 0.3,
+    'solubility': 0.01,
+    'persistence_factor': 0.8,
+    'cleanup_difficulty': 3.0,
+    'co2_emission_factor': 3.0,
+    'toxicity': 0.6
+}
+
+
+def build_oil_table(oil_types):
+    """
+    Pack the numeric properties of all oil types into one structured array.
+    
+    Args:
+        oil_types (dict): Oil types as returned by load_oil_types()
         
-        if filepath is None:
-            raise FileNotFoundError("Could not find oil_types.json in default locations")
+    Returns:
+        tuple: (table, index) where table is an ndarray of OIL_PROPERTY_DTYPE
+               with one row per oil type and index maps oil type names to rows
+    """
+    index = {name: i for i, name in enumerate(oil_types)}
+    table = np.empty(len(index), dtype=OIL_PROPERTY_DTYPE)
     
-    # Load the oil types
-    with open(filepath, 'r') as f:
-        oil_types = json.load(f)
+    for field in OIL_PROPERTY_DTYPE.names:
+        default = _OIL_PROPERTY_DEFAULTS[field]
+        table[field] = [props.get(field, default) for props in oil_types.values()]
     
-    return oil_types
+    return table, index
 
 
 def load_sample_data(filepath=None):
@@ -58,32 +148,30 @@ def load_sample_data(filepath=None):
                         If None, uses the default location in the data directory.
                         
     Returns:
-        pandas.DataFrame: DataFrame containing the sample spill data
+        pandas.DataFrame: DataFrame containing the sample spill data.
+                          The parsed file is cached per path and
+                          modification time; each call gets its own copy.
     """
     if filepath is None:
-        # Try to find the default location
-        root_dir = Path(__file__).parents[1]  # Go up two levels from this file
-        default_paths = [
-            root_dir / 'data' / 'sample_spills.csv',
-            Path('data') / 'sample_spills.csv',  # Relative to current working directory
-            Path('sample_spills.csv')  # Direct in current working directory
-        ]
-        
-        # Try each path until we find a valid file
-        for path in default_paths:
-            if path.exists():
-                filepath = path
-                break
-        
-        if filepath is None:
-            raise FileNotFoundError("Could not find sample_spills.csv in default locations")
+        filepath = _default_data_path('sample_spills.csv')
     
-    # Load the sample data
     try:
-        df = pd.read_csv(filepath)
-        return df
+        # Keyed on the modification time so edits to the file are picked up
+        mtime = os.path.getmtime(filepath)
+        df = _load_sample_data_cached(str(filepath), mtime)
     except Exception as e:
         raise IOError(f"Error loading sample data: {str(e)}")
+    
+    # Callers may modify the frame; hand out a copy of the parsed one
+    return df.copy()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sample_data_cached(filepath, mtime):
+    """Parse a sample spills CSV file; cached by load_sample_data()."""
+    # pandas is only needed here, so import it lazily
+    import pandas as pd
+    return pd.read_csv(filepath)
 
 
 def save_simulation_results(results, filepath=None):
@@ -92,7 +180,8 @@ def save_simulation_results(results, filepath=None):
     
     Args:
         results (dict): Dictionary containing simulation results
-        filepath (str): Path to save the results. If None, generates a timestamped filename.
+        filepath (str): Path to save the results. If None, generates a timestamped
+            filename in the project's results directory (config.settings.RESULTS_DIR).
         
     Returns:
         str: Path to the saved file
@@ -101,27 +190,57 @@ def save_simulation_results(results, filepath=None):
         # Generate a timestamped filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create results directory if it doesn't exist
-        results_dir = Path('results')
-        if not results_dir.exists():
-            results_dir.mkdir(parents=True)
+        # Results directory of the project, created if it doesn't exist
+        results_dir = ensure_results_dir()
         
         filepath = results_dir / f"simulation_{timestamp}.json"
     
     # Convert Path object to string if necessary
     filepath_str = str(filepath)
     
-    # Prepare results for serialization
-    # Some objects (like shapely geometries) are not directly JSON serializable
-    serializable_results = prepare_for_serialization(results)
+    if orjson is not None:
+        # orjson writes numpy values and datetimes natively and only hands
+        # the rest (like shapely geometries) to prepare_for_serialization
+        with open(filepath_str, 'wb') as f:
+            f.write(orjson.dumps(
+                results,
+                default=prepare_for_serialization,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+        return filepath_str
     
-    # Save to file
+    # Save to file, streaming the encoder's output; objects that are not
+    # directly JSON serializable (like shapely geometries) are converted
+    # one at a time as the encoder reaches them, without a full copy
     with open(filepath_str, 'w') as f:
-        json.dump(serializable_results, f, indent=2)
+        json.dump(results, f, indent=2, default=prepare_for_serialization)
     
     return filepath_str
 
 
+def _identity(value):
+    return value
+
+
+# Converters for the exact types results are made of; a dict lookup on
+# type(value) replaces a chain of isinstance checks for nearly every value
+_SERIALIZERS = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    datetime: datetime.isoformat,
+    np.datetime64: np.datetime_as_string,
+    np.int64: int,
+    np.int32: int,
+    np.float64: float,
+    np.float32: float,
+    np.bool_: bool,
+    np.ndarray: np.ndarray.tolist
+}
+
+
 def prepare_for_serialization(data):
     """
     Prepare data for JSON serialization by converting non-serializable objects.
@@ -132,61 +251,44 @@ def prepare_for_serialization(data):
     Returns:
         Data in a JSON-serializable format
     """
+    serializer = _SERIALIZERS.get(type(data))
+    if serializer is not None:
+        return serializer(data)
+    
     if isinstance(data, dict):
         # Process each item in the dictionary
         result = {}
         for key, value in data.items():
-            # Skip None values
-            if value is None:
-                result[key] = None
-            # Handle special objects
-            elif key == 'polygon' and hasattr(value, 'wkt'):
+            if key == 'polygon' and hasattr(value, 'wkt'):
                 # Convert Shapely geometry to WKT string
                 result[key] = value.wkt
-            elif isinstance(value, (datetime, np.datetime64)):
-                # Convert datetime to ISO format string
-                result[key] = value.isoformat()
-            elif isinstance(value, (np.integer, np.int64, np.int32)):
-                # Convert numpy integers to Python integers
-                result[key] = int(value)
-            elif isinstance(value, (np.floating, np.float64, np.float32)):
-                # Convert numpy floats to Python floats
-                result[key] = float(value)
-            elif isinstance(value, (dict, list)):
-                # Recursively process nested structures
-                result[key] = prepare_for_serialization(value)
             else:
-                try:
-                    # Attempt to use the value as is
-                    # This will work for strings, numbers, booleans, etc.
-                    result[key] = value
-                except (TypeError, OverflowError):
-                    # If serialization fails, convert to string
-                    result[key] = str(value)
+                result[key] = prepare_for_serialization(value)
         return result
     
-    elif isinstance(data, list):
+    elif isinstance(data, (list, tuple)):
         # Process each item in the list
         return [prepare_for_serialization(item) for item in data]
     
-    elif isinstance(data, (datetime, np.datetime64)):
+    # Subclasses of the types above, e.g. other numpy scalar widths
+    elif isinstance(data, (str, int, float)):
+        return data
+    
+    elif isinstance(data, datetime):
         return data.isoformat()
     
-    elif isinstance(data, (np.integer, np.int64, np.int32)):
+    elif isinstance(data, np.integer):
         return int(data)
     
-    elif isinstance(data, (np.floating, np.float64, np.float32)):
+    elif isinstance(data, np.floating):
         return float(data)
     
-    else:
-        # Return the value as is if it's a basic type
-        try:
-            # This will check if it's JSON serializable
-            json.dumps(data)
-            return data
-        except (TypeError, OverflowError):
-            # If not serializable, convert to string
-            return str(data)
+    # Result records from the models (AffectedArea, VolumeFractions)
+    elif hasattr(data, 'to_dict'):
+        return prepare_for_serialization(data.to_dict())
+    
+    # Anything else is not serializable; convert it to a string
+    return str(data)
 
 
 def export_to_csv(results, filepath=None):
@@ -195,7 +297,8 @@ def export_to_csv(results, filepath=None):
     
     Args:
         results (dict): Dictionary containing simulation results
-        filepath (str): Path to save the CSV file. If None, generates a timestamped filename.
+        filepath (str): Path to save the CSV file. If None, generates a timestamped
+            filename in the project's results directory (config.settings.RESULTS_DIR).
         
     Returns:
         str: Path to the saved file
@@ -204,10 +307,8 @@ def export_to_csv(results, filepath=None):
         # Generate a timestamped filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create results directory if it doesn't exist
-        results_dir = Path('results')
-        if not results_dir.exists():
-            results_dir.mkdir(parents=True)
+        # Results directory of the project, created if it doesn't exist
+        results_dir = ensure_results_dir()
         
         filepath = results_dir / f"simulation_{timestamp}.csv"
     
@@ -221,9 +322,8 @@ def export_to_csv(results, filepath=None):
         # Write header row
         writer.writerow(['Parameter', 'Value'])
         
-        # Write data rows
-        for key, value in flat_data.items():
-            writer.writerow([key, value])
+        # Write data rows in one call into the C writer
+        writer.writerows(flat_data.items())
     
     return filepath
 
@@ -240,18 +340,48 @@ def flatten_dict(d, parent_key='', sep='_'):
     Returns:
         dict: Flattened dictionary
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        
-        if isinstance(v, dict) and v:
-            # Recursive call for nested dictionaries
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        else:
-            # Add the key-value pair to our items
-            items.append((new_key, v))
+    flat = {}
+    
+    # Walk nested dictionaries with a stack of (key prefix, items iterator)
+    # pairs, so keys come out in the same depth-first order as they appear
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            
+            if isinstance(v, dict) and v:
+                # Descend into the nested dictionary, then resume here
+                stack.append((new_key, iter(v.items())))
+                break
             
-    return dict(items)
+            # Add the key-value pair to the result
+            flat[new_key] = v
+        else:
+            stack.pop()
+    
+    return flat
+
+
+# Random source for the placeholder wind and wave data
+_ENV_RNG = np.random.default_rng()
+
+# Dummy coastline longitudes - in a real app, use a coastline database
+_DUMMY_COAST_LONGITUDES = np.array([-120.0, -80.0, 0.0, 100.0])
+
+
+def _seasonal_factor(month, peak_month):
+    """
+    Seasonal temperature factor, from 0 six months off the peak to 1 at it.
+    
+    Args:
+        month (int): Month of the year (1-12)
+        peak_month (int): Warmest month (7 in the north, 1 in the south)
+        
+    Returns:
+        float: Seasonal factor in [0, 1]
+    """
+    return 0.5 * (1 + math.cos((month - peak_month) * (2 * math.pi / 12)))
 
 
 def load_environmental_data(latitude, longitude, filepath=None):
@@ -272,17 +402,9 @@ def load_environmental_data(latitude, longitude, filepath=None):
     # In a real application, you'd implement an API call or database lookup
     
     # Simulate seasonal temperature variations based on latitude
-    month = datetime.now().month
     # Northern hemisphere: warmer in summer (June-August)
     # Southern hemisphere: warmer in summer (December-February)
-    is_northern = latitude > 0
-    
-    if is_northern:
-        # Northern hemisphere seasonal adjustment
-        seasonal_factor = -abs(month - 7) / 6 + 1  # Peak at month 7 (July)
-    else:
-        # Southern hemisphere seasonal adjustment
-        seasonal_factor = -abs(((month + 6) % 12) - 7) / 6 + 1  # Peak at month 1 (January)
+    seasonal_factor = _seasonal_factor(datetime.now().month, 7 if latitude > 0 else 1)
     
     # Base temperature decreases with distance from equator
     base_temp = 30 - abs(latitude) * 0.5
@@ -302,10 +424,60 @@ def load_environmental_data(latitude, longitude, filepath=None):
                            abs(longitude - 0), abs(longitude - 100))
     is_coastal = distance_to_coast < 5
     
+    wind_draw, wave_draw = _ENV_RNG.random(2).tolist()
+    
     return {
         'water_temp_c': water_temp,
-        'wind_speed_kmh': 10 + 20 * wind_factor * np.random.random(),
-        'wave_height_m': 0.5 + 2 * wind_factor * np.random.random(),
+        'wind_speed_kmh': 10 + 20 * wind_factor * wind_draw,
+        'wave_height_m': 0.5 + 2 * wind_factor * wave_draw,
         'environmental_sensitivity': 2.0 if is_coastal else 1.0,
         'location_type': 'coastal' if is_coastal else 'open_ocean'
+    }
+
+
+def load_environmental_data_batch(latitudes, longitudes):
+    """
+    Load environmental data for many locations at once.
+    
+    Array version of ``load_environmental_data`` for grids and particle
+    clouds: the same placeholder model, with the random wind and wave
+    draws generated in one call.
+    
+    Args:
+        latitudes (array_like): Latitudes of the locations
+        longitudes (array_like): Longitudes of the locations
+        
+    Returns:
+        dict: Environmental data, one array element per location
+    """
+    latitude, longitude = np.broadcast_arrays(
+        np.asarray(latitudes, dtype=np.float64), np.asarray(longitudes, dtype=np.float64)
+    )
+    
+    # Seasonal adjustment per hemisphere, peaking in July in the north
+    # and in January in the south
+    month = datetime.now().month
+    seasonal_factor = np.where(
+        latitude > 0, _seasonal_factor(month, 7), _seasonal_factor(month, 1)
+    )
+    
+    # Base temperature decreases with distance from equator
+    abs_latitude = np.abs(latitude)
+    water_temp = 30 - abs_latitude * 0.5 + seasonal_factor * 10
+    
+    # Stronger winds/waves in higher latitudes
+    wind_factor = 0.5 + abs_latitude / 90
+    
+    # Same dummy coastline longitudes as the scalar version
+    distance_to_coast = np.abs(longitude[..., np.newaxis] - _DUMMY_COAST_LONGITUDES).min(axis=-1)
+    is_coastal = distance_to_coast < 5
+    
+    wind_draw, wave_draw = _ENV_RNG.random((2,) + latitude.shape)
+    
+    return {
+        'water_temp_c': water_temp,
+        'wind_speed_kmh': 10 + 20 * wind_factor * wind_draw,
+        'wave_height_m': 0.5 + 2 * wind_factor * wave_draw,
+        'environmental_sensitivity': np.where(is_coastal, 2.0, 1.0),
+        'location_type': np.where(is_coastal, 'coastal', 'open_ocean')
     }
\ No newline at end of file
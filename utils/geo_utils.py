@@ -6,10 +6,12 @@ Utility functions for geographic calculations and coordinate validation.
 
 import math
 import numpy as np
-from shapely.geometry import Point, Polygon
-import pyproj
-from functools import partial
-from shapely.ops import transform
+from functools import lru_cache
+
+from ._geo_kernels import (
+    EARTH_RADIUS_KM, NUMBA_AVAILABLE, _bearing_deg, _bearing_distance, _destination,
+    _haversine_km, _haversine_many
+)
 
 
 def validate_coordinates(latitude, longitude):
@@ -23,15 +25,33 @@ def validate_coordinates(latitude, longitude):
     Returns:
         bool: True if coordinates are valid, False otherwise
     """
-    # Check latitude range: -90 to 90 degrees
-    if latitude < -90 or latitude > 90:
-        return False
-    
-    # Check longitude range: -180 to 180 degrees
-    if longitude < -180 or longitude > 180:
-        return False
+    # Latitude within -90 to 90 degrees and longitude within -180 to 180
+    return -90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0
+
+
+def validate_coordinates_array(latitudes, longitudes):
+    """
+    Validate that all of the given coordinates are within valid ranges.
     
-    return True
+    Args:
+        latitudes (array_like): Latitudes in decimal degrees
+        longitudes (array_like): Longitudes in decimal degrees
+        
+    Returns:
+        bool: True if every coordinate is valid, False otherwise
+    """
+    return bool((np.abs(latitudes) <= 90.0).all() and (np.abs(longitudes) <= 180.0).all())
+
+
+_SCALAR_TYPES = (int, float)
+
+
+def _all_scalars(a, b, c, d):
+    """True if all four values are plain ints or floats rather than arrays."""
+    return (
+        isinstance(a, _SCALAR_TYPES) and isinstance(b, _SCALAR_TYPES) and
+        isinstance(c, _SCALAR_TYPES) and isinstance(d, _SCALAR_TYPES)
+    )
 
 
 def calculate_distance(lat1, lon1, lat2, lon2):
@@ -39,34 +59,39 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     Calculate the great-circle distance between two points on the Earth.
     Uses the Haversine formula.
     
+    Plain numbers run in the compiled scalar kernel; if any argument is an
+    array, all of them are broadcast and computed with NumPy.
+    
     Args:
-        lat1 (float): Latitude of point 1 in decimal degrees
-        lon1 (float): Longitude of point 1 in decimal degrees
-        lat2 (float): Latitude of point 2 in decimal degrees
-        lon2 (float): Longitude of point 2 in decimal degrees
+        lat1 (float or array_like): Latitude of point 1 in decimal degrees
+        lon1 (float or array_like): Longitude of point 1 in decimal degrees
+        lat2 (float or array_like): Latitude of point 2 in decimal degrees
+        lon2 (float or array_like): Longitude of point 2 in decimal degrees
         
     Returns:
-        float: Distance in kilometers
+        float or numpy.ndarray: Distance in kilometers
     """
-    # Radius of the Earth in kilometers
-    R = 6371.0
+    if _all_scalars(lat1, lon1, lat2, lon2):
+        return _haversine_km(lat1, lon1, lat2, lon2)
     
     # Convert decimal degrees to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    
-    # Differences in coordinates
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
     dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
+    dlon = np.radians(lon2) - np.radians(lon1)
     
     # Haversine formula
-    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    distance = R * c
-    
-    return distance
+    a = np.sin(dlat/2)**2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon/2)**2
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+@lru_cache(maxsize=1)
+def _wgs84_geod():
+    """WGS84 ellipsoid for geodesic area calculations, created on first use."""
+    # pyproj is only needed here; importing it lazily keeps coordinate
+    # validation cheap for the CLI
+    import pyproj
+    return pyproj.Geod(ellps='WGS84')
 
 
 def calculate_area_from_polygon(polygon, latitude):
@@ -74,36 +99,33 @@ def calculate_area_from_polygon(polygon, latitude):
     Calculate the area of a shapely polygon in square kilometers,
     taking into account the Earth's curvature.
     
+    The area is computed on the WGS84 ellipsoid in a single pyproj call,
+    including any holes.
+    
     Args:
-        polygon (shapely.geometry.Polygon): The polygon to calculate area for
-        latitude (float): Approximate latitude of the polygon (for projection)
+        polygon (shapely.geometry.Polygon or array_like): The polygon to
+            calculate area for, or an array of polygons (e.g. from
+            ``shapely.polygons``) to get one area each
+        latitude (float): Approximate latitude of the polygon; not needed by
+            the geodesic calculation and kept for compatibility
         
     Returns:
-        float: Area in square kilometers
+        float or numpy.ndarray: Area in square kilometers
     """
+    if isinstance(polygon, (list, tuple, np.ndarray)):
+        return np.array([calculate_area_from_polygon(p, latitude) for p in polygon])
+    
     # If we have an empty polygon, return 0
     if polygon is None or polygon.is_empty:
         return 0.0
     
-    # Create a suitable equal-area projection centered on the polygon
-    proj_string = f"+proj=aea +lat_1={latitude-5} +lat_2={latitude+5} +lat_0={latitude} +lon_0={polygon.centroid.x}"
-    projection = pyproj.Proj(proj_string)
-    wgs84 = pyproj.Proj("+proj=longlat +datum=WGS84")
-    
-    # Create a transformer function
-    project = partial(
-        pyproj.transform,
-        wgs84,          # source coordinate system
-        projection      # destination coordinate system
-    )
-    
-    # Transform the polygon to the equal-area projection
-    projected_polygon = transform(project, polygon)
+    from shapely.geometry.polygon import orient
     
-    # Calculate the area in square meters and convert to square kilometers
-    area_sq_km = projected_polygon.area / 1_000_000
+    # The geodesic area is signed by ring orientation; orient the exterior
+    # counter-clockwise and the holes clockwise so that holes subtract
+    area_sq_m, _ = _wgs84_geod().geometry_area_perimeter(orient(polygon))
     
-    return area_sq_km
+    return area_sq_m / 1_000_000
 
 
 def convert_coordinates_to_pixels(lat, lon, bounds, width, height):
@@ -111,33 +133,105 @@ def convert_coordinates_to_pixels(lat, lon, bounds, width, height):
     Convert latitude and longitude to pixel coordinates on an image.
     
     Args:
-        lat (float): Latitude in decimal degrees
-        lon (float): Longitude in decimal degrees
+        lat (float or array_like): Latitude in decimal degrees
+        lon (float or array_like): Longitude in decimal degrees
         bounds (tuple): Map bounds as (min_lon, min_lat, max_lon, max_lat)
         width (int): Width of the image in pixels
         height (int): Height of the image in pixels
         
     Returns:
-        tuple: (x, y) pixel coordinates
+        tuple: (x, y) pixel coordinates, or None if the point is outside the
+               bounds. For array input, (x, y) float arrays of whole pixel
+               positions, NaN where a point is outside the bounds.
     """
     min_lon, min_lat, max_lon, max_lat = bounds
     
-    # Check if coordinates are within bounds
-    if lat < min_lat or lat > max_lat or lon < min_lon or lon > max_lon:
-        return None
+    # Pixels per degree, computed once for all points
+    x_per_deg = width / (max_lon - min_lon)
+    y_per_deg = height / (max_lat - min_lat)
     
-    # Convert to normalized coordinates (0-1)
-    x_norm = (lon - min_lon) / (max_lon - min_lon)
-    y_norm = 1.0 - (lat - min_lat) / (max_lat - min_lat)  # Flip Y axis
+    if isinstance(lat, _SCALAR_TYPES) and isinstance(lon, _SCALAR_TYPES):
+        # Check if coordinates are within bounds
+        if lat < min_lat or lat > max_lat or lon < min_lon or lon > max_lon:
+            return None
+        
+        # Offsets from the top-left corner (Y axis flipped), in pixels
+        return (int((lon - min_lon) * x_per_deg), int((max_lat - lat) * y_per_deg))
+    
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    outside = (lat < min_lat) | (lat > max_lat) | (lon < min_lon) | (lon > max_lon)
     
-    # Convert to pixel coordinates
-    x_px = int(x_norm * width)
-    y_px = int(y_norm * height)
+    x_px = np.where(outside, np.nan, np.floor((lon - min_lon) * x_per_deg))
+    y_px = np.where(outside, np.nan, np.floor((max_lat - lat) * y_per_deg))
     
     return (x_px, y_px)
 
 
-def create_grid_points(center_lat, center_lon, radius_km, num_points=100):
+def convert_coordinates_to_pixels_vec(lats, lons, bounds, width, height):
+    """
+    Convert arrays of latitudes and longitudes to integer pixel indices.
+    
+    Suited to rasterizing: the indices can be used directly on an image
+    array once filtered by the mask.
+    
+    Args:
+        lats (array_like): Latitudes in decimal degrees
+        lons (array_like): Longitudes in decimal degrees
+        bounds (tuple): Map bounds as (min_lon, min_lat, max_lon, max_lat)
+        width (int): Width of the image in pixels
+        height (int): Height of the image in pixels
+        
+    Returns:
+        tuple: (x, y, valid) where x and y are int32 pixel arrays, the same
+               as ``convert_coordinates_to_pixels`` gives per point, and
+               valid is a boolean mask that is False (with x = y = 0)
+               where a point is outside the bounds
+    """
+    min_lon, min_lat, max_lon, max_lat = bounds
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    
+    valid = (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
+    
+    # Offsets from the top-left corner (Y axis flipped), in pixels; the
+    # offsets of valid points are non-negative, so the cast truncates as int()
+    x_px = np.where(valid, (lons - min_lon) * (width / (max_lon - min_lon)), 0).astype(np.int32)
+    y_px = np.where(valid, (max_lat - lats) * (height / (max_lat - min_lat)), 0).astype(np.int32)
+    
+    return x_px, y_px, valid
+
+
+# Random source for sampled (non-lattice) grids
+_SAMPLE_RNG = np.random.default_rng()
+
+
+def _radius_degrees(center_lat, radius_km):
+    """
+    Convert a radius in kilometers to degrees of latitude and longitude.
+    
+    Shared by the grid and bounds helpers so each evaluates cos(lat) once.
+    
+    Args:
+        center_lat (float): Latitude the radius is measured at, in decimal degrees
+        radius_km (float): Radius in kilometers
+        
+    Returns:
+        tuple: (radius_lat, radius_lon) in degrees
+    """
+    # 1 degree of latitude is approximately 111 km and 1 degree of
+    # longitude approximately 111 * cos(lat) km
+    km_per_deg_lon = 111.0 * math.cos(math.radians(center_lat))
+    
+    # Near the poles cos(lat) -> 0; once the radius wraps all the way
+    # around, cap it at a full turn instead of letting it blow up
+    if radius_km >= 360.0 * km_per_deg_lon:
+        return radius_km / 111.0, 360.0
+    
+    return radius_km / 111.0, radius_km / km_per_deg_lon
+
+
+def create_grid_points(center_lat, center_lon, radius_km, num_points=100, grid=True, rng=None):
     """
     Create a grid of points around a center location.
     
@@ -146,40 +240,63 @@ def create_grid_points(center_lat, center_lon, radius_km, num_points=100):
         center_lon (float): Center longitude in decimal degrees
         radius_km (float): Radius from center in kilometers
         num_points (int): Approximate number of points to generate
+        grid (bool): If True, a regular lattice clipped to the radius. If
+            False, exactly num_points random points spread uniformly over
+            the disc, with no points wasted outside it
+        rng (numpy.random.Generator): Random source for ``grid=False``;
+            defaults to a module-level generator
         
     Returns:
         list: List of (lat, lon) tuples
     """
+    if not grid:
+        rng = _SAMPLE_RNG if rng is None else rng
+        u, v = rng.random((2, num_points))
+        
+        # Uniform by area on the sphere: the cap within angular distance d
+        # has area proportional to sin²(d/2), so invert that for d
+        max_angle = radius_km / EARTH_RADIUS_KM
+        angles = 2 * np.arcsin(np.sqrt(u) * math.sin(max_angle / 2))
+        
+        lats, lons = get_destination_point(
+            center_lat, center_lon, 360.0 * v, angles * EARTH_RADIUS_KM
+        )
+        return list(zip(lats.tolist(), lons.tolist()))
+    
     # Estimate number of points in each direction
     n = int(math.sqrt(num_points))
     
     # Convert radius from km to degrees (approximately)
-    # 1 degree of latitude is approximately 111 km
-    radius_lat = radius_km / 111.0
-    # 1 degree of longitude is approximately 111 * cos(lat) km
-    radius_lon = radius_km / (111.0 * math.cos(math.radians(center_lat)))
+    radius_lat, radius_lon = _radius_degrees(center_lat, radius_km)
     
     # Create a grid
     lat_vals = np.linspace(center_lat - radius_lat, center_lat + radius_lat, n)
     lon_vals = np.linspace(center_lon - radius_lon, center_lon + radius_lon, n)
     
-    # Generate all combinations of lat/lon
-    grid_points = []
-    for lat in lat_vals:
-        for lon in lon_vals:
-            # Calculate distance from center
-            dist = calculate_distance(center_lat, center_lon, lat, lon)
-            # Only include points within the radius
-            if dist <= radius_km:
-                grid_points.append((lat, lon))
+    # Generate all combinations of lat/lon, latitude-major
+    lats, lons = np.meshgrid(lat_vals, lon_vals, indexing='ij')
+    lats = lats.ravel()
+    lons = lons.ravel()
     
-    return grid_points
+    # Only include points within the radius of the center; the compiled
+    # fan avoids NumPy's per-ufunc overhead on these small arrays
+    if NUMBA_AVAILABLE:
+        distances = _haversine_many(float(center_lat), float(center_lon), lats, lons)
+    else:
+        distances = calculate_distance(center_lat, center_lon, lats, lons)
+    inside = distances <= radius_km
+    
+    return list(zip(lats[inside].tolist(), lons[inside].tolist()))
 
 
+@lru_cache(maxsize=4096)
 def get_lat_lon_bounds(center_lat, center_lon, radius_km):
     """
     Calculate latitude/longitude bounds for a map centered on a point.
     
+    Results are memoized, as maps are often redrawn around the same
+    center; repeated calls return the same (immutable) tuple.
+    
     Args:
         center_lat (float): Center latitude in decimal degrees
         center_lon (float): Center longitude in decimal degrees
@@ -189,8 +306,7 @@ def get_lat_lon_bounds(center_lat, center_lon, radius_km):
         tuple: (min_lon, min_lat, max_lon, max_lat)
     """
     # Convert radius to degrees
-    radius_lat = radius_km / 111.0  # Approx. 111 km per degree of latitude
-    radius_lon = radius_km / (111.0 * math.cos(math.radians(center_lat)))  # Longitude depends on latitude
+    radius_lat, radius_lon = _radius_degrees(center_lat, radius_km)
     
     # Calculate bounds
     min_lat = center_lat - radius_lat
@@ -211,72 +327,140 @@ def calculate_bearing(lat1, lon1, lat2, lon2):
     """
     Calculate the bearing (direction) from point 1 to point 2.
     
+    Plain numbers run in the compiled scalar kernel; arrays are broadcast
+    and computed with NumPy.
+    
     Args:
-        lat1 (float): Latitude of point 1 in decimal degrees
-        lon1 (float): Longitude of point 1 in decimal degrees
-        lat2 (float): Latitude of point 2 in decimal degrees
-        lon2 (float): Longitude of point 2 in decimal degrees
+        lat1 (float or array_like): Latitude of point 1 in decimal degrees
+        lon1 (float or array_like): Longitude of point 1 in decimal degrees
+        lat2 (float or array_like): Latitude of point 2 in decimal degrees
+        lon2 (float or array_like): Longitude of point 2 in decimal degrees
         
     Returns:
-        float: Bearing in degrees (0 = North, 90 = East, etc.)
+        float or numpy.ndarray: Bearing in degrees (0 = North, 90 = East, etc.)
     """
+    if _all_scalars(lat1, lon1, lat2, lon2):
+        return _bearing_deg(lat1, lon1, lat2, lon2)
+    
     # Convert to radians
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlon = np.radians(lon2) - np.radians(lon1)
+    
+    # Calculate the bearing, normalized to 0-360 degrees
+    x = np.sin(dlon) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+    return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+
+def bearing_and_distance(lat1, lon1, lat2, lon2):
+    """
+    Calculate both the bearing and the great-circle distance from point 1 to point 2.
+    
+    Cheaper than calling ``calculate_bearing`` and ``calculate_distance``
+    separately, as the latitude sines and cosines are evaluated once.
+    Plain numbers run in the compiled scalar kernel; arrays are broadcast
+    and computed with NumPy.
     
-    # Calculate the bearing
-    x = math.sin(lon2 - lon1) * math.cos(lat2)
-    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1)
-    bearing_rad = math.atan2(x, y)
+    Args:
+        lat1 (float or array_like): Latitude of point 1 in decimal degrees
+        lon1 (float or array_like): Longitude of point 1 in decimal degrees
+        lat2 (float or array_like): Latitude of point 2 in decimal degrees
+        lon2 (float or array_like): Longitude of point 2 in decimal degrees
+        
+    Returns:
+        tuple: (bearing in degrees, distance in kilometers)
+    """
+    if _all_scalars(lat1, lon1, lat2, lon2):
+        return _bearing_distance(lat1, lon1, lat2, lon2)
     
-    # Convert back to degrees and normalize
-    bearing_deg = math.degrees(bearing_rad)
-    bearing_deg = (bearing_deg + 360) % 360
+    # Convert to radians
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlat = lat2 - lat1
+    dlon = np.radians(lon2) - np.radians(lon1)
+    cos_lat1 = np.cos(lat1)
+    cos_lat2 = np.cos(lat2)
+    
+    # Bearing, normalized to 0-360 degrees
+    x = np.sin(dlon) * cos_lat2
+    y = cos_lat1 * np.sin(lat2) - np.sin(lat1) * cos_lat2 * np.cos(dlon)
+    bearing = (np.degrees(np.arctan2(x, y)) + 360) % 360
     
-    return bearing_deg
+    # Haversine formula
+    a = np.sin(dlat/2)**2 + cos_lat1 * cos_lat2 * np.sin(dlon/2)**2
+    return bearing, EARTH_RADIUS_KM * 2 * np.arcsin(np.minimum(1.0, np.sqrt(a)))
 
 
 def get_destination_point(lat, lon, bearing, distance_km):
     """
     Calculate the destination point given a starting point, bearing, and distance.
     
+    Plain numbers run in the compiled scalar kernel; arrays are broadcast
+    and computed with NumPy.
+    
     Args:
-        lat (float): Starting latitude in decimal degrees
-        lon (float): Starting longitude in decimal degrees
-        bearing (float): Bearing in degrees (0 = North, 90 = East, etc.)
-        distance_km (float): Distance in kilometers
+        lat (float or array_like): Starting latitude in decimal degrees
+        lon (float or array_like): Starting longitude in decimal degrees
+        bearing (float or array_like): Bearing in degrees (0 = North, 90 = East, etc.)
+        distance_km (float or array_like): Distance in kilometers
         
     Returns:
         tuple: (destination_lat, destination_lon) in decimal degrees
     """
-    # Earth's radius in kilometers
-    R = 6371.0
+    if _all_scalars(lat, lon, bearing, distance_km):
+        return _destination(lat, lon, bearing, distance_km)
     
     # Convert to radians
-    lat1 = math.radians(lat)
-    lon1 = math.radians(lon)
-    bearing_rad = math.radians(bearing)
+    lat1 = np.radians(lat)
+    lon1 = np.radians(lon)
+    bearing_rad = np.radians(bearing)
+    angular_distance = np.asarray(distance_km) / EARTH_RADIUS_KM
     
     # Calculate the destination point
-    angular_distance = distance_km / R
-    
-    lat2 = math.asin(
-        math.sin(lat1) * math.cos(angular_distance) +
-        math.cos(lat1) * math.sin(angular_distance) * math.cos(bearing_rad)
+    lat2 = np.arcsin(
+        np.sin(lat1) * np.cos(angular_distance) +
+        np.cos(lat1) * np.sin(angular_distance) * np.cos(bearing_rad)
     )
-    
-    lon2 = lon1 + math.atan2(
-        math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat1),
-        math.cos(angular_distance) - math.sin(lat1) * math.sin(lat2)
+    lon2 = lon1 + np.arctan2(
+        np.sin(bearing_rad) * np.sin(angular_distance) * np.cos(lat1),
+        np.cos(angular_distance) - np.sin(lat1) * np.sin(lat2)
     )
     
-    # Convert back to degrees
-    lat2 = math.degrees(lat2)
-    lon2 = math.degrees(lon2)
+    # Convert back to degrees and normalize longitude
+    return np.degrees(lat2), ((np.degrees(lon2) + 180) % 360) - 180
+
+
+def get_destination_points(lat, lon, bearings, distance_km):
+    """
+    Calculate the destinations reached from one starting point along many bearings.
+    
+    The terms that depend only on the start and the distance are computed
+    once, leaving one vectorized pass over the bearings.
     
-    # Normalize longitude
-    lon2 = ((lon2 + 180) % 360) - 180
+    Args:
+        lat (float): Starting latitude in decimal degrees
+        lon (float): Starting longitude in decimal degrees
+        bearings (array_like): Bearings in degrees (0 = North, 90 = East, etc.)
+        distance_km (float): Distance in kilometers
+        
+    Returns:
+        tuple: (destination_lats, destination_lons) arrays in decimal degrees
+    """
+    lat1 = math.radians(lat)
+    angular_distance = distance_km / EARTH_RADIUS_KM
+    bearing_rad = np.radians(bearings)
+    
+    sin_lat1, cos_lat1 = math.sin(lat1), math.cos(lat1)
+    sin_d, cos_d = math.sin(angular_distance), math.cos(angular_distance)
+    
+    # Calculate the destination points
+    sin_lat2 = sin_lat1 * cos_d + cos_lat1 * sin_d * np.cos(bearing_rad)
+    lat2 = np.arcsin(sin_lat2)
+    lon2 = math.radians(lon) + np.arctan2(
+        np.sin(bearing_rad) * sin_d * cos_lat1,
+        cos_d - sin_lat1 * sin_lat2
+    )
     
-    return (lat2, lon2)
\ No newline at end of file
+    # Convert back to degrees and normalize longitude
+    return np.degrees(lat2), ((np.degrees(lon2) + 180) % 360) - 180
@@ -5,42 +5,201 @@ Functions for creating maps and charts to visualize oil spill impacts.
 """
 
 import os
+import sys
 import folium
-from folium.plugins import HeatMap, MarkerCluster
+from branca.element import MacroElement
+from jinja2 import Template
+from folium.plugins import Fullscreen, HeatMap, MeasureControl, TimestampedGeoJson
+import matplotlib
+
+# Charts are only saved to files, never shown, so use the non-GUI backend
+# unless one was chosen explicitly or pyplot is already running (e.g. in a
+# notebook)
+if 'MPLBACKEND' not in os.environ and 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import webbrowser
 from pathlib import Path
 import tempfile
-from shapely.geometry import mapping, Point, Polygon
-from datetime import datetime
+import shapely
+from datetime import datetime, timedelta
 
 # Import local modules
-from .geo_utils import get_lat_lon_bounds, calculate_area_from_polygon
+from .geo_utils import get_lat_lon_bounds
+
+# Seaborn style for all charts, set once rather than on every call
+sns.set_theme(style="whitegrid")
+
+# Decimal places kept for coordinates written into the map HTML: 5 places
+# is about 1 m, well below what the rendered map can show, where full float
+# precision writes up to 17 significant digits per coordinate
+_COORD_DECIMALS = 5
+
+# Base map tiles. folium resolves a tile name through xyzservices on every
+# map, which costs more than building the rest of the map, so the provider
+# is looked up once here when this folium takes provider objects
+_TILES = 'CartoDB positron'
+_xyzservices = getattr(folium.raster_layers, 'xyzservices', None)
+if _xyzservices is not None:
+    _TILES = _xyzservices.providers.query_name(_TILES)
+
+# Heat map samples per side of the grid laid over the spill's bounding box
+_HEAT_GRID = 30
+
+# Placeholders marking where each animation frame adds its title box and
+# outline script to the once-rendered base page
+_FRAME_TITLE_SLOT = '<!-- frame title -->'
+_FRAME_SCRIPT_SLOT = '// frame layers'
+
+
+def _exterior_coords(polygon):
+    """
+    Exterior ring of a shapely polygon as an (N, 2) array of (lon, lat).
+    
+    Uses the single-call shapely.get_coordinates on shapely 2, and the
+    coordinate sequence on older versions.
+    """
+    if hasattr(shapely, 'get_coordinates'):
+        return shapely.get_coordinates(polygon.exterior)
+    return np.asarray(polygon.exterior.coords)
+
+
+def _add_origin_marker(m, latitude, longitude, oil_type, volume):
+    """Add the spill-origin marker with its info popup to a folium map."""
+    folium.Marker(
+        location=[latitude, longitude],
+        popup=f"<strong>Oil Spill Origin</strong><br>"
+              f"Volume: {volume:,.0f} barrels<br>"
+              f"Oil Type: {oil_type}<br>"
+              f"Date: {datetime.now().strftime('%Y-%m-%d')}<br>"
+              f"Coordinates: {latitude:.4f}, {longitude:.4f}",
+        icon=folium.Icon(color='red', icon='exclamation-circle', prefix='fa')
+    ).add_to(m)
+
+
+def _spill_polygon(coords, fill_color, area_km2):
+    """Folium polygon of a closed (lon, lat) spill outline, with its area tooltip."""
+    # Leaflet expects lat, lon order
+    return folium.Polygon(
+        locations=np.round(coords[:, ::-1], _COORD_DECIMALS).tolist(),
+        color='#000000',
+        weight=1,
+        fill=True,
+        fill_color=fill_color,
+        fill_opacity=0.5,
+        tooltip=f"Affected Area: {area_km2:.2f} km²"
+    )
+
+
+def _render_scripts(*elements):
+    """
+    Script of folium elements added to a map whose page is already rendered.
+    
+    The elements are rendered into their figure as folium does when it
+    saves the map; the script parts they add are returned and then taken
+    out of the figure and the map again, ready for the next frame.
+    """
+    script = elements[0].get_root().script
+    rendered_before = set(script._children)
+    for element in elements:
+        element.render()
+    
+    added = [name for name in script._children if name not in rendered_before]
+    rendered = ''.join(script._children[name].render() for name in added)
+    for name in added:
+        del script._children[name]
+    for element in elements:
+        del element._parent._children[element.get_name()]
+    
+    return rendered
+
+
+def _title_html(volume, area_km2, oil_type):
+    """HTML of the fixed title box shown over a spill map."""
+    return f'''
+        <div style="position: fixed; 
+                    top: 10px; left: 50px; width: 300px; height: 90px; 
+                    background-color: white; border-radius: 5px; 
+                    border: 2px solid grey; z-index: 9999; padding: 10px; 
+                    font-size: 14px; font-family: Arial;">
+            <b style="font-size: 16px;">Oil Spill Impact Estimation</b><br>
+            Volume: {volume:,.0f} barrels<br>
+            Affected Area: {area_km2:.2f} km²<br>
+            Oil Type: {oil_type}
+        </div>
+    '''
+
+
+def _interior_heat_points(polygon, bounds, center):
+    """
+    Heat map points inside a spill outline, as [lat, lon, weight] lists.
+    
+    Candidates on a _HEAT_GRID x _HEAT_GRID grid over the bounding box are
+    tested against the polygon in one vectorized shapely call. Weights
+    fall from 1 at the spill origin to 0 at the farthest point inside.
+    """
+    min_lon, min_lat, max_lon, max_lat = bounds
+    lons, lats = np.meshgrid(
+        np.linspace(min_lon, max_lon, _HEAT_GRID),
+        np.linspace(min_lat, max_lat, _HEAT_GRID)
+    )
+    lons, lats = lons.ravel(), lats.ravel()
+    
+    if hasattr(shapely, 'contains_xy'):
+        inside = shapely.contains_xy(polygon, lons, lats)
+    else:
+        from shapely import vectorized
+        inside = vectorized.contains(polygon, lons, lats)
+    lons, lats = lons[inside], lats[inside]
+    
+    # Distance from the origin, with longitude scaled to match latitude
+    center_lat, center_lon = center
+    dist = np.hypot((lons - center_lon) * np.cos(np.radians(center_lat)), lats - center_lat)
+    weights = 1.0 - dist / (dist.max(initial=0.0) or 1.0)
+    
+    return np.round(np.column_stack([lats, lons, weights]), _COORD_DECIMALS).tolist()
 
 
-def create_map(latitude, longitude, affected_area, oil_type, volume, output_file='spill_map.html'):
+def create_map(latitude, longitude, affected_area, oil_type, volume, output_file='spill_map.html',
+               heatmap=True, controls=True):
     """
     Create an interactive map visualization of the oil spill.
     
     Args:
         latitude (float): Latitude of the spill origin
         longitude (float): Longitude of the spill origin
-        affected_area (dict): Dict with area info including polygon and area_km2
+        affected_area (AffectedArea or dict): Area info including area_km2 and
+                              the spill outline as coords ((N, 2) lon/lat
+                              array, preferred) or polygon
         oil_type (str): Type of oil spilled
         volume (float): Volume of oil spilled in barrels
         output_file (str): Path to save the HTML map file
+        heatmap (bool): Whether to add the heat map layer over the outline
+        controls (bool): Whether to add the scale bar, fullscreen button and
+            layer control
         
     Returns:
         str: Path to the saved map file
     """
+    # Spill outline as a closed ring of (lon, lat) points. The raw
+    # coordinates are used directly so the polygon never goes through GEOS
+    coords = affected_area.get('coords')
+    if coords is not None:
+        coords = np.vstack([coords, coords[:1]])
+    elif affected_area.get('polygon'):
+        coords = _exterior_coords(affected_area['polygon'])
+    
     # Determine map bounds based on the affected area
-    if affected_area.get('polygon'):
+    if coords is not None:
         # Calculate the appropriate zoom based on the affected area
         area_km2 = affected_area.get('area_km2', 10)
         radius_km = max(5, np.sqrt(area_km2 / np.pi) * 3)  # 3x the radius for good visibility
-        bounds = affected_area.get('polygon').bounds
+        bounds = affected_area.get('bounds')
+        if bounds is None:
+            bounds = (*coords.min(axis=0), *coords.max(axis=0))
         min_lon, min_lat, max_lon, max_lat = bounds
     else:
         # If no polygon is available, use a default radius
@@ -51,22 +210,14 @@ def create_map(latitude, longitude, affected_area, oil_type, volume, output_file
     m = folium.Map(
         location=[latitude, longitude],
         zoom_start=8,
-        tiles='CartoDB positron'  # Clean, light background
+        tiles=_TILES  # Clean, light background (CartoDB positron)
     )
     
     # Add a marker for the spill origin
-    folium.Marker(
-        location=[latitude, longitude],
-        popup=f"<strong>Oil Spill Origin</strong><br>"
-              f"Volume: {volume:,.0f} barrels<br>"
-              f"Oil Type: {oil_type}<br>"
-              f"Date: {datetime.now().strftime('%Y-%m-%d')}<br>"
-              f"Coordinates: {latitude:.4f}, {longitude:.4f}",
-        icon=folium.Icon(color='red', icon='exclamation-circle', prefix='fa')
-    ).add_to(m)
+    _add_origin_marker(m, latitude, longitude, oil_type, volume)
     
     # Add the affected area polygon
-    if affected_area.get('polygon'):
+    if coords is not None:
         # Get color based on oil type or thickness
         if 'color' in affected_area:
             fill_color = affected_area['color']
@@ -74,37 +225,21 @@ def create_map(latitude, longitude, affected_area, oil_type, volume, output_file
             # Default oil spill color scheme - darker for thicker areas
             fill_color = '#782D2D'  # Dark reddish brown
         
-        # Convert shapely polygon to GeoJSON
-        polygon_geojson = mapping(affected_area['polygon'])
-        
         # Add the polygon to the map
-        folium.GeoJson(
-            polygon_geojson,
-            name="Oil Spill Extent",
-            style_function=lambda x: {
-                'fillColor': fill_color,
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.5
-            },
-            tooltip=f"Affected Area: {affected_area['area_km2']:.2f} km²"
-        ).add_to(m)
+        extent = folium.FeatureGroup(name="Oil Spill Extent")
+        _spill_polygon(coords, fill_color, affected_area['area_km2']).add_to(extent)
+        extent.add_to(m)
         
         # Add a gradient effect for more realistic visualization
         # Create points within the polygon with varying opacity based on distance from center
-        if affected_area.get('center'):
-            # Extract coordinates from polygon for heat map
-            polygon = affected_area['polygon']
-            x, y = polygon.exterior.coords.xy
-            
-            # Create heat map points with weights
-            heat_data = []
-            for i in range(len(x)):
-                # Skip some points to reduce density
-                if i % 3 == 0:
-                    # Weight decreases toward the edge
-                    weight = 1.0 - (i / len(x))
-                    heat_data.append([y[i], x[i], weight])
+        if heatmap and affected_area.get('center'):
+            # Heat map points sampled inside the outline, weighted by
+            # distance from the spill origin
+            polygon = affected_area.get('polygon')
+            if polygon is None:
+                from shapely.geometry.polygon import Polygon
+                polygon = Polygon(coords)
+            heat_data = _interior_heat_points(polygon, bounds, affected_area['center'])
             
             # Add heat map
             HeatMap(
@@ -115,31 +250,21 @@ def create_map(latitude, longitude, affected_area, oil_type, volume, output_file
                 gradient={0.4: '#FFF5B8', 0.65: '#E8A238', 0.8: '#8E4E27', 1: '#782D2D'}
             ).add_to(m)
     
-    # Add scale bar
-    folium.plugins.MeasureControl(position='bottomleft', primary_length_unit='kilometers').add_to(m)
-    
-    # Add fullscreen button
-    folium.plugins.Fullscreen().add_to(m)
-    
-    # Add layer control
-    folium.LayerControl().add_to(m)
+    if controls:
+        # Add scale bar
+        MeasureControl(position='bottomleft', primary_length_unit='kilometers').add_to(m)
+        
+        # Add fullscreen button
+        Fullscreen().add_to(m)
+        
+        # Add layer control
+        folium.LayerControl().add_to(m)
     
     # Fit the map to the bounds
     m.fit_bounds([[min_lat, min_lon], [max_lat, max_lon]])
     
     # Add title and information
-    title_html = f'''
-        <div style="position: fixed; 
-                    top: 10px; left: 50px; width: 300px; height: 90px; 
-                    background-color: white; border-radius: 5px; 
-                    border: 2px solid grey; z-index: 9999; padding: 10px; 
-                    font-size: 14px; font-family: Arial;">
-            <b style="font-size: 16px;">Oil Spill Impact Estimation</b><br>
-            Volume: {volume:,.0f} barrels<br>
-            Affected Area: {affected_area['area_km2']:.2f} km²<br>
-            Oil Type: {oil_type}
-        </div>
-    '''
+    title_html = _title_html(volume, affected_area['area_km2'], oil_type)
     m.get_root().html.add_child(folium.Element(title_html))
     
     # Save the map to file
@@ -163,13 +288,15 @@ def display_map(map_file):
     webbrowser.open('file://' + map_path)
 
 
-def generate_impact_charts(impact_data, output_dir=None):
+def generate_impact_charts(impact_data, output_dir=None, dpi=100):
     """
     Generate charts visualizing the environmental impact of the oil spill.
     
     Args:
         impact_data (dict): Dictionary containing impact metrics
         output_dir (str): Directory to save chart images (None for temp dir)
+        dpi (int): Resolution of the saved images (default: 100, for screen
+            and HTML reports; use 300 for print)
         
     Returns:
         dict: Paths to the generated chart images
@@ -181,9 +308,6 @@ def generate_impact_charts(impact_data, output_dir=None):
         # Ensure directory exists
         os.makedirs(output_dir, exist_ok=True)
     
-    # Set Seaborn style
-    sns.set(style="whitegrid")
-    
     chart_files = {}
     
     # 1. Oil Distribution Chart (Pie Chart)
@@ -201,7 +325,7 @@ def generate_impact_charts(impact_data, output_dir=None):
         
         # Save chart
         oil_dist_file = os.path.join(output_dir, 'oil_distribution.png')
-        plt.savefig(oil_dist_file, dpi=300, bbox_inches='tight')
+        plt.savefig(oil_dist_file, dpi=dpi, bbox_inches='tight')
         plt.close()
         chart_files['oil_distribution'] = oil_dist_file
     
@@ -236,7 +360,7 @@ def generate_impact_charts(impact_data, output_dir=None):
         
         # Save chart
         impact_file = os.path.join(output_dir, 'environmental_impact.png')
-        plt.savefig(impact_file, dpi=300, bbox_inches='tight')
+        plt.savefig(impact_file, dpi=dpi, bbox_inches='tight')
         plt.close()
         chart_files['environmental_impact'] = impact_file
     
@@ -246,13 +370,16 @@ def generate_impact_charts(impact_data, output_dir=None):
         
         # Create timeline data
         days = np.arange(0, int(impact_data['cleanup_time_days']) + 1)
-        cleanup_progress = 100 * (1 - np.exp(-3 * days / impact_data['cleanup_time_days']))
+        
+        # Both curves are powers of exp(-t / T), so one exponential serves both
+        decay = np.exp(-days / impact_data['cleanup_time_days'])
+        cleanup_progress = 100 * (1 - decay ** 3)
         
         # Oil persistence (decreasing over time)
         if 'oil_fractions' in impact_data:
-            surface_oil = 100 * impact_data['oil_fractions']['surface'] * np.exp(-4 * days / impact_data['cleanup_time_days'])
+            surface_oil = 100 * impact_data['oil_fractions']['surface'] * decay ** 4
         else:
-            surface_oil = 100 * np.exp(-4 * days / impact_data['cleanup_time_days'])
+            surface_oil = 100 * decay ** 4
         
         # Plot the data
         plt.plot(days, cleanup_progress, 'b-', linewidth=2, label='Cleanup Progress (%)')
@@ -273,14 +400,14 @@ def generate_impact_charts(impact_data, output_dir=None):
         
         # Save chart
         timeline_file = os.path.join(output_dir, 'cleanup_timeline.png')
-        plt.savefig(timeline_file, dpi=300, bbox_inches='tight')
+        plt.savefig(timeline_file, dpi=dpi, bbox_inches='tight')
         plt.close()
         chart_files['cleanup_timeline'] = timeline_file
     
     return chart_files
 
 
-def generate_comparison_chart(baseline_impact, scenarios, output_file=None):
+def generate_comparison_chart(baseline_impact, scenarios, output_file=None, dpi=100):
     """
     Generate a chart comparing different oil spill scenarios.
     
@@ -288,6 +415,8 @@ def generate_comparison_chart(baseline_impact, scenarios, output_file=None):
         baseline_impact (dict): Impact data for the baseline scenario
         scenarios (list): List of dicts with scenario impact data
         output_file (str): Path to save the chart image
+        dpi (int): Resolution of the saved image (default: 100, for screen
+            and HTML reports; use 300 for print)
         
     Returns:
         str: Path to the generated chart image
@@ -301,9 +430,6 @@ def generate_comparison_chart(baseline_impact, scenarios, output_file=None):
         temp_dir = tempfile.mkdtemp()
         output_file = os.path.join(temp_dir, 'scenario_comparison.png')
     
-    # Set style
-    sns.set(style="whitegrid")
-    
     # Setup the figure
     fig, axes = plt.subplots(1, 3, figsize=(15, 6))
     
@@ -334,7 +460,7 @@ def generate_comparison_chart(baseline_impact, scenarios, output_file=None):
         axes[i].tick_params(axis='x', rotation=45)
     
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=dpi, bbox_inches='tight')
     plt.close()
     
     return output_file
@@ -344,6 +470,10 @@ def create_animation_frames(dispersal_model, lat, lon, time_steps, output_dir):
     """
     Create a series of map images showing the progression of the oil spill over time.
     
+    Only the outline, title and view change between frames, so the base
+    map (tiles and origin marker) is rendered through folium once; each
+    frame renders just its own outline polygon and fitted bounds into it.
+    
     Args:
         dispersal_model (OilDispersalModel): The dispersal model
         lat (float): Latitude of the spill
@@ -359,6 +489,28 @@ def create_animation_frames(dispersal_model, lat, lon, time_steps, output_dir):
     
     frame_files = []
     
+    # Labels shared by every frame
+    oil_type = dispersal_model.oil_properties.get('name', 'Unknown')
+    volume = dispersal_model.volume_m3 / 0.159  # Convert back to barrels
+    
+    # Render the base map once, with placeholders for what each frame
+    # adds: the title box in the page body and, as the map's last child,
+    # the frame's layers after the map's own script
+    m = folium.Map(
+        location=[lat, lon],
+        zoom_start=8,
+        tiles=_TILES  # Clean, light background (CartoDB positron)
+    )
+    _add_origin_marker(m, lat, lon, oil_type, volume)
+    script_slot = MacroElement()
+    script_slot._template = Template(
+        '{% macro script(this, kwargs) %}' + _FRAME_SCRIPT_SLOT + '{% endmacro %}'
+    )
+    script_slot.add_to(m)
+    figure = m.get_root()
+    figure.html.add_child(folium.Element(_FRAME_TITLE_SLOT))
+    page = figure.render()
+    
     # Create a frame for each time step
     for i, hours in enumerate(time_steps):
         # Update model time
@@ -367,17 +519,117 @@ def create_animation_frames(dispersal_model, lat, lon, time_steps, output_dir):
         # Calculate affected area
         affected_area = dispersal_model.calculate_affected_area(lat, lon)
         
-        # Create the map
+        # Outline and view of this frame, rendered by folium
+        coords = affected_area.coords
+        polygon = _spill_polygon(
+            np.vstack([coords, coords[:1]]),
+            affected_area.get('color', '#782D2D'),
+            affected_area.area_km2
+        ).add_to(m)
+        min_lon, min_lat, max_lon, max_lat = affected_area.bounds
+        bounds = folium.FitBounds([[min_lat, min_lon], [max_lat, max_lon]]).add_to(m)
+        
+        frame_html = page.replace(
+            _FRAME_TITLE_SLOT, _title_html(volume, affected_area.area_km2, oil_type)
+        ).replace(_FRAME_SCRIPT_SLOT, _render_scripts(polygon, bounds))
+        
+        # Write the frame
         frame_file = os.path.join(output_dir, f'frame_{i:03d}.html')
-        create_map(
-            latitude=lat,
-            longitude=lon,
-            affected_area=affected_area,
-            oil_type=dispersal_model.oil_properties.get('name', 'Unknown'),
-            volume=dispersal_model.volume_m3 / 0.159,  # Convert back to barrels
-            output_file=frame_file
-        )
+        with open(frame_file, 'w', encoding='utf-8') as f:
+            f.write(frame_html)
         
         frame_files.append(frame_file)
     
-    return frame_files
\ No newline at end of file
+    return frame_files
+
+
+def create_animation_timeslider(dispersal_model, lat, lon, time_steps,
+                                output_file='spill_animation.html', start_time=None):
+    """
+    Create a single map with a time slider showing the progression of the oil spill.
+    
+    All time steps go into one GeoJSON FeatureCollection played back by
+    folium's TimestampedGeoJson layer, instead of one HTML file per frame
+    as written by create_animation_frames.
+    
+    Args:
+        dispersal_model (OilDispersalModel): The dispersal model
+        lat (float): Latitude of the spill
+        lon (float): Longitude of the spill
+        time_steps (list): List of time points in hours
+        output_file (str): Path to save the HTML map file
+        start_time (datetime): Time of the spill (default: the current hour)
+        
+    Returns:
+        str: Path to the saved map file
+    """
+    if start_time is None:
+        start_time = datetime.now().replace(minute=0, second=0, microsecond=0)
+    
+    oil_type = dispersal_model.oil_properties.get('name', 'Unknown')
+    volume = dispersal_model.volume_m3 / 0.159  # Convert back to barrels
+    
+    # One polygon feature per time step; the bounds cover all of them
+    features = []
+    min_lon, min_lat, max_lon, max_lat = lon, lat, lon, lat
+    for hours in time_steps:
+        dispersal_model.time_hours = hours
+        affected_area = dispersal_model.calculate_affected_area(lat, lon)
+        
+        # Closed ring of (lon, lat) points, as GeoJSON expects
+        coords = affected_area.coords
+        ring = np.round(np.vstack([coords, coords[:1]]), _COORD_DECIMALS).tolist()
+        
+        area_min_lon, area_min_lat, area_max_lon, area_max_lat = affected_area.bounds
+        min_lon, min_lat = min(min_lon, area_min_lon), min(min_lat, area_min_lat)
+        max_lon, max_lat = max(max_lon, area_max_lon), max(max_lat, area_max_lat)
+        
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Polygon', 'coordinates': [ring]},
+            'properties': {
+                'times': [(start_time + timedelta(hours=hours)).isoformat()],
+                'popup': f"{hours:g} h: {affected_area.area_km2:.2f} km²",
+                'style': {
+                    'color': '#000000',
+                    'weight': 1,
+                    'fillColor': '#782D2D',
+                    'fillOpacity': 0.3
+                }
+            }
+        })
+    
+    # Create a map centered on the spill location
+    m = folium.Map(
+        location=[lat, lon],
+        zoom_start=8,
+        tiles=_TILES  # Clean, light background (CartoDB positron)
+    )
+    
+    # Add a marker for the spill origin
+    folium.Marker(
+        location=[lat, lon],
+        popup=f"<strong>Oil Spill Origin</strong><br>"
+              f"Volume: {volume:,.0f} barrels<br>"
+              f"Oil Type: {oil_type}<br>"
+              f"Coordinates: {lat:.4f}, {lon:.4f}",
+        icon=folium.Icon(color='red', icon='exclamation-circle', prefix='fa')
+    ).add_to(m)
+    
+    # Add the time-stamped spill outlines
+    TimestampedGeoJson(
+        {'type': 'FeatureCollection', 'features': features},
+        period='PT1H',
+        transition_time=200,
+        add_last_point=False,
+        date_options='YYYY-MM-DD HH:mm'
+    ).add_to(m)
+    
+    # Fit the map to the bounds
+    m.fit_bounds([[min_lat, min_lon], [max_lat, max_lon]])
+    
+    # Save the map to file
+    output_path = Path(output_file)
+    m.save(str(output_path))
+    
+    return str(output_path)